@@ -0,0 +1,93 @@
+"""Streaming DOCX reader against the python-docx document model.
+
+Writes a synthetic DOCX (headings, paragraphs and a table per page) and reads
+it with the previous python-docx implementation of ``read_docx`` and with
+``DirectoryManager.read_docx_in_pieces``. Reports wall time, time to the first
+piece and the peak Python heap allocated by each reader (``tracemalloc``; the
+lxml tree behind python-docx lives outside it, so that figure is a lower bound).
+
+Usage::
+
+    python -m core.benchmarks.bench_docx_extraction --pages 500
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+from typing import Awaitable, Callable, List, Tuple
+
+from docx import Document
+
+from core.benchmarks.common import write_docx
+from core.brevio.managers.directory_manager import DirectoryManager
+
+
+async def _read_with_python_docx(path: str) -> Tuple[str, float]:
+    # The reader replaced by read_docx_in_pieces: full DOM, paragraphs only.
+    start = time.perf_counter()
+    doc = await asyncio.to_thread(Document, path)
+    paragraphs = [para.text for para in doc.paragraphs if para.text.strip()]
+    return "\n".join(paragraphs), time.perf_counter() - start
+
+
+async def _read_streaming(path: str) -> Tuple[str, float]:
+    start = time.perf_counter()
+    first = 0.0
+    pieces: List[str] = []
+    async for piece in DirectoryManager().read_docx_in_pieces(path):
+        if not pieces:
+            first = time.perf_counter() - start
+        pieces.append(piece)
+    return "\n".join(pieces), first
+
+
+async def _measure(
+    reader: Callable[[str], Awaitable[Tuple[str, float]]], path: str, runs: int
+) -> Tuple[float, float, int, str]:
+    timings, firsts = [], []
+    text = ""
+    for _ in range(runs):
+        start = time.perf_counter()
+        text, first = await reader(path)
+        timings.append(time.perf_counter() - start)
+        firsts.append(first)
+    tracemalloc.start()
+    await reader(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), statistics.median(firsts), peak, text
+
+
+async def _bench(pages: int, runs: int) -> None:
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "synthetic.docx")
+        write_docx(path, pages)
+        print(f"{pages} pages, {os.path.getsize(path) / 1e6:.1f} MB")
+
+        for name, reader in (
+            ("python-docx", _read_with_python_docx),
+            ("iterparse", _read_streaming),
+        ):
+            median, first, peak, text = await _measure(reader, path, runs)
+            table_rows = sum(1 for line in text.splitlines() if " | " in line)
+            print(
+                f"{name:<12} median={median:6.2f} s first_piece={first:6.3f} s "
+                f"peak_heap={peak / 1e6:7.1f} MB chars={len(text)} "
+                f"table_rows={table_rows}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(_bench(args.pages, args.runs))
+
+
+if __name__ == "__main__":
+    main()
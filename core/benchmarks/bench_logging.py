@@ -0,0 +1,112 @@
+"""Measure the cost of diagnostics on the chunking/summary hot path.
+
+Runs a synthetic 100-chunk document through ``SummaryService.chunk_text`` and
+``SummaryService.process_chunks_in_groups`` with the OpenAI call replaced by an
+instant fake, once with the root logger at INFO and once at DEBUG, and compares
+it with the previous eager pattern (f-string formatting plus a re-encode per
+chunk) to show what is left of the logging overhead.
+
+Usage::
+
+    python -m core.benchmarks.bench_logging [--chunks 100] [--runs 5]
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from typing import Tuple
+from unittest.mock import patch
+
+from core.benchmarks.common import WordEncoder, build_document
+from core.brevio.enums.language import LanguageType
+from core.brevio.services.summary_service import SummaryService
+from core.shared.enums.model import ModelType
+
+_ENCODER = WordEncoder()
+
+
+async def _fake_generate(
+    index: int,
+    chunk: str,
+    prompt: str,
+    accumulated_summary: str,
+    model: ModelType,
+    language: LanguageType,
+    retries: int = 0,
+) -> Tuple[int, str, int]:
+    return index, chunk[:200], 50
+
+
+async def _legacy_generate(
+    index: int,
+    chunk: str,
+    prompt: str,
+    accumulated_summary: str,
+    model: ModelType,
+    language: LanguageType,
+    retries: int = 0,
+) -> Tuple[int, str, int]:
+    # Pre-change behaviour: eager f-strings and a re-encode of input and output
+    # for every chunk, regardless of the effective log level.
+    logger = logging.getLogger("core.brevio.services.summary_service")
+    chunk_tokens = len(_ENCODER.encode(chunk))
+    logger.info(f"Processing chunk {index}: {chunk_tokens} tokens")
+    summary = chunk[:200]
+    output_tokens = len(_ENCODER.encode(summary))
+    logger.debug(
+        f"Chunk {index} processed: {summary[:50]}..., input={chunk_tokens}, "
+        f"output={output_tokens}, accumulated={len(_ENCODER.encode(accumulated_summary))}"
+    )
+    return index, summary, 50
+
+
+async def _run_once(service: SummaryService, text: str, chunk_size: int) -> float:
+    start = time.perf_counter()
+    chunks = await service.chunk_text(
+        text, chunk_size, service._percent_chunk_overlap, ModelType.GPT_4O_MINI
+    )
+    await service.process_chunks_in_groups(
+        chunks, "prompt", ModelType.GPT_4O_MINI, LanguageType.SPANISH
+    )
+    return time.perf_counter() - start
+
+
+async def _bench(chunks: int, runs: int, chunk_size: int) -> None:
+    text = build_document(chunks * chunk_size)
+    root = logging.getLogger()
+    scenarios = [
+        ("legacy eager logging @INFO", logging.INFO, _legacy_generate),
+        ("guarded logging @INFO", logging.INFO, _fake_generate),
+        ("guarded logging @DEBUG", logging.DEBUG, _fake_generate),
+    ]
+
+    with patch(
+        "core.brevio.services.summary_service.get_encoder", return_value=_ENCODER
+    ):
+        service = SummaryService()
+        for label, level, generate in scenarios:
+            root.setLevel(level)
+            service.generate_summary_chunk = generate  # type: ignore[method-assign]
+            timings = [await _run_once(service, text, chunk_size) for _ in range(runs)]
+            print(
+                f"{label:<28} median={statistics.median(timings) * 1000:8.2f} ms "
+                f"min={min(timings) * 1000:8.2f} ms"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=100)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--chunk-size", type=int, default=2000)
+    args = parser.parse_args()
+
+    # Discard output: the benchmark measures the cost of producing records.
+    logging.basicConfig(handlers=[logging.NullHandler()], force=True)
+    asyncio.run(_bench(args.chunks, args.runs, args.chunk_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Scaling curve of PDF text extraction across worker processes.
+
+Writes a synthetic text PDF and reads it with
+``DirectoryManager.read_pdf_in_pieces`` for each worker count; ``1`` is the
+single-thread mode, larger values use the process pool. Each configuration is
+warmed up once (pool start-up) before timing, and the output is checked to be
+identical across modes.
+
+Usage::
+
+    python -m core.benchmarks.bench_pdf_extraction --pages 1000 --workers 1,2,4,8
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from typing import List, Tuple
+
+from core.benchmarks.common import write_text_pdf
+from core.brevio.managers import directory_manager
+from core.brevio.managers.directory_manager import DirectoryManager
+from core.shared.utils.process_pool_utils import available_cpus
+
+
+async def _read_all(manager: DirectoryManager, path: str, workers: int) -> List[str]:
+    return [page async for page in manager.read_pdf_in_pieces(path, workers=workers)]
+
+
+async def _time_reads(
+    manager: DirectoryManager, path: str, workers: int, runs: int
+) -> Tuple[List[float], List[str]]:
+    pages = await _read_all(manager, path, workers)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await _read_all(manager, path, workers)
+        timings.append(time.perf_counter() - start)
+    return timings, pages
+
+
+async def _bench(pages: int, worker_counts: List[int], runs: int) -> None:
+    # Benchmark every size with the pool, whatever the deployment threshold.
+    directory_manager.PDF_PROCESS_MIN_PAGES = 1
+    manager = DirectoryManager()
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "synthetic.pdf")
+        write_text_pdf(path, pages)
+        print(
+            f"{pages} pages, {os.path.getsize(path) / 1e6:.1f} MB, "
+            f"{available_cpus()} cores available"
+        )
+
+        baseline = None
+        reference: List[str] = []
+        for workers in worker_counts:
+            timings, extracted = await _time_reads(manager, path, workers, runs)
+            median = statistics.median(timings)
+            if baseline is None:
+                baseline, reference = median, extracted
+            assert extracted == reference, f"output differs with {workers} workers"
+            print(
+                f"workers={workers:<3} median={median:7.2f} s "
+                f"pages/s={pages / median:8.1f} speedup={baseline / median:5.2f}x"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument(
+        "--workers",
+        default=None,
+        help="Comma separated worker counts (default: powers of two up to cores)",
+    )
+    args = parser.parse_args()
+
+    if args.workers:
+        worker_counts = [int(value) for value in args.workers.split(",")]
+    else:
+        worker_counts = [1]
+        while worker_counts[-1] * 2 <= available_cpus():
+            worker_counts.append(worker_counts[-1] * 2)
+    asyncio.run(_bench(args.pages, worker_counts, args.runs))
+
+
+if __name__ == "__main__":
+    main()
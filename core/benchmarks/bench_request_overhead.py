@@ -0,0 +1,93 @@
+"""Per-request overhead of the catalog endpoints with app-scoped services.
+
+Calls the ``/brevio`` catalog endpoints (languages, models, output formats,
+summary levels, categories and styles) through a ``TestClient``, once with the
+services shared through ``app.state`` and once building a ``BrevioService``
+per request as the dependency used to, and prints the latency percentiles of
+each mode. MongoDB is not contacted: the catalog does not touch the database
+and the Motor client connects lazily.
+
+Usage::
+
+    python -m core.benchmarks.bench_request_overhead [--requests 200]
+"""
+
+import argparse
+import os
+import statistics
+import time
+from typing import Dict, List
+
+os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from core.benchmarks.common import percentile  # noqa: E402
+from core.brevio_api.__main__ import app  # noqa: E402
+from core.brevio_api.config.dotenv import API_KEY  # noqa: E402
+from core.brevio_api.dependencies.api_key_dependency import (  # noqa: E402
+    verify_api_key,
+)
+from core.brevio_api.dependencies.brevio_service_dependency import (  # noqa: E402
+    get_brevio_service,
+)
+from core.brevio_api.services.brevio_service import BrevioService  # noqa: E402
+
+ENDPOINTS = [
+    "/brevio/languages",
+    "/brevio/models",
+    "/brevio/output-formats",
+    "/brevio/summary-levels",
+    "/brevio/categories-styles",
+]
+
+
+def _time_requests(client: TestClient, requests: int) -> Dict[str, List[float]]:
+    timings: Dict[str, List[float]] = {endpoint: [] for endpoint in ENDPOINTS}
+    for endpoint in ENDPOINTS:
+        # Warm-up: builds the app-scoped services on first use.
+        assert client.get(endpoint).status_code == 200, endpoint
+        for _ in range(requests):
+            start = time.perf_counter()
+            client.get(endpoint)
+            timings[endpoint].append(time.perf_counter() - start)
+    return timings
+
+
+def _report(mode: str, timings: Dict[str, List[float]]) -> float:
+    print(mode)
+    medians = []
+    for endpoint, values in timings.items():
+        median = statistics.median(values)
+        medians.append(median)
+        print(
+            f"  {endpoint:<28} p50={median * 1e3:8.2f} ms "
+            f"p95={percentile(values, 95) * 1e3:8.2f} ms"
+        )
+    return statistics.median(medians)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    app.dependency_overrides[verify_api_key] = lambda: API_KEY
+    client = TestClient(app)
+
+    shared = _report("app-scoped services", _time_requests(client, args.requests))
+
+    # Previous wiring: a new BrevioService (Motor client, Main, tokenizer...)
+    # for every request.
+    app.dependency_overrides[get_brevio_service] = lambda: BrevioService()
+    per_request = _report(
+        "BrevioService per request",
+        _time_requests(client, max(1, args.requests // 10)),
+    )
+    app.dependency_overrides.clear()
+
+    print(f"median per-request overhead saved: {(per_request - shared) * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
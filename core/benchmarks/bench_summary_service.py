@@ -0,0 +1,176 @@
+"""End-to-end throughput benchmark for ``SummaryService``.
+
+Starts the local mock OpenAI server (``core.benchmarks.mock_openai_server``)
+in-process, points ``OPENAI_API_URL`` / ``DEEPSEEK_API_URL`` at it and runs a
+batch of synthetic transcription jobs through
+``SummaryService._process_single_transcription`` (chunking, grouped chunk
+summaries, postprocessing and DOCX output). Reports chunks/s, tokens/s, p50/p95
+job latency, client-side limiter wait and the 429s/timeouts seen by the server.
+
+Usage::
+
+    python -m core.benchmarks.bench_summary_service --jobs 8 --concurrency 4 \\
+        --words 20000 --latency-ms 300 --rate-limit-probability 0.05
+
+``--word-encoder`` swaps tiktoken for a whitespace tokenizer so the benchmark
+also runs on machines without access to the BPE files.
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import tempfile
+import time
+from typing import Any, List, Tuple
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import uvicorn
+
+from core.benchmarks.common import WordEncoder, build_document, percentile
+from core.benchmarks.mock_openai_server import (
+    add_config_arguments,
+    config_from_args,
+    create_app,
+)
+from core.brevio.enums.language import LanguageType
+from core.brevio.enums.output_format_type import OutputFormatType
+from core.brevio.enums.summary_level import SummaryLevel
+from core.brevio.models.file_config_model import FileConfig
+from core.brevio.models.prompt_config_model import PromptConfig
+from core.brevio.services.summary_service import SummaryService
+from core.shared.enums.model import ModelType
+from core.shared.models.user.data_result import DataResult
+from core.shared.utils.logging_utils import configure_logging
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+async def _run_job(
+    prompt_config: PromptConfig, transcription_path: str, summary_path: str
+) -> Tuple[float, float, bool]:
+    service = SummaryService()
+    start = time.perf_counter()
+    result = await service._process_single_transcription(
+        prompt_config,
+        FileConfig(transcription_path=transcription_path, summary_path=summary_path),
+        DataResult(name="Benchmark"),
+    )
+    await service.api_service.shutdown()
+    return time.perf_counter() - start, service.limiter_wait_seconds, result.success
+
+
+async def _bench(args: argparse.Namespace) -> None:
+    prompt_config = PromptConfig(
+        model=ModelType(args.model),
+        category="education",
+        style="quick_ref",
+        format=OutputFormatType.MARKDOWN,
+        language=LanguageType.SPANISH,
+        summary_level=SummaryLevel.MODERATE,
+    )
+
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = uvicorn.Server(
+        uvicorn.Config(
+            create_app(config_from_args(args)),
+            host="127.0.0.1",
+            port=port,
+            log_level="warning",
+        )
+    )
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    os.environ["OPENAI_API_URL"] = f"{base_url}/v1"
+    os.environ["DEEPSEEK_API_URL"] = base_url
+    os.environ.setdefault("OPENAI_API_KEY", "bench")
+    os.environ.setdefault("DEEPSEEK_API_KEY", "bench")
+
+    # Language detection (googletrans) and the JSON history log are not part of
+    # what is measured and would reach the network / the repository tree.
+    patches: List[Any] = [
+        patch.object(
+            SummaryService,
+            "detect_language_with_retry_safe",
+            AsyncMock(return_value="es"),
+        ),
+        patch("core.brevio.services.summary_service.save_log_to_json", AsyncMock()),
+    ]
+    if args.word_encoder:
+        patches.append(
+            patch(
+                "core.brevio.services.summary_service.get_encoder",
+                return_value=WordEncoder(),
+            )
+        )
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def bounded(index: int, workdir: str) -> Tuple[float, float, bool]:
+        transcription_path = os.path.join(workdir, f"job_{index}.txt")
+        with open(transcription_path, "w", encoding="utf-8") as f:
+            f.write(build_document(args.words))
+        async with semaphore:
+            return await _run_job(
+                prompt_config,
+                transcription_path,
+                os.path.join(workdir, f"summary_{index}.md"),
+            )
+
+    try:
+        for active in patches:
+            active.start()
+        with tempfile.TemporaryDirectory() as workdir:
+            start = time.perf_counter()
+            results = await asyncio.gather(
+                *(bounded(index, workdir) for index in range(args.jobs))
+            )
+            elapsed = time.perf_counter() - start
+        async with httpx.AsyncClient() as client:
+            stats = (await client.get(f"{base_url}/stats")).json()
+    finally:
+        for active in reversed(patches):
+            active.stop()
+        server.should_exit = True
+        await server_task
+
+    latencies = [latency for latency, _, _ in results]
+    limiter_wait = sum(wait for _, wait, _ in results)
+    succeeded = sum(1 for _, _, success in results if success)
+
+    print(f"jobs                {succeeded}/{args.jobs} succeeded in {elapsed:.2f} s")
+    print(f"chunks/s            {stats['completions'] / elapsed:.2f}")
+    print(f"tokens/s            {stats['total_tokens'] / elapsed:.0f}")
+    print(f"job latency p50     {percentile(latencies, 50):.2f} s")
+    print(f"job latency p95     {percentile(latencies, 95):.2f} s")
+    print(f"limiter wait        {limiter_wait:.2f} s (sum over jobs)")
+    print(f"429 responses       {stats['rate_limited']}")
+    print(f"server timeouts     {stats['timeouts']}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=8)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--words", type=int, default=20000)
+    parser.add_argument(
+        "--model",
+        default=ModelType.GPT_4O_MINI.value,
+        choices=[model.value for model in ModelType],
+    )
+    parser.add_argument("--word-encoder", action="store_true")
+    add_config_arguments(parser)
+    configure_logging(os.getenv("LOG_LEVEL", "WARNING"))
+    asyncio.run(_bench(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
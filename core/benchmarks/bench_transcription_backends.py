@@ -0,0 +1,101 @@
+"""Real-time factor and memory of the transcription backends on the same audio.
+
+Each backend runs in its own freshly spawned process, so the peak RSS it
+reports is not shared with the other backend. The audio is decoded to 16 kHz
+mono once per process before timing, so the real-time factor (transcription
+time / audio duration, lower is better) only covers inference.
+
+Usage::
+
+    python -m core.benchmarks.bench_transcription_backends audio1.mp3 audio2.wav \\
+        --model small --backends whisper faster-whisper
+"""
+
+import argparse
+import multiprocessing
+import resource
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+
+from core.brevio.managers.transcription_backends import get_transcription_backend
+from core.shared.utils.audio_segment_utils import SAMPLE_RATE
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _run_backend(
+    backend_name: str, model_size: str, paths: List[str], runs: int
+) -> Dict[str, Any]:
+    import whisper
+
+    audios = [whisper.load_audio(path) for path in paths]
+    baseline = _peak_rss_mb()
+    backend = get_transcription_backend(backend_name)
+
+    start = time.perf_counter()
+    model = backend.load_model(model_size)
+    load_seconds = time.perf_counter() - start
+    after_load = _peak_rss_mb()
+
+    files = []
+    for path, audio in zip(paths, audios):
+        timings = []
+        segments: List[Dict[str, Any]] = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            segments = backend.transcribe(model, audio)
+            timings.append(time.perf_counter() - start)
+        files.append(
+            {
+                "path": path,
+                "duration": len(audio) / SAMPLE_RATE,
+                "seconds": statistics.median(timings),
+                "segments": len(segments),
+                "words": sum(len(s["text"].split()) for s in segments),
+            }
+        )
+    return {
+        "load_seconds": load_seconds,
+        "model_rss_mb": after_load - baseline,
+        "peak_rss_mb": _peak_rss_mb(),
+        "files": files,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("audio", nargs="+")
+    parser.add_argument("--model", default="small")
+    parser.add_argument("--backends", nargs="+", default=["whisper", "faster-whisper"])
+    parser.add_argument("--runs", type=int, default=1)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    for name in args.backends:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            report = pool.submit(
+                _run_backend, name, args.model, args.audio, args.runs
+            ).result()
+        duration = sum(f["duration"] for f in report["files"])
+        seconds = sum(f["seconds"] for f in report["files"])
+        print(
+            f"{name:<15} load={report['load_seconds']:6.2f} s "
+            f"model_rss={report['model_rss_mb']:7.1f} MB "
+            f"peak_rss={report['peak_rss_mb']:7.1f} MB "
+            f"rtf={seconds / duration:6.3f}"
+        )
+        for f in report["files"]:
+            print(
+                f"  {f['path']}: {f['duration']:7.1f} s audio "
+                f"rtf={f['seconds'] / f['duration']:6.3f} "
+                f"segments={f['segments']} words={f['words']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Helpers shared by the benchmark scripts."""
+
+import math
+from typing import List, Sequence
+
+
+class WordEncoder:
+    """Whitespace tokenizer so benchmarks can run without BPE downloads."""
+
+    def encode(self, text: str) -> List[str]:
+        return text.split()
+
+    def decode(self, tokens: List[str]) -> str:
+        return " ".join(tokens)
+
+
+def build_document(words: int) -> str:
+    return " ".join(f"palabra{i % 977}" for i in range(words))
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile, ``pct`` in [0, 100]."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def write_text_pdf(path: str, pages: int, lines_per_page: int = 45) -> None:
+    """Write a plain PDF with ``pages`` pages of Helvetica text (no extra deps)."""
+    objects: List[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",  # page tree, filled in once the page ids are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_ids = []
+    for page in range(pages):
+        lines = [
+            f"({page}-{line} "
+            + " ".join(f"palabra{(page + line + w) % 977}" for w in range(12))
+            + ") '"
+            for line in range(lines_per_page)
+        ]
+        stream = ("BT /F1 9 Tf 40 800 Td 11 TL\n" + "\n".join(lines) + "\nET").encode()
+        objects.append(
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        )
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        page_ids.append(len(objects))
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {pages} >>".encode()
+
+    with open(path, "wb") as f:
+        f.write(b"%PDF-1.4\n")
+        offsets = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(f.tell())
+            f.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+        xref = f.tell()
+        f.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+        for offset in offsets:
+            f.write(b"%010d 00000 n \n" % offset)
+        f.write(
+            b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+            % (len(objects) + 1, xref)
+        )
+
+
+def write_docx(
+    path: str, pages: int, paragraphs_per_page: int = 12, table_rows: int = 6
+) -> None:
+    """Write a DOCX with ``pages`` page-broken sections of headings, text and a table."""
+    from docx import Document
+    from docx.enum.text import WD_BREAK
+
+    document = Document()
+    for page in range(pages):
+        document.add_heading(f"Sección {page}", level=1 + page % 2)
+        for paragraph in range(paragraphs_per_page):
+            document.add_paragraph(
+                f"{page}-{paragraph} "
+                + " ".join(f"palabra{(page + paragraph + w) % 977}" for w in range(40))
+            )
+        table = document.add_table(rows=table_rows, cols=3)
+        for row_index, row in enumerate(table.rows):
+            for column, cell in enumerate(row.cells):
+                cell.text = f"celda {page}.{row_index}.{column}"
+        document.add_paragraph().add_run().add_break(WD_BREAK.PAGE)
+    document.save(path)
@@ -0,0 +1,288 @@
+"""Local OpenAI-compatible stand-in for load and throughput benchmarking.
+
+Serves ``POST /v1/chat/completions`` (and ``/chat/completions`` for DeepSeek
+style base URLs) with synthetic completions, so ``ApiService`` clients can be
+pointed at it through ``OPENAI_API_URL`` / ``DEEPSEEK_API_URL`` without paying
+for real calls. Response time, output throughput, 429 injection and timeouts
+are configurable, and every response reports ``usage`` like the real API.
+
+Usage::
+
+    python -m core.benchmarks.mock_openai_server --port 8089 --latency lognormal
+    OPENAI_API_URL=http://127.0.0.1:8089/v1 OPENAI_API_KEY=bench ...
+
+``GET /stats`` returns request/token counters and ``POST /stats/reset`` clears
+them.
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import time
+import uuid
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Deque, Dict, List, Tuple
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+LATENCY_DISTRIBUTIONS = ("constant", "uniform", "exponential", "lognormal")
+
+
+@dataclass
+class MockServerConfig:
+    latency: str = "lognormal"
+    latency_ms: float = 400.0
+    latency_jitter_ms: float = 150.0
+    tokens_per_second: float = 0.0
+    completion_tokens: int = 300
+    rate_limit_probability: float = 0.0
+    tokens_per_minute: int = 0
+    retry_after_seconds: float = 1.0
+    timeout_probability: float = 0.0
+    timeout_seconds: float = 600.0
+    seed: int = 0
+
+
+@dataclass
+class MockServerStats:
+    requests: int = 0
+    completions: int = 0
+    rate_limited: int = 0
+    timeouts: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough OpenAI-style estimate (~4 characters per token)."""
+    return max(1, math.ceil(len(text) / 4))
+
+
+class MockCompletionBackend:
+    def __init__(self, config: MockServerConfig) -> None:
+        if config.latency not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"Unknown latency distribution {config.latency!r}, "
+                f"expected one of {LATENCY_DISTRIBUTIONS}"
+            )
+        self.config = config
+        self.stats = MockServerStats()
+        self._rng = random.Random(config.seed)
+        self._token_window: Deque[Tuple[float, int]] = deque()
+
+    def reset(self) -> None:
+        self.stats = MockServerStats()
+        self._token_window.clear()
+
+    def sample_latency(self) -> float:
+        mean = self.config.latency_ms / 1000
+        jitter = self.config.latency_jitter_ms / 1000
+        if self.config.latency == "constant" or mean <= 0:
+            return max(0.0, mean)
+        if self.config.latency == "uniform":
+            return max(0.0, self._rng.uniform(mean - jitter, mean + jitter))
+        if self.config.latency == "exponential":
+            return self._rng.expovariate(1 / mean)
+        sigma = math.sqrt(math.log(1 + (jitter / mean) ** 2)) if jitter > 0 else 0.0
+        return self._rng.lognormvariate(math.log(mean) - sigma**2 / 2, sigma)
+
+    def _tokens_in_window(self, now: float) -> int:
+        while self._token_window and now - self._token_window[0][0] >= 60:
+            self._token_window.popleft()
+        return sum(tokens for _, tokens in self._token_window)
+
+    def check_rate_limit(self, tokens: int) -> Dict[str, str]:
+        """Return 429 headers when the request must be rejected, else ``{}``."""
+        now = time.monotonic()
+        used = self._tokens_in_window(now)
+        limit = self.config.tokens_per_minute
+        over_budget = limit > 0 and used + tokens > limit
+        injected = self._rng.random() < self.config.rate_limit_probability
+        if not (over_budget or injected):
+            if limit > 0:
+                self._token_window.append((now, tokens))
+            return {}
+
+        reset = self.config.retry_after_seconds
+        if over_budget and self._token_window:
+            reset = max(reset, 60 - (now - self._token_window[0][0]))
+        return {
+            "retry-after": f"{math.ceil(reset)}",
+            "retry-after-ms": f"{int(reset * 1000)}",
+            "x-ratelimit-limit-tokens": str(limit),
+            "x-ratelimit-remaining-tokens": str(max(0, limit - used)),
+            "x-ratelimit-reset-tokens": f"{reset:.3f}s",
+        }
+
+    def build_completion(
+        self, model: str, prompt_tokens: int, completion_tokens: int
+    ) -> Dict[str, Any]:
+        words = " ".join(
+            f"resumen{self._rng.randrange(1000)}" for _ in range(completion_tokens)
+        )
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": words},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    async def complete(self, payload: Dict[str, Any]) -> JSONResponse:
+        self.stats.requests += 1
+        messages: List[Dict[str, Any]] = payload.get("messages", [])
+        prompt_tokens = sum(
+            estimate_tokens(str(message.get("content", ""))) for message in messages
+        )
+        max_tokens = int(payload.get("max_tokens") or self.config.completion_tokens)
+        completion_tokens = max(1, min(max_tokens, self.config.completion_tokens))
+
+        headers = self.check_rate_limit(prompt_tokens + completion_tokens)
+        if headers:
+            self.stats.rate_limited += 1
+            return JSONResponse(
+                status_code=429,
+                headers=headers,
+                content={
+                    "error": {
+                        "message": "Rate limit reached (mock server)",
+                        "type": "requests",
+                        "code": "rate_limit_exceeded",
+                    }
+                },
+            )
+
+        if self._rng.random() < self.config.timeout_probability:
+            self.stats.timeouts += 1
+            await asyncio.sleep(self.config.timeout_seconds)
+
+        delay = self.sample_latency()
+        if self.config.tokens_per_second > 0:
+            delay += completion_tokens / self.config.tokens_per_second
+        await asyncio.sleep(delay)
+
+        self.stats.completions += 1
+        self.stats.prompt_tokens += prompt_tokens
+        self.stats.completion_tokens += completion_tokens
+        return JSONResponse(
+            self.build_completion(
+                str(payload.get("model", "mock")), prompt_tokens, completion_tokens
+            )
+        )
+
+
+def create_app(config: MockServerConfig) -> FastAPI:
+    backend = MockCompletionBackend(config)
+    app = FastAPI(title="Brevio mock OpenAI server")
+    app.state.backend = backend
+
+    async def chat_completions(request: Request) -> JSONResponse:
+        return await backend.complete(await request.json())
+
+    app.add_api_route("/v1/chat/completions", chat_completions, methods=["POST"])
+    app.add_api_route("/chat/completions", chat_completions, methods=["POST"])
+
+    @app.get("/stats")
+    async def stats() -> Dict[str, Any]:
+        data = asdict(backend.stats)
+        data["total_tokens"] = backend.stats.total_tokens
+        data["elapsed"] = time.monotonic() - data.pop("started_at")
+        return data
+
+    @app.post("/stats/reset")
+    async def reset_stats() -> Dict[str, str]:
+        backend.reset()
+        return {"status": "ok"}
+
+    return app
+
+
+def add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    defaults = MockServerConfig()
+    parser.add_argument(
+        "--latency", choices=LATENCY_DISTRIBUTIONS, default=defaults.latency
+    )
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms)
+    parser.add_argument(
+        "--latency-jitter-ms", type=float, default=defaults.latency_jitter_ms
+    )
+    parser.add_argument(
+        "--tokens-per-second",
+        type=float,
+        default=defaults.tokens_per_second,
+        help="Output token throughput per request, 0 disables it",
+    )
+    parser.add_argument(
+        "--completion-tokens", type=int, default=defaults.completion_tokens
+    )
+    parser.add_argument(
+        "--rate-limit-probability",
+        type=float,
+        default=defaults.rate_limit_probability,
+    )
+    parser.add_argument(
+        "--tokens-per-minute",
+        type=int,
+        default=defaults.tokens_per_minute,
+        help="Server-side TPM budget enforced with 429s, 0 disables it",
+    )
+    parser.add_argument(
+        "--retry-after-seconds", type=float, default=defaults.retry_after_seconds
+    )
+    parser.add_argument(
+        "--timeout-probability", type=float, default=defaults.timeout_probability
+    )
+    parser.add_argument(
+        "--timeout-seconds", type=float, default=defaults.timeout_seconds
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+
+
+def config_from_args(args: argparse.Namespace) -> MockServerConfig:
+    return MockServerConfig(
+        latency=args.latency,
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        tokens_per_second=args.tokens_per_second,
+        completion_tokens=args.completion_tokens,
+        rate_limit_probability=args.rate_limit_probability,
+        tokens_per_minute=args.tokens_per_minute,
+        retry_after_seconds=args.retry_after_seconds,
+        timeout_probability=args.timeout_probability,
+        timeout_seconds=args.timeout_seconds,
+        seed=args.seed,
+    )
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    add_config_arguments(parser)
+    args = parser.parse_args()
+    uvicorn.run(create_app(config_from_args(args)), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
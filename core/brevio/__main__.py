@@ -1,6 +1,15 @@
 import logging
 from collections import defaultdict
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from bson import ObjectId
 from fastapi.exceptions import HTTPException
@@ -40,6 +49,11 @@ class Main:
             )
             raise Exception(f"Unexpected error counting media: {str(e)}")
 
+    def iter_media_durations(
+        self, url: HttpUrl
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        return self._yt_service.iter_media_durations(url)
+
     async def get_media_duration(self, url: HttpUrl) -> Dict[str, Any]:
         try:
             result: Dict[str, Any] = await self._yt_service.get_media_duration(url)
@@ -90,9 +104,9 @@ class Main:
     ):
         try:
             acg = AdvancedPromptGenerator()
-            combinations: List[
-                Tuple[str, str, List[str]]
-            ] = await acg.get_all_category_style_combinations()
+            combinations: List[Tuple[str, str, List[str]]] = (
+                await acg.get_all_category_style_combinations()
+            )
 
             logger.debug(f"Combinations fetched: {combinations}")
 
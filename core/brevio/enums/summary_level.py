@@ -16,3 +16,12 @@ WORD_LIMITS_BY_SUMMARY_LEVEL = {
     SummaryLevel.DETAILED: "400",
     SummaryLevel.VERY_DETAILED: "500",
 }
+
+# Fraction of sentences kept by the extractive pre-reduction stage.
+KEEP_RATIO_BY_SUMMARY_LEVEL = {
+    SummaryLevel.VERY_CONCISE: 0.2,
+    SummaryLevel.CONCISE: 0.3,
+    SummaryLevel.MODERATE: 0.45,
+    SummaryLevel.DETAILED: 0.6,
+    SummaryLevel.VERY_DETAILED: 0.75,
+}
@@ -2,28 +2,125 @@ import asyncio
 import logging
 import os
 import shutil
+import sys
 from os import environ, listdir, path
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, AsyncGenerator, Callable, Dict, Optional
 
-import torch
+import numpy as np
 from pydantic import HttpUrl
 
 from core.brevio.constants.constants import Constants
 from core.brevio.managers.directory_manager import DirectoryManager
+from core.brevio.managers.pipeline_scheduler import (
+    PipelineScheduler,
+    PipelineStage,
+    StageMetrics,
+)
+from core.brevio.managers.transcription_backends import whisper_language_code
+from core.brevio.managers.whisper_model_registry import WHISPER_INFERENCE_WORKERS
 from core.brevio.models.file_config_model import FileConfig
 from core.brevio.models.response_model import SummaryResponse, TranscriptionResponse
+from core.brevio.models.transcription_cache_model import TranscriptionCacheEntry
+from core.brevio.models.transcription_stats_model import TranscriptionStats
 from core.brevio.services.audio_service import AudioService
+from core.brevio.services.media_decode_service import MEDIA_DECODE_MMAP_SECONDS
+from core.brevio.services.media_probe_service import MediaProbeService
 from core.brevio.services.summary_service import SummaryService
+from core.brevio.services.transcription_cache_service import (
+    TranscriptionCacheService,
+)
 from core.brevio.services.transcription_service import TranscriptionService
-from core.brevio.services.yt_service import YTService
+from core.brevio.services.yt_service import YT_DOWNLOAD_CONCURRENCY, YTService
 from core.shared.models.brevio.brevio_generate import BrevioGenerate
 from core.shared.models.user.data_result import DataResult
+from core.shared.utils.audio_segment_utils import SAMPLE_RATE
+from core.shared.utils.process_pool_utils import (
+    available_cpus,
+    available_memory_bytes,
+)
 
 logger = logging.getLogger(__name__)
 
 environ["PYTORCH_CUDA_ALLOC_CONF"] = "expandable_segments:True"
 
+# Feed transcript lines into the summary chunker while the audio is still being
+# transcribed, instead of summarizing once transcription.txt is complete.
+TRANSCRIPTION_STREAMING = (
+    os.getenv("TRANSCRIPTION_STREAMING", "false").lower() == "true"
+)
+
+
+def _decode_concurrency() -> int:
+    # A decoded buffer held in RAM is at most MEDIA_DECODE_MMAP_SECONDS of
+    # float32 samples; longer audio is memory-mapped from disk.
+    buffer_bytes = MEDIA_DECODE_MMAP_SECONDS * SAMPLE_RATE * 4
+    free_bytes = available_memory_bytes()
+    by_memory = int(free_bytes // (2 * buffer_bytes)) if free_bytes else 1
+    return max(1, min(available_cpus(), by_memory))
+
+
+# Per-stage limits of the media pipeline (download → decode → transcribe →
+# summarize → persist), shared by the jobs a process runs at once.
+PIPELINE_DOWNLOAD_CONCURRENCY = int(
+    os.getenv("PIPELINE_DOWNLOAD_CONCURRENCY", YT_DOWNLOAD_CONCURRENCY)
+)
+PIPELINE_DECODE_CONCURRENCY = (
+    int(os.getenv("PIPELINE_DECODE_CONCURRENCY", 0)) or _decode_concurrency()
+)
+PIPELINE_TRANSCRIBE_CONCURRENCY = int(
+    os.getenv("PIPELINE_TRANSCRIBE_CONCURRENCY", WHISPER_INFERENCE_WORKERS)
+)
+PIPELINE_SUMMARY_CONCURRENCY = int(os.getenv("PIPELINE_SUMMARY_CONCURRENCY", 4))
+PIPELINE_PERSIST_CONCURRENCY = int(os.getenv("PIPELINE_PERSIST_CONCURRENCY", 4))
+# Items waiting in front of each stage; decoded audio gets its own, smaller
+# bound since every queued item holds a PCM buffer.
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", 4))
+PIPELINE_DECODED_QUEUE_SIZE = int(os.getenv("PIPELINE_DECODED_QUEUE_SIZE", 1))
+
+
+class _VideoJob:
+    """A video on its way through the ``Generate`` pipeline stages."""
+
+    def __init__(
+        self,
+        index: int,
+        video: Any,
+        data: BrevioGenerate,
+        create_data_result: Callable[[str, str, DataResult], Any],
+        current_folder_entry_id: str,
+        user_folder_id: str,
+        user_id: str,
+    ) -> None:
+        self.index = index
+        self.video = video
+        self.data = data
+        self.create_data_result = create_data_result
+        self.current_folder_entry_id = current_folder_entry_id
+        self.user_id = user_id
+        self.destination_path = f"{Constants.DESTINATION_FOLDER}/{user_folder_id}/{current_folder_entry_id}/{index}"
+        audio_filename = (
+            os.path.basename(video.path)
+            if getattr(video, "path", None)
+            else f"{index}.mp3"
+        )
+        self.audio_path = os.path.join(self.destination_path, audio_filename)
+        self.transcription_path = os.path.join(
+            self.destination_path, Constants.TRANSCRIPTION_FILE
+        )
+        self.summary_path = os.path.join(self.destination_path, Constants.SUMMARY_FILE)
+        self.file_config = FileConfig(
+            transcription_path=self.transcription_path, summary_path=self.summary_path
+        )
+        self.data_result = DataResult(name=f"Video {index}")
+        self.cache_source: Optional[str] = None
+        self.cache_language = "auto"
+        self.cached: Optional[TranscriptionCacheEntry] = None
+        self.audio: Optional[np.ndarray] = None
+        self.transcription_stats = TranscriptionStats()
+        self.summarized = False
+        self.result: Dict[str, str] = {}
+
 
 class UsageCostTracker:
     """Placeholder for usage cost tracker with cost breakdown methods."""
@@ -41,8 +138,11 @@ class Generate:
             self._directory_manager = DirectoryManager()
             self._summary_service = SummaryService()
             self._transcription_service = TranscriptionService()
+            self._transcription_cache = TranscriptionCacheService()
             self._yt_service = YTService()
             self._audio_service = AudioService()
+            self._stages: Optional[PipelineScheduler[_VideoJob]] = None
+            self._media_probe = MediaProbeService.shared()
             logger.info("Generate class initialized successfully")
         except Exception as e:
             logger.error(
@@ -55,99 +155,255 @@ class Generate:
         logger.warning("_process_local_audio_files not implemented")
         raise NotImplementedError("Local audio file processing not implemented")
 
-    async def process_video(
-        self,
-        index: int,
-        video: Any,  # Objeto con `url` o `path`
-        data: BrevioGenerate,
-        _create_data_result: Callable[[str, str, DataResult], Any],
-        current_folder_entry_id: str,
-        _user_folder_id: str,
-        _user_id: str,
-    ) -> Dict[str, str]:
-        try:
-            data_result = DataResult(name=f"Video {index}")
-            destination_path = f"{Constants.DESTINATION_FOLDER}/{_user_folder_id}/{current_folder_entry_id}/{index}"
-            await asyncio.to_thread(os.makedirs, destination_path, exist_ok=True)
-
-            audio_filename = (
-                os.path.basename(video.path)
-                if getattr(video, "path", None)
-                else f"{index}.mp3"
+    def _pipeline(self) -> PipelineScheduler["_VideoJob"]:
+        """Stages of a video, shared by every job this process runs.
+
+        Download is limited by the connections yt-dlp is allowed, decode by
+        the cores and the memory a decoded buffer takes, transcription by the
+        Whisper inference workers and summarization by the LLM rate limits.
+        """
+        if self._stages is None:
+            self._stages = PipelineScheduler(
+                [
+                    PipelineStage(
+                        "download", self._download_stage, PIPELINE_DOWNLOAD_CONCURRENCY
+                    ),
+                    PipelineStage(
+                        "decode",
+                        self._decode_stage,
+                        PIPELINE_DECODE_CONCURRENCY,
+                        # Decoded buffers wait here for the transcriber.
+                        PIPELINE_DECODED_QUEUE_SIZE,
+                    ),
+                    PipelineStage(
+                        "transcribe",
+                        self._transcribe_stage,
+                        PIPELINE_TRANSCRIBE_CONCURRENCY,
+                        PIPELINE_DECODED_QUEUE_SIZE,
+                    ),
+                    PipelineStage(
+                        "summarize",
+                        self._summarize_stage,
+                        PIPELINE_SUMMARY_CONCURRENCY,
+                        PIPELINE_QUEUE_SIZE,
+                    ),
+                    PipelineStage(
+                        "persist",
+                        self._persist_stage,
+                        PIPELINE_PERSIST_CONCURRENCY,
+                        PIPELINE_QUEUE_SIZE,
+                    ),
+                ]
+            )
+        return self._stages
+
+    def pipeline_metrics(self) -> Dict[str, StageMetrics]:
+        """Queue depth and load of each stage, across the jobs of this process."""
+        return self._pipeline().metrics()
+
+    async def _download_stage(self, job: "_VideoJob") -> "_VideoJob":
+        await asyncio.to_thread(os.makedirs, job.destination_path, exist_ok=True)
+        input_language = job.data.prompt_config.input_language
+        job.cache_language = whisper_language_code(input_language) or "auto"
+        job.cache_source = await self._transcription_cache_source(job.video)
+        if job.cache_source:
+            job.cached = await self._transcription_cache.get(
+                job.cache_source, job.cache_language
             )
-            audio_path = os.path.join(destination_path, audio_filename)
-            transcription_path = os.path.join(
-                destination_path, Constants.TRANSCRIPTION_FILE
+        if job.cached is None:
+            job.audio_path = await self._fetch_audio(
+                job.video, job.index, job.audio_path, job.destination_path
             )
-            summary_path = os.path.join(destination_path, Constants.SUMMARY_FILE)
+        return job
 
-            if getattr(video, "url", None):
-                await self._yt_service.download(
-                    HttpUrl(video.url), destination_path, str(index)
+    async def _decode_stage(self, job: "_VideoJob") -> "_VideoJob":
+        if job.cached is None:
+            job.audio = await self._transcription_service.decode_audio(
+                job.audio_path, self._streaming()
+            )
+        return job
+
+    async def _transcribe_stage(self, job: "_VideoJob") -> "_VideoJob":
+        language = job.data.prompt_config.language
+        input_language = job.data.prompt_config.input_language
+        audio, job.audio = job.audio, None
+        if job.cached is not None:
+            # Same media transcribed before: no download and no Whisper.
+            await self._directory_manager.write_transcription(
+                job.cached.text, job.transcription_path
+            )
+        elif self._streaming():
+            # The summary consumes the transcript while it is produced, so
+            # both happen here.
+            summary_response = (
+                await self._summary_service.for_job()._process_single_transcription(
+                    prompt_config=job.data.prompt_config,
+                    file_config=job.file_config,
+                    data_result=job.data_result,
+                    transcript_stream=self._transcription_service.stream_transcription(
+                        job.audio_path,
+                        job.destination_path,
+                        language,
+                        input_language,
+                        audio,
+                        job.transcription_stats,
+                    ),
+                    transcription_stats=job.transcription_stats,
                 )
-            elif getattr(video, "path", None):
-                src_path = Path(video.path)
-                dest_path = Path(audio_path)
-                if not await asyncio.to_thread(src_path.exists):
-                    raise FileNotFoundError(f"Fichero no encontrado: {video.path}")
-                if src_path.resolve() != dest_path.resolve():
-                    await asyncio.to_thread(shutil.copy, src_path, dest_path)
-                else:
-                    logger.info(
-                        f"El archivo ya está en la ubicación de destino: {dest_path}"
-                    )
-            else:
-                raise ValueError(f"No URL ni path proporcionado para video {index}")
-
-            if not await self._verify_file_exists(Path(audio_path)):
-                raise FileNotFoundError(f"Archivo de audio no encontrado: {audio_path}")
-
+            )
+            if not summary_response.success:
+                raise RuntimeError(summary_response.message)
+            job.summarized = True
+        else:
             await self._transcription_service.generate_transcription(
-                audio_path, destination_path, data.prompt_config.language
+                job.audio_path,
+                job.destination_path,
+                language,
+                input_language,
+                audio,
+                job.transcription_stats,
             )
+            transcription_path = job.transcription_path
             if not await self._verify_file_exists(Path(transcription_path)):
                 raise FileNotFoundError(
                     f"Archivo de transcripción no creado: {transcription_path}"
                 )
-
-            await self._summary_service._process_single_transcription(
-                prompt_config=data.prompt_config,
-                file_config=FileConfig(
-                    transcription_path=transcription_path, summary_path=summary_path
-                ),
-                data_result=data_result,
-            )
-            if not await self._verify_file_exists(Path(summary_path)):
-                raise FileNotFoundError(f"Archivo de resumen no creado: {summary_path}")
-
+        # torch is only loaded by the openai-whisper backend.
+        torch = sys.modules.get("torch")
+        if torch is not None:
             await asyncio.to_thread(torch.cuda.empty_cache)
-
-            data_result.download_location = destination_path
-            data_result.index = index
-
-            if getattr(video, "url", None):
-                data_result.url = video.url
-                info = (
-                    await self._audio_service.get_media_info_yt(HttpUrl(video.url))
-                    or {}
+        return job
+
+    async def _summarize_stage(self, job: "_VideoJob") -> "_VideoJob":
+        if not job.summarized:
+            summary_response = (
+                await self._summary_service.for_job()._process_single_transcription(
+                    prompt_config=job.data.prompt_config,
+                    file_config=job.file_config,
+                    data_result=job.data_result,
+                    transcription_stats=job.transcription_stats,
                 )
-                data_result.name = info.get("title", f"Video {index}")
-                data_result.duration = float(info.get("duration", 0.0))
-            else:
-                data_result.url = None
-                data_result.name = os.path.basename(video.path)
-                data_result.duration = 0.0
+            )
+            if not summary_response.success:
+                raise RuntimeError(summary_response.message)
+            job.summarized = True
+        return job
+
+    async def _persist_stage(self, job: "_VideoJob") -> "_VideoJob":
+        if job.cached is None and job.cache_source:
+            await self._cache_transcription(
+                job.cache_source, job.transcription_path, job.cache_language
+            )
+        summary_path = job.summary_path
+        if not await self._verify_file_exists(Path(summary_path)):
+            raise FileNotFoundError(f"Archivo de resumen no creado: {summary_path}")
+
+        data_result = job.data_result
+        data_result.download_location = job.destination_path
+        data_result.index = job.index
+
+        video = job.video
+        if getattr(video, "url", None):
+            data_result.url = video.url
+            info = await self._audio_service.get_media_info_yt(HttpUrl(video.url)) or {}
+            data_result.name = info.get("title", f"Video {job.index}")
+            data_result.duration = float(info.get("duration", 0.0))
+        else:
+            data_result.url = None
+            data_result.name = os.path.basename(video.path)
+            data_result.duration = await self._upload_duration(video)
+
+        await job.create_data_result(
+            job.user_id, job.current_folder_entry_id, data_result
+        )
 
-            await _create_data_result(_user_id, current_folder_entry_id, data_result)
+        job.result = {
+            "transcription": TranscriptionResponse(success=True).__str__(),
+            "summary": SummaryResponse(success=True).__str__(),
+        }
+        return job
 
-            return {
-                "transcription": TranscriptionResponse(success=True).__str__(),
-                "summary": SummaryResponse(success=True).__str__(),
-            }
+    def _streaming(self) -> bool:
+        return (
+            TRANSCRIPTION_STREAMING
+            and not self._summary_service.extractive_reduction_enabled
+        )
 
+    async def _upload_duration(self, video: Any) -> float:
+        """Duration in seconds of an uploaded file; the probe made when the
+        upload was billed is reused through the content hash."""
+        try:
+            probe = await self._media_probe.probe(
+                video.path, getattr(video, "content_hash", None)
+            )
+            return probe.duration
         except Exception as e:
-            logger.error(f"Error processing video {index}: {str(e)}", exc_info=True)
-            raise
+            logger.warning(f"No se pudo obtener la duración de {video.path}: {e}")
+            return 0.0
+
+    async def _transcription_cache_source(self, video: Any) -> Optional[str]:
+        if getattr(video, "url", None):
+            key = await self._yt_service.get_video_key(HttpUrl(video.url))
+            return TranscriptionCacheService.source_for_video(*key) if key else None
+        content_hash = getattr(video, "content_hash", None)
+        if content_hash:
+            return TranscriptionCacheService.source_for_upload(content_hash)
+        return None
+
+    async def _cache_transcription(
+        self, source: str, transcription_path: str, language: str
+    ) -> None:
+        try:
+            transcription = await self._directory_manager.read_transcription(
+                transcription_path
+            )
+        except (OSError, ValueError, RuntimeError) as e:
+            logger.warning("Transcription not cached for %s: %s", source, e)
+            return
+        await self._transcription_cache.put(source, transcription, language)
+
+    async def _fetch_audio(
+        self, video: Any, index: int, audio_path: str, destination_path: str
+    ) -> str:
+        """Put the media of ``video`` in ``destination_path`` and return its path.
+
+        Online media keeps the extension of the downloaded audio stream.
+        """
+        if getattr(video, "url", None):
+            audio_path = await self._yt_service.download_audio(
+                HttpUrl(video.url), destination_path, str(index)
+            )
+        elif getattr(video, "path", None):
+            src_path = Path(video.path)
+            dest_path = Path(audio_path)
+            if not await asyncio.to_thread(src_path.exists):
+                raise FileNotFoundError(f"Fichero no encontrado: {video.path}")
+            if src_path.resolve() != dest_path.resolve():
+                await asyncio.to_thread(shutil.copy, src_path, dest_path)
+            else:
+                logger.info(
+                    f"El archivo ya está en la ubicación de destino: {dest_path}"
+                )
+        else:
+            raise ValueError(f"No URL ni path proporcionado para video {index}")
+
+        if not await self._verify_file_exists(Path(audio_path)):
+            raise FileNotFoundError(f"Archivo de audio no encontrado: {audio_path}")
+        return audio_path
+
+    async def _iter_videos(self, data: BrevioGenerate) -> AsyncGenerator[Any, None]:
+        """Yield the videos of ``data`` with playlists expanded while they are
+        enumerated, so the first entries reach the download stage right away."""
+        for video in data.data:
+            url = getattr(video, "url", None)
+
+            if url is not None and await self._yt_service.is_youtube_playlist(url):
+                async for video_url in self._yt_service.iter_video_urls_from_playlist(
+                    HttpUrl(url)
+                ):
+                    yield type("VideoObj", (object,), {"url": video_url})()
+            else:
+                yield video
 
     async def _process_online_audio_data(
         self,
@@ -159,51 +415,30 @@ class Generate:
         _usage_cost_tracker: Optional[UsageCostTracker] = None,
     ) -> Dict[str, Any]:
         try:
-            tasks = []
-            task_index = 0
 
-            for video in data.data:
-                url = getattr(video, "url", None)
-
-                if url is not None and await self._yt_service.is_youtube_playlist(url):
-                    video_urls = await self._yt_service.get_video_urls_from_playlist(
-                        HttpUrl(url)
-                    )
-                    for video_url in video_urls:
-                        video_obj = type("VideoObj", (object,), {"url": video_url})()
-                        tasks.append(
-                            self.process_video(
-                                index=task_index,
-                                video=video_obj,
-                                data=data,
-                                _create_data_result=_create_data_result,
-                                current_folder_entry_id=current_folder_entry_id,
-                                _user_folder_id=_user_folder_id,
-                                _user_id=_user_id,
-                            )
-                        )
-                        task_index += 1
-
-                else:
-                    tasks.append(
-                        self.process_video(
-                            index=task_index,
-                            video=video,
-                            data=data,
-                            _create_data_result=_create_data_result,
-                            current_folder_entry_id=current_folder_entry_id,
-                            _user_folder_id=_user_folder_id,
-                            _user_id=_user_id,
-                        )
+            async def jobs() -> AsyncGenerator[_VideoJob, None]:
+                index = 0
+                async for video in self._iter_videos(data):
+                    yield _VideoJob(
+                        index,
+                        video,
+                        data,
+                        _create_data_result,
+                        current_folder_entry_id,
+                        _user_folder_id,
+                        _user_id,
                     )
-                    task_index += 1
+                    index += 1
 
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            outcomes = await self._pipeline().run(jobs())
 
-            for result in results:
-                if isinstance(result, Exception):
-                    logger.error(f"Task failed with exception: {str(result)}")
-                    raise result
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    logger.error(f"Task failed with exception: {str(outcome)}")
+                    raise outcome
+            results = [
+                outcome.result for outcome in outcomes if isinstance(outcome, _VideoJob)
+            ]
 
             return {
                 "folder_response": {
@@ -250,6 +485,7 @@ class Generate:
                     str(_user_id),
                     _create_data_result,
                     _usage_cost_tracker,
+                    document.content_hash,
                 )
                 for index, document in enumerate(_data.data)
             ]
@@ -280,6 +516,7 @@ class Generate:
         _user_id: str,
         _create_data_result: Optional[Callable[[str, str, DataResult], Any]] = None,
         _usage_cost_tracker: Optional[UsageCostTracker] = None,
+        content_hash: Optional[str] = None,
     ) -> Dict[str, str]:
         try:
             data_result = DataResult(name=f"Document {index}")
@@ -291,7 +528,9 @@ class Generate:
             await self._directory_manager.createFolder(destination_path)
 
             _file_config = FileConfig(
-                summary_path=summary_path, document_path=document_path
+                summary_path=summary_path,
+                document_path=document_path,
+                content_hash=content_hash,
             )
 
             summary_result = await self._summary_service.generate_summary_document(
@@ -1,7 +1,9 @@
 from .directory_manager import DirectoryManager
+from .whisper_model_registry import WhisperModelRegistry
 
 managers = {
     "directory_manager": DirectoryManager,
+    "whisper_model_registry": WhisperModelRegistry,
 }
 
-__all__ = ["DirectoryManager", "managers"]
+__all__ = ["DirectoryManager", "WhisperModelRegistry", "managers"]
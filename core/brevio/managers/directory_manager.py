@@ -1,7 +1,13 @@
 import asyncio
+import concurrent.futures
 import logging
+import os
+import threading
+from collections import deque
 from collections.abc import AsyncGenerator
-from typing import Generator, Optional
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from typing import Callable, Deque, Generator, Iterator, List, Optional, Union
 
 from core.shared.models.history_token_model import HistoryTokenModel
 
@@ -9,26 +15,33 @@ try:
     import aiofiles
 except ImportError:
     raise ImportError("aiofiles is not installed")
-import markdown
-from bs4 import BeautifulSoup, Tag
-from docx import Document
-from docx.document import Document as DocumentType
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
 
 from core.brevio.constants.directory_messages import DirectoryMessages
 from core.brevio.constants.summary_messages import SummaryMessages
 from core.brevio.models.config_model import ConfigModel
 from core.brevio.models.response_model import FolderResponse
+from core.shared.utils.docx_export_utils import render_markdown_to_docx
+from core.shared.utils.docx_utils import batch_blocks, iter_docx_blocks
+from core.shared.utils.pdf_utils import (
+    count_pdf_pages,
+    extract_pdf_page_range,
+    iter_pdf_pages,
+)
+from core.shared.utils.process_pool_utils import available_cpus, get_process_pool
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
-logger.propagate = False
-if not logger.handlers:
-    handler = logging.StreamHandler()
-    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+
+PDF_PAGE_WINDOW = int(os.getenv("PDF_PAGE_WINDOW", 8))
+PDF_EXTRACT_WORKERS = int(os.getenv("PDF_EXTRACT_WORKERS", 0)) or available_cpus()
+PDF_PROCESS_MIN_PAGES = int(os.getenv("PDF_PROCESS_MIN_PAGES", 64))
+PDF_PAGES_PER_TASK = max(1, int(os.getenv("PDF_PAGES_PER_TASK", 16)))
+DOCX_PIECE_CHARS = int(os.getenv("DOCX_PIECE_CHARS", 4000))
+DOCX_EXPORT_WORKERS = max(1, int(os.getenv("DOCX_EXPORT_WORKERS", 1)))
+DOCX_EXPORT_MODE = os.getenv("DOCX_EXPORT_MODE", "eager").lower()
+
+
+def _docx_path(md_path: str) -> str:
+    return md_path.replace(".md", ".docx")
 
 
 class DirectoryManager:
@@ -113,7 +126,7 @@ class DirectoryManager:
             if not transcription.strip():
                 raise ValueError(SummaryMessages.ERROR_EMPTY_TRANSCRIPTION)
 
-            logger.info(f"Transcripción leída: {len(transcription)} caracteres")
+            logger.info("Transcripción leída: %s caracteres", len(transcription))
             return transcription
         except FileNotFoundError:
             raise FileNotFoundError(
@@ -129,34 +142,131 @@ class DirectoryManager:
         path: str,
         history_token_model: Optional["HistoryTokenModel"] = None,
         pieces_for_page: int = 1,
+        window_pages: int = PDF_PAGE_WINDOW,
+        workers: Optional[int] = None,
+    ) -> AsyncGenerator[str, None]:
+        """Yield the cleaned text of each page, in order, as soon as it is ready.
+
+        Large PDFs (``PDF_PROCESS_MIN_PAGES`` pages or more) are split into page
+        ranges extracted by a process pool of ``PDF_EXTRACT_WORKERS`` workers;
+        smaller ones, or deployments with a single worker, use one thread. In
+        both modes at most ``window_pages`` pages per worker are extracted ahead
+        of the consumer, so memory stays bounded. Token counting is left to the
+        consumer, which knows the model encoder.
+        """
+        workers = PDF_EXTRACT_WORKERS if workers is None else workers
+        pages: Optional[AsyncGenerator[str, None]] = None
+        if workers > 1:
+            page_count = await asyncio.to_thread(count_pdf_pages, path)
+            if page_count >= PDF_PROCESS_MIN_PAGES:
+                pool = get_process_pool("pdf_extraction", workers)
+                if pool is not None:
+                    logger.info(
+                        "PDF tiene %s páginas, extrayendo con %s procesos",
+                        page_count,
+                        workers,
+                    )
+                    pages = self._extract_pages_in_processes(
+                        pool, path, page_count, workers, window_pages
+                    )
+        if pages is None:
+            pages = self._iterate_in_thread(lambda: iter_pdf_pages(path), window_pages)
+
+        try:
+            async for page in pages:
+                if history_token_model:
+                    history_token_model.num_chars_file += len(page)
+                yield page
+        finally:
+            await pages.aclose()
+
+    async def _extract_pages_in_processes(
+        self,
+        pool: ProcessPoolExecutor,
+        path: str,
+        page_count: int,
+        workers: int,
+        window_pages: int,
     ) -> AsyncGenerator[str, None]:
-        def blocking_read() -> list[str]:
-            import re
-
-            import pypdf
-            import tiktoken
-
-            lector = pypdf.PdfReader(path)
-            total_paginas = len(lector.pages)
-            logger.info(f"PDF tiene {total_paginas} páginas")
-            encoder = tiktoken.encoding_for_model("gpt-4")
-
-            fragments = []
-            for i, pagina in enumerate(lector.pages):
-                texto = pagina.extract_text() or ""
-                texto_limpio = re.sub(r"\n+", "\n", texto.strip())
-                if texto_limpio:
-                    if history_token_model:
-                        history_token_model.num_chars_file += len(texto_limpio)
-                        history_token_model.num_tokens_file += len(
-                            encoder.encode(texto_limpio)
-                        )
-                    fragments.append(texto_limpio)
-            return fragments
-
-        fragments = await asyncio.to_thread(blocking_read)
-        for fragment in fragments:
-            yield fragment
+        loop = asyncio.get_running_loop()
+        ranges = iter(
+            [
+                (start, min(start + PDF_PAGES_PER_TASK, page_count))
+                for start in range(0, page_count, PDF_PAGES_PER_TASK)
+            ]
+        )
+        max_in_flight = max(workers, workers * window_pages // PDF_PAGES_PER_TASK)
+        pending: Deque["asyncio.Future[List[str]]"] = deque()
+
+        def submit_next() -> None:
+            page_range = next(ranges, None)
+            if page_range is not None:
+                pending.append(
+                    loop.run_in_executor(
+                        pool, extract_pdf_page_range, path, *page_range
+                    )
+                )
+
+        for _ in range(max_in_flight):
+            submit_next()
+        try:
+            while pending:
+                texts = await pending.popleft()
+                submit_next()
+                for text in texts:
+                    yield text
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def _iterate_in_thread(
+        self, produce: Callable[[], Iterator[str]], window: int
+    ) -> AsyncGenerator[str, None]:
+        """Run the blocking iterator built by ``produce`` in a worker thread.
+
+        At most ``window`` items are buffered ahead of the consumer; closing the
+        generator stops the thread at the next item.
+        """
+        loop = asyncio.get_running_loop()
+        items: asyncio.Queue[Union[str, BaseException, None]] = asyncio.Queue(
+            maxsize=max(1, window)
+        )
+        stop = threading.Event()
+
+        def hand_over(item: Union[str, BaseException, None]) -> bool:
+            future = asyncio.run_coroutine_threadsafe(items.put(item), loop)
+            while True:
+                try:
+                    future.result(timeout=0.1)
+                    return True
+                except concurrent.futures.TimeoutError:
+                    if stop.is_set():
+                        future.cancel()
+                        return False
+
+        def blocking_read() -> None:
+            try:
+                with closing(produce()) as iterator:  # type: ignore[type-var]
+                    for item in iterator:
+                        if stop.is_set() or not hand_over(item):
+                            return
+            except BaseException as e:
+                hand_over(e)
+                return
+            hand_over(None)
+
+        reader = loop.run_in_executor(None, blocking_read)
+        try:
+            while True:
+                item = await items.get()
+                if item is None:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            await asyncio.shield(reader)
 
     async def read_pdf(
         self, pdf_path: str, history_token_model: Optional["HistoryTokenModel"]
@@ -169,90 +279,94 @@ class DirectoryManager:
             raise ValueError("El PDF está vacío o no se pudo extraer texto")
 
         logger.info(
-            f"PDF leído: {len(fragments)} fragmentos, Total caracteres: {sum(len(f) for f in fragments)}"
+            "PDF leído: %s fragmentos, Total caracteres: %s",
+            len(fragments),
+            sum(len(f) for f in fragments),
         )
         return fragments
 
+    async def read_docx_in_pieces(
+        self,
+        path: str,
+        piece_chars: int = DOCX_PIECE_CHARS,
+        window_pieces: int = PDF_PAGE_WINDOW,
+    ) -> AsyncGenerator[str, None]:
+        """Yield the text of a DOCX incrementally, in pieces of ``piece_chars``.
+
+        Paragraphs, headings and table rows are read with a streaming parser in
+        a worker thread and grouped so the hand-off cost stays low; at most
+        ``window_pieces`` pieces are buffered ahead of the consumer.
+        """
+        async for piece in self._iterate_in_thread(
+            lambda: batch_blocks(iter_docx_blocks(path), piece_chars), window_pieces
+        ):
+            yield piece
+
     async def read_docx(self, docx_path: str) -> str:
-        def blocking_read() -> str:
-            doc = Document(docx_path)
-            paragraphs = [para.text for para in doc.paragraphs if para.text.strip()]
-            total_paragraphs = len(paragraphs)
-            logger.info(f"DOCX tiene {total_paragraphs} párrafos")
-            return "\n".join(paragraphs)
+        pieces = [piece async for piece in self.read_docx_in_pieces(docx_path)]
+        logger.info("DOCX leído: %s caracteres", sum(len(p) for p in pieces))
+        return "\n".join(pieces)
 
-        return await asyncio.to_thread(blocking_read)
+    async def write_transcription(
+        self, transcription: str, transcription_path: str
+    ) -> None:
+        try:
+            async with aiofiles.open(transcription_path, "w", encoding="utf-8") as f:
+                await f.write(transcription)
+            logger.info("Transcripción escrita en %s", transcription_path)
+        except Exception as e:
+            raise RuntimeError(
+                f"Error al escribir la transcripción en {transcription_path}: {str(e)}"
+            ) from e
 
     async def write_summary(self, summary: str, summary_path: str) -> None:
         try:
             async with aiofiles.open(summary_path, "a", encoding="utf-8") as f:
                 await f.write(summary + "\n")
-            logger.info(f"Resumen escrito en {summary_path}")
+            logger.info("Resumen escrito en %s", summary_path)
         except Exception as e:
             raise RuntimeError(
                 f"Error al escribir el resumen en {summary_path}: {str(e)}"
             ) from e
 
-    def _add_toc(self, doc: DocumentType) -> None:
-        logger.debug("Adding table of contents to DOCX")
-        doc.add_heading("Índice", level=1)
-        paragraph = doc.add_paragraph()
-        run = paragraph.add_run()
-        fld_char = OxmlElement("w:fldChar")
-        fld_char.set(qn("w:fldCharType"), "begin")
-        run._r.append(fld_char)
-        instr_text = OxmlElement("w:instrText")
-        instr_text.text = 'TOC \\o "1-3" \\h \\z \\u'
-        run._r.append(instr_text)
-        fld_char = OxmlElement("w:fldChar")
-        fld_char.set(qn("w:fldCharType"), "end")
-        run._r.append(fld_char)
-        doc.add_paragraph(
-            "Nota: Haga clic derecho en el índice y seleccione 'Actualizar campo' al abrir en Word."
-        )
-
     async def create_docx_version(self, md_path: Optional[str]) -> None:
+        """Export ``md_path`` to DOCX, unless exports are deferred.
+
+        With ``DOCX_EXPORT_MODE=lazy`` nothing is rendered here and the DOCX is
+        produced by ``get_docx_version`` the first time it is requested.
+        """
         if md_path is None:
             logger.error("No path provided for DOCX conversion")
             return
+        if DOCX_EXPORT_MODE == "lazy":
+            logger.debug("DOCX export deferred for %s", md_path)
+            return
 
-        docx_path = md_path.replace(".md", ".docx")
-
-        async def blocking_create_docx() -> None:
-            async with aiofiles.open(md_path, "r", encoding="utf-8") as f:
-                md_content = await f.read()
-
-            doc = Document()
-            self._add_toc(doc)
-            doc.add_page_break()
-
-            html = markdown.markdown(md_content)
-            soup = BeautifulSoup(html, "html.parser")
-
-            for element in soup:
-                if isinstance(element, Tag):
-                    if element.name in ["h1", "h2", "h3"]:
-                        level = int(element.name[1])
-                        heading = doc.add_heading(
-                            element.get_text().strip(), level=level
-                        )
-                        heading.style = f"Heading {level}"
-                    elif element.name == "p":
-                        doc.add_paragraph(element.get_text().strip())
-                    elif element.name == "ul":
-                        for item in element.find_all("li", recursive=False):
-                            doc.add_paragraph(
-                                item.get_text().strip(), style="List Bullet"
-                            )
-                    elif element.name == "ol":
-                        counter = 1
-                        for item in element.find_all("li", recursive=False):
-                            text = item.get_text().strip()
-                            doc.add_paragraph(f"{counter}. {text}", style="List Number")
-                            counter += 1
-
-            doc.save(docx_path)
-
-        await blocking_create_docx()
-
-        logger.info(f"DOCX version created: {docx_path}")
+        docx_path = await self._render_docx(md_path)
+        logger.info("DOCX version created: %s", docx_path)
+
+    async def create_docx_versions(self, md_paths: List[str]) -> List[str]:
+        """Export several Markdown files at once, spread over the export pool."""
+        return list(
+            await asyncio.gather(*(self._render_docx(path) for path in md_paths))
+        )
+
+    async def get_docx_version(self, md_path: str) -> str:
+        """Path of the DOCX export of ``md_path``, rendering it if missing or stale."""
+        docx_path = _docx_path(md_path)
+        if not os.path.exists(docx_path) or os.path.getmtime(
+            docx_path
+        ) < os.path.getmtime(md_path):
+            await self._render_docx(md_path)
+            logger.info("DOCX version created on demand: %s", docx_path)
+        return docx_path
+
+    async def _render_docx(self, md_path: str) -> str:
+        docx_path = _docx_path(md_path)
+        pool = get_process_pool("docx_export", DOCX_EXPORT_WORKERS)
+        if pool is None:
+            return await asyncio.to_thread(render_markdown_to_docx, md_path, docx_path)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            pool, render_markdown_to_docx, md_path, docx_path
+        )
@@ -0,0 +1,212 @@
+import asyncio
+import logging
+import time
+import weakref
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+async def _aiter(items: Union[Iterable[T], AsyncIterable[T]]) -> AsyncIterator[T]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+class StageMetrics(BaseModel):
+    name: str
+    concurrency: int
+    queue_size: int
+    queued: int = 0
+    max_queued: int = 0
+    running: int = 0
+    completed: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+
+
+class PipelineStage(Generic[T]):
+    """One step of a ``PipelineScheduler``: at most ``concurrency`` calls to
+    ``handler`` run at once across every run of the scheduler, and each run
+    queues at most ``queue_size`` items in front of it."""
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[T], Awaitable[T]],
+        concurrency: int,
+        queue_size: int = 2,
+    ) -> None:
+        self.name = name
+        self.handler = handler
+        self.concurrency = max(1, concurrency)
+        self.queue_size = max(1, queue_size)
+        self.stats = StageMetrics(
+            name=name, concurrency=self.concurrency, queue_size=self.queue_size
+        )
+        self._slots: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]"
+        ) = weakref.WeakKeyDictionary()
+        self._queues: "weakref.WeakSet[asyncio.Queue[Any]]" = weakref.WeakSet()
+
+    def slot(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        slot = self._slots.get(loop)
+        if slot is None:
+            slot = self._slots[loop] = asyncio.Semaphore(self.concurrency)
+        return slot
+
+    def new_queue(self) -> "asyncio.Queue[Any]":
+        queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=self.queue_size)
+        self._queues.add(queue)
+        return queue
+
+    def metrics(self) -> StageMetrics:
+        return self.stats.model_copy(
+            update={"queued": sum(queue.qsize() for queue in self._queues)}
+        )
+
+
+class PipelineScheduler(Generic[T]):
+    """Runs items through a fixed sequence of stages, like an assembly line.
+
+    Every stage has its own worker limit and a bounded queue, so a slow stage
+    makes the previous ones wait (backpressure) instead of piling up
+    downloaded or decoded media in memory. An item whose handler raises skips
+    the remaining stages; ``run`` returns the final item or the exception for
+    each input, in input order. The scheduler is meant to be long-lived so
+    that concurrent runs share the stage limits and ``metrics``.
+    """
+
+    def __init__(self, stages: Sequence[PipelineStage[T]]) -> None:
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        self.stages = list(stages)
+
+    def metrics(self) -> Dict[str, StageMetrics]:
+        return {stage.name: stage.metrics() for stage in self.stages}
+
+    async def run(
+        self, items: Union[Iterable[T], AsyncIterable[T]]
+    ) -> List[Union[T, BaseException]]:
+        """Process ``items``; an async iterable is consumed as the first stage
+        accepts work, so producing items overlaps with processing them."""
+        results: Dict[int, Union[T, BaseException]] = {}
+        queues = [stage.new_queue() for stage in self.stages]
+        workers = [
+            asyncio.ensure_future(
+                self._work(
+                    stage,
+                    queues[position],
+                    queues[position + 1] if position + 1 < len(queues) else None,
+                    results,
+                )
+            )
+            for position, stage in enumerate(self.stages)
+            for _ in range(stage.concurrency)
+        ]
+        count = 0
+        try:
+            async for item in _aiter(items):
+                await self._put(self.stages[0], queues[0], (count, item))
+                count += 1
+            # Each worker forwards an item before marking it done, so once a
+            # queue is drained everything it held has reached the next one.
+            for queue in queues:
+                await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        logger.info(
+            "Pipeline run of %s items: %s",
+            count,
+            ", ".join(
+                f"{stage.name} max_queued={stage.stats.max_queued} "
+                f"busy={stage.stats.busy_seconds:.1f}s"
+                for stage in self.stages
+            ),
+        )
+        return [results[index] for index in range(count)]
+
+    @staticmethod
+    async def _put(
+        stage: PipelineStage[T], queue: "asyncio.Queue[Any]", entry: Tuple[int, T]
+    ) -> None:
+        await queue.put(entry)
+        stage.stats.max_queued = max(stage.stats.max_queued, queue.qsize())
+
+    async def _work(
+        self,
+        stage: PipelineStage[T],
+        queue: "asyncio.Queue[Any]",
+        next_queue: Optional["asyncio.Queue[Any]"],
+        results: Dict[int, Union[T, BaseException]],
+    ) -> None:
+        position = self.stages.index(stage)
+        while True:
+            index, item = await queue.get()
+            try:
+                async with stage.slot():
+                    stage.stats.running += 1
+                    start_time = time.perf_counter()
+                    try:
+                        item = await stage.handler(item)
+                    finally:
+                        stage.stats.running -= 1
+                        stage.stats.busy_seconds += time.perf_counter() - start_time
+            except asyncio.CancelledError as e:
+                # A handler awaiting a future cancelled elsewhere (for example
+                # by a process pool shutting down) fails its item; only the
+                # cancellation of this worker itself stops it.
+                task = asyncio.current_task()
+                if task is not None and task.cancelling():
+                    raise
+                self._fail(stage, index, e, results)
+            except Exception as e:
+                self._fail(stage, index, e, results)
+            else:
+                stage.stats.completed += 1
+                if next_queue is None:
+                    results[index] = item
+                else:
+                    await self._put(
+                        self.stages[position + 1], next_queue, (index, item)
+                    )
+            finally:
+                queue.task_done()
+
+    @staticmethod
+    def _fail(
+        stage: PipelineStage[T],
+        index: int,
+        error: BaseException,
+        results: Dict[int, Union[T, BaseException]],
+    ) -> None:
+        stage.stats.failed += 1
+        logger.error(
+            "Pipeline stage %s failed for item %s: %r", stage.name, index, error
+        )
+        results[index] = error
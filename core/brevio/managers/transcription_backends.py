@@ -0,0 +1,117 @@
+import os
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Type, Union
+
+import numpy as np
+
+from core.brevio.enums.language import LanguageType
+from core.brevio.protocols.transcription_backend_protocol import (
+    TranscriptionBackendProtocol,
+)
+
+TRANSCRIPTION_BACKEND = os.getenv("TRANSCRIPTION_BACKEND", "whisper").lower()
+FASTER_WHISPER_COMPUTE_TYPE = os.getenv("FASTER_WHISPER_COMPUTE_TYPE", "int8")
+# 0 lets CTranslate2 pick its default (4 threads).
+FASTER_WHISPER_CPU_THREADS = int(os.getenv("FASTER_WHISPER_CPU_THREADS", 0))
+
+
+@lru_cache(maxsize=None)
+def _backend_languages(backend: str) -> FrozenSet[str]:
+    # Imported here so that only the package of the selected backend (and,
+    # for openai-whisper, torch) is loaded.
+    if backend == FasterWhisperBackend.name:
+        from faster_whisper.tokenizer import _LANGUAGE_CODES
+
+        return frozenset(_LANGUAGE_CODES)
+    from whisper.tokenizer import LANGUAGES
+
+    return frozenset(LANGUAGES)
+
+
+def whisper_language_code(language: Optional[LanguageType]) -> Optional[str]:
+    """``language`` as a Whisper decode hint, or None if Whisper does not know it."""
+    if language is None:
+        return None
+    return (
+        language.value
+        if language.value in _backend_languages(TRANSCRIPTION_BACKEND)
+        else None
+    )
+
+
+def _segment(start: float, end: float, text: str) -> Dict[str, Any]:
+    return {"start": float(start), "end": float(end), "text": text}
+
+
+class WhisperBackend:
+    """openai-whisper on PyTorch (fp32 on CPU)."""
+
+    name = "whisper"
+
+    def load_model(self, size: str) -> Any:
+        import whisper
+
+        return whisper.load_model(size)
+
+    def transcribe(
+        self,
+        model: Any,
+        audio: Union[str, np.ndarray],
+        language: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        result = model.transcribe(audio, **({"language": language} if language else {}))
+        return [
+            _segment(
+                segment["start"], segment.get("end", segment["start"]), segment["text"]
+            )
+            for segment in result.get("segments") or []
+        ]
+
+
+class FasterWhisperBackend:
+    """faster-whisper on CTranslate2, int8-quantized on CPU by default."""
+
+    name = "faster-whisper"
+
+    def load_model(self, size: str) -> Any:
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError as e:
+            raise RuntimeError(
+                "TRANSCRIPTION_BACKEND=faster-whisper requiere el paquete "
+                "faster-whisper"
+            ) from e
+        return WhisperModel(
+            size,
+            device="cpu",
+            compute_type=FASTER_WHISPER_COMPUTE_TYPE,
+            cpu_threads=FASTER_WHISPER_CPU_THREADS,
+        )
+
+    def transcribe(
+        self,
+        model: Any,
+        audio: Union[str, np.ndarray],
+        language: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        # faster-whisper returns a lazy generator; decoding happens while it is
+        # consumed, so materialise it here, inside the inference executor.
+        segments, _ = model.transcribe(audio, language=language)
+        return [_segment(s.start, s.end, s.text) for s in segments]
+
+
+_BACKENDS: Dict[str, Type[TranscriptionBackendProtocol]] = {
+    WhisperBackend.name: WhisperBackend,
+    FasterWhisperBackend.name: FasterWhisperBackend,
+}
+
+
+def get_transcription_backend(
+    name: str = TRANSCRIPTION_BACKEND,
+) -> TranscriptionBackendProtocol:
+    try:
+        return _BACKENDS[name]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown transcription backend {name!r}, expected one of {sorted(_BACKENDS)}"
+        ) from None
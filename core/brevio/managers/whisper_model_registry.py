@@ -0,0 +1,157 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from core.brevio.managers.transcription_backends import get_transcription_backend
+from core.brevio.models.transcription_stats_model import ModelLoadStats
+from core.brevio.protocols.transcription_backend_protocol import (
+    TranscriptionBackendProtocol,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+WHISPER_MODEL = os.getenv("WHISPER_MODEL", "small")
+WHISPER_INFERENCE_WORKERS = max(1, int(os.getenv("WHISPER_INFERENCE_WORKERS", 1)))
+
+
+def _peak_rss_bytes() -> int:
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return 0
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _parameter_bytes(model: Any) -> int:
+    parameters = getattr(model, "parameters", None)
+    if not callable(parameters):
+        return 0
+    try:
+        return sum(p.numel() * p.element_size() for p in parameters())
+    except (TypeError, AttributeError):
+        return 0
+
+
+class WhisperModelRegistry:
+    """Process-wide Whisper models, loaded once per size and shared.
+
+    Models come from the ``TRANSCRIPTION_BACKEND`` selected for the process
+    (openai-whisper or int8 faster-whisper, see ``transcription_backends``).
+
+    Coroutines obtain models with ``get_model`` and run inference through
+    ``run_inference``, which uses a single executor of
+    ``WHISPER_INFERENCE_WORKERS`` threads so concurrent jobs queue instead of
+    each holding its own copy of the model. Celery workers start
+    ``preload_in_background`` at ``worker_process_init`` so the first task
+    does not pay the load.
+    """
+
+    _models: Dict[str, Any] = {}
+    _stats: Dict[str, ModelLoadStats] = {}
+    _lock = threading.Lock()
+    _executor: Optional[ThreadPoolExecutor] = None
+    _backend: Optional[TranscriptionBackendProtocol] = None
+
+    @classmethod
+    def backend(cls) -> TranscriptionBackendProtocol:
+        if cls._backend is None:
+            cls._backend = get_transcription_backend()
+        return cls._backend
+
+    @classmethod
+    def load(cls, size: Optional[str] = None) -> Any:
+        size = size or WHISPER_MODEL
+        model = cls._models.get(size)
+        if model is not None:
+            return model
+        with cls._lock:
+            model = cls._models.get(size)
+            if model is None:
+                rss_before = _peak_rss_bytes()
+                start = time.perf_counter()
+                backend = cls.backend()
+                model = backend.load_model(size)
+                stats = ModelLoadStats(
+                    backend=backend.name,
+                    size=size,
+                    load_seconds=round(time.perf_counter() - start, 3),
+                    parameter_mb=round(_parameter_bytes(model) / 2**20, 1),
+                    peak_rss_delta_mb=round(
+                        max(0, _peak_rss_bytes() - rss_before) / 2**20, 1
+                    ),
+                )
+                cls._models[size] = model
+                cls._stats[size] = stats
+                logger.info(
+                    "Whisper model %s (%s) loaded in %.2f s (parameters=%.1f MB, "
+                    "peak_rss_delta=%.1f MB)",
+                    size,
+                    backend.name,
+                    stats.load_seconds,
+                    stats.parameter_mb,
+                    stats.peak_rss_delta_mb,
+                )
+        return model
+
+    @classmethod
+    async def get_model(cls, size: Optional[str] = None) -> Any:
+        size = size or WHISPER_MODEL
+        if size in cls._models:
+            return cls._models[size]
+        return await asyncio.to_thread(cls.load, size)
+
+    @classmethod
+    def preload(cls, size: Optional[str] = None) -> None:
+        try:
+            cls.load(size)
+        except Exception as e:
+            logger.error("Whisper model preload failed: %s", e, exc_info=True)
+
+    @classmethod
+    def preload_in_background(cls, size: Optional[str] = None) -> threading.Thread:
+        """Start ``preload`` in a daemon thread and return it.
+
+        Used from ``worker_process_init``: billiard kills a child that takes
+        longer than ``worker_proc_alive_timeout`` to report itself ready, and a
+        medium/large model (or its first download) takes longer than that.
+        A task that needs the model meanwhile waits on the load lock instead
+        of loading a second copy.
+        """
+        thread = threading.Thread(
+            target=cls.preload, args=(size,), name="whisper-preload", daemon=True
+        )
+        thread.start()
+        return thread
+
+    @classmethod
+    def executor(cls) -> ThreadPoolExecutor:
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=WHISPER_INFERENCE_WORKERS,
+                    thread_name_prefix="whisper",
+                )
+            return cls._executor
+
+    @classmethod
+    async def run_inference(cls, func: Callable[[], T]) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(cls.executor(), func)
+
+    @classmethod
+    def metrics(cls) -> Dict[str, ModelLoadStats]:
+        return dict(cls._stats)
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._models.clear()
+            cls._stats.clear()
+            cls._backend = None
@@ -0,0 +1,30 @@
+from typing import Dict, List
+
+from pydantic import BaseModel, Field
+
+
+class ExtractionCacheEntry(BaseModel):
+    """Extracted text of an uploaded document, keyed by its content hash.
+
+    Pages are stored joined by ``\\n`` in ``text``; ``page_offsets`` holds the
+    start offset of every page so the original pages can be rebuilt.
+    """
+
+    text: str
+    page_offsets: List[int] = Field(default_factory=lambda: [0])
+    token_counts: Dict[str, int] = Field(default_factory=dict)
+
+    @classmethod
+    def from_pages(cls, pages: List[str]) -> "ExtractionCacheEntry":
+        offsets = []
+        position = 0
+        for page in pages:
+            offsets.append(position)
+            position += len(page) + 1
+        return cls(text="\n".join(pages), page_offsets=offsets or [0])
+
+    def pages(self) -> List[str]:
+        bounds = self.page_offsets[1:] + [len(self.text) + 1]
+        return [
+            self.text[start : end - 1] for start, end in zip(self.page_offsets, bounds)
+        ]
@@ -0,0 +1,31 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class MediaProbe(BaseModel):
+    """What ffprobe reports about a media file and its first audio stream.
+
+    ``duration`` is in seconds; the audio fields are None when the file has
+    no audio stream.
+    """
+
+    duration: float
+    format_name: Optional[str] = None
+    codec: Optional[str] = None
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+
+    @classmethod
+    def from_ffprobe(cls, data: Dict[str, Any]) -> "MediaProbe":
+        """Build from ``ffprobe -show_format -show_streams -of json`` output."""
+        streams: List[Dict[str, Any]] = data.get("streams") or []
+        stream = streams[0] if streams else {}
+        sample_rate = stream.get("sample_rate")
+        return cls(
+            duration=float(data["format"]["duration"]),
+            format_name=data["format"].get("format_name"),
+            codec=stream.get("codec_name"),
+            sample_rate=int(sample_rate) if sample_rate else None,
+            channels=stream.get("channels"),
+        )
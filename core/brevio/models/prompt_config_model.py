@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Type
+from typing import TYPE_CHECKING, Any, Optional, Type
 
 from pydantic import field_serializer, field_validator
 
@@ -17,6 +17,9 @@ class PromptConfig(BaseModel):
     format: OutputFormatType
     language: LanguageType
     summary_level: SummaryLevel
+    # Spoken/written language of the source, when the user knows it. Used as a
+    # decode hint for Whisper and to skip language detection.
+    input_language: Optional[LanguageType] = None
 
     @field_validator("category", "style")
     @classmethod
@@ -85,6 +88,18 @@ class PromptConfig(BaseModel):
 
         return value
 
+    @field_validator("input_language", mode="before")
+    @classmethod
+    def convert_input_language_enum(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            if not value.strip():
+                return None
+            for member in LanguageType:
+                if member.name == value.upper() or member.value == value.lower():
+                    return member
+            raise ValueError(f"Invalid input_language: {value}")
+        return value
+
     @field_serializer("model")
     @classmethod
     def serialize_model(cls, value: ModelType) -> str:
@@ -95,6 +110,11 @@ class PromptConfig(BaseModel):
     def serialize_language(cls, value: LanguageType) -> str:
         return value.name
 
+    @field_serializer("input_language")
+    @classmethod
+    def serialize_input_language(cls, value: Optional[LanguageType]) -> Optional[str]:
+        return value.name if value is not None else None
+
     @field_serializer("format")
     @classmethod
     def serialize_format(cls, value: OutputFormatType) -> str:
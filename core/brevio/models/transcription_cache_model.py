@@ -0,0 +1,19 @@
+import time
+
+from pydantic import BaseModel, Field
+
+
+class TranscriptionCacheEntry(BaseModel):
+    """Formatted transcription of a media source for one Whisper model.
+
+    ``source`` is ``"<extractor>:<video id>"`` for online media and
+    ``"sha256:<content hash>"`` for uploads; ``language`` is the Whisper
+    language hint used to decode it, or ``"auto"`` when it was detected.
+    """
+
+    source: str
+    backend: str
+    model_size: str
+    language: str
+    text: str
+    created_at: float = Field(default_factory=time.time)
@@ -0,0 +1,31 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ModelLoadStats(BaseModel):
+    backend: str
+    size: str
+    load_seconds: float
+    parameter_mb: float
+    peak_rss_delta_mb: float
+
+
+class TranscriptionStats(BaseModel):
+    """Figures of one transcription, filled in by ``TranscriptionService``.
+
+    ``vad_skipped_seconds`` is the audio voice-activity detection left out
+    of ``audio_seconds``; both stay 0 when VAD is disabled. ``model_load`` is
+    how long the in-process Whisper model took to load and the memory it
+    took, None when the segments ran in worker processes.
+    """
+
+    audio_seconds: float = 0.0
+    vad_skipped_seconds: float = 0.0
+    model_load: Optional[ModelLoadStats] = None
+
+    @property
+    def vad_skipped_ratio(self) -> float:
+        if not self.audio_seconds:
+            return 0.0
+        return self.vad_skipped_seconds / self.audio_seconds
@@ -1,3 +1,4 @@
 from .language_prompt_protocol import LanguagePromptProtocol
+from .transcription_backend_protocol import TranscriptionBackendProtocol
 
-__all__ = ["LanguagePromptProtocol"]
+__all__ = ["LanguagePromptProtocol", "TranscriptionBackendProtocol"]
@@ -0,0 +1,38 @@
+from typing import Any, Dict, List, Optional, Protocol, Union
+
+import numpy as np
+
+
+class TranscriptionBackendProtocol(Protocol):
+    """
+    Interfaz común de los motores de transcripción (openai-whisper,
+    faster-whisper, ...).
+
+    ``WhisperModelRegistry`` carga los modelos con ``load_model`` y
+    ``TranscriptionService`` solo trabaja con los segmentos que devuelve
+    ``transcribe``, así que cambiar de motor es una cuestión de configuración.
+    """
+
+    name: str
+    """Nombre con el que se selecciona el motor (``TRANSCRIPTION_BACKEND``)."""
+
+    def load_model(self, size: str) -> Any:
+        """Carga el modelo ``size`` (tiny, base, small, ...) listo para inferencia."""
+        ...
+
+    def transcribe(
+        self,
+        model: Any,
+        audio: Union[str, np.ndarray],
+        language: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Transcribe un fichero o audio mono de 16 kHz en float32.
+
+        ``language`` (código ISO 639-1) fija el idioma de decodificación y evita
+        la detección automática; con None el motor detecta el idioma.
+
+        Devuelve segmentos ``{"start": float, "end": float, "text": str}`` con
+        tiempos en segundos relativos al inicio de ``audio``.
+        """
+        ...
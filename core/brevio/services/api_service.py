@@ -10,13 +10,6 @@ from core.shared.enums.model import ModelType
 from core.shared.utils.model_tokens_utils import get_encoder, is_deepseek
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-logger.propagate = False
-if not logger.handlers:
-    handler = logging.StreamHandler()
-    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
 
 
 class ApiService:
@@ -58,12 +51,14 @@ class ApiService:
                     else os.getenv("OPENAI_API_URL", "https://api.openai.com/v1")
                 )
                 if not api_key:
-                    logger.error(f"API key not set for model {model.value}")
+                    logger.error("API key not set for model %s", model.value)
                     raise ValueError(f"API key not configured for {model.value}")
                 client = AsyncOpenAI(api_key=api_key, base_url=base_url)
                 self.clients[model_key] = client
                 logger.info(
-                    f"Initialized new client for model {model.value} with base_url={base_url}"
+                    "Initialized new client for model %s with base_url=%s",
+                    model.value,
+                    base_url,
                 )
             return self.clients[model_key]
 
@@ -84,14 +79,17 @@ class ApiService:
 
             # Clear task queue
             async with self.queue_lock:
-                logger.debug(f"Clearing queue, current size: {self.task_queue.qsize()}")
+                logger.debug(
+                    "Clearing queue, current size: %s", self.task_queue.qsize()
+                )
                 while not self.task_queue.empty():
                     func, args = await self.task_queue.get()
-                    logger.debug(f"Cleared task from queue: {func.__name__}")
+                    logger.debug("Cleared task from queue: %s", func.__name__)
                     self.task_queue.task_done()
                     self.task_done_calls += 1
                     logger.debug(
-                        f"Called task_done() during shutdown, total calls: {self.task_done_calls}"
+                        "Called task_done() during shutdown, total calls: %s",
+                        self.task_done_calls,
                     )
 
             # Close clients
@@ -102,18 +100,22 @@ class ApiService:
                             await client.close()
                         else:
                             logger.warning(
-                                f"Client {model_key} does not support aclose()"
+                                "Client %s does not support aclose()", model_key
                             )
-                        logger.info(f"Closed client for model {model_key}")
+                        logger.info("Closed client for model %s", model_key)
                     except Exception as e:
                         logger.error(
-                            f"Error closing client for model {model_key}: {str(e)}",
+                            "Error closing client for model %s: %s",
+                            model_key,
+                            e,
                             exc_info=True,
                         )
                 self.clients.clear()
 
             logger.info(
-                f"Total tasks put: {self.tasks_put}, total task_done calls: {self.task_done_calls}"
+                "Total tasks put: %s, total task_done calls: %s",
+                self.tasks_put,
+                self.task_done_calls,
             )
 
     async def get_clients(self) -> dict[str, AsyncOpenAI]:
@@ -126,7 +128,7 @@ class ApiService:
         await self._initialize_client(model)
 
     async def check_api_connectivity(self, model: ModelType) -> bool:
-        logger.debug(f"Checking API connectivity for model {model.value}")
+        logger.debug("Checking API connectivity for model %s", model.value)
         try:
             client = await self._initialize_client(model)
             await asyncio.wait_for(
@@ -137,8 +139,8 @@ class ApiService:
                 ),
                 timeout=10,
             )
-            logger.info(f"API connectivity check passed for {model.value}")
+            logger.info("API connectivity check passed for %s", model.value)
             return True
         except Exception as e:
-            logger.error(f"API connectivity check failed for {model.value}: {str(e)}")
+            logger.error("API connectivity check failed for %s: %s", model.value, e)
             return False
@@ -1,43 +1,39 @@
-import asyncio
 import logging
-import re
-import subprocess
+import os
 from typing import Any, Dict, Optional
 
-import yt_dlp
 from pydantic import HttpUrl
 
+from core.brevio.services.media_metadata_service import MediaMetadataService
+from core.brevio.services.media_probe_service import MediaProbeService
+
 logger = logging.getLogger(__name__)
 
 
 class AudioService:
+    def __init__(
+        self,
+        metadata_service: Optional[MediaMetadataService] = None,
+        probe_service: Optional[MediaProbeService] = None,
+    ) -> None:
+        self._metadata = metadata_service or MediaMetadataService.shared()
+        self._probe = probe_service or MediaProbeService.shared()
+
     async def get_media_info(self, file_path: str) -> Optional[Dict[str, Any]]:
         try:
             logger.info(f"Processing media file: {file_path}")
-            loop = asyncio.get_running_loop()
-            result = await loop.run_in_executor(
-                None,
-                lambda: subprocess.run(
-                    ["ffmpeg", "-i", file_path, "-hide_banner"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                ),
-            )
+            probe = await self._probe.probe(file_path)
 
-            title = file_path.split("/")[-1].replace(".mp3", "")
+            title = os.path.splitext(os.path.basename(file_path))[0]
             logger.debug(f"Extracted title: {title}")
 
-            for line in result.stderr.split("\n"):
-                match = re.search(r"Duration:\s(\d+):(\d+):([\d.]+)", line)
-                if match:
-                    hours, minutes, seconds = map(float, match.groups())
-                    duration = (hours * 3600 + minutes * 60 + seconds) / 60
-                    logger.debug(f"Calculated duration: {duration} minutes")
-                    return {"title": title, "duration": duration}
+            if probe.duration <= 0:
+                logger.warning(f"No duration found in file: {file_path}")
+                return None
 
-            logger.warning(f"No duration found in file: {file_path}")
-            return None
+            duration = probe.duration / 60
+            logger.debug(f"Calculated duration: {duration} minutes")
+            return {"title": title, "duration": duration}
 
         except Exception as e:
             logger.error(f"Error processing file {file_path}: {str(e)}", exc_info=True)
@@ -48,23 +44,14 @@ class AudioService:
     async def get_media_info_yt(self, url: HttpUrl) -> Optional[Dict[str, Any]]:
         try:
             logger.info(f"Fetching YouTube media info from URL: {url}")
-            ydl_opts = {
-                "quiet": True,
-                "skip_download": True,
-                "ignoreerrors": True,
-            }
-
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = await asyncio.to_thread(
-                    ydl.extract_info, str(url), download=False
-                )
-                if not info:
-                    logger.warning(f"No info extracted from YouTube URL: {url}")
-                    return None
-
-                result = {"title": info.get("title"), "duration": info.get("duration")}
-                logger.debug(f"Extracted YouTube info: {result}")
-                return result
+            info = await self._metadata.get_video(url)
+            if not info:
+                logger.warning(f"No info extracted from YouTube URL: {url}")
+                return None
+
+            result = {"title": info.get("title"), "duration": info.get("duration")}
+            logger.debug(f"Extracted YouTube info: {result}")
+            return result
 
         except Exception as e:
             logger.error(
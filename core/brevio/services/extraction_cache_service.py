@@ -0,0 +1,148 @@
+import asyncio
+import json
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional
+
+from core.brevio.constants.constants import Constants
+from core.brevio.models.extraction_cache_model import ExtractionCacheEntry
+from core.shared.utils.gzip_store_utils import GzipEntryWriter, GzipJsonStore
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionCacheService:
+    """On-disk cache of extracted document text keyed by the upload's SHA-256.
+
+    Each entry is a gzip-compressed JSON file under ``cache_dir`` holding the
+    text, the page boundaries and the token counts already computed for each
+    encoder. Reads refresh the entry's modification time and, once the cache
+    exceeds ``max_bytes``, the least recently used entries are evicted.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ) -> None:
+        self.cache_dir = Path(
+            cache_dir
+            or os.getenv("EXTRACTION_CACHE_DIR")
+            or os.path.join(Constants.DESTINATION_FOLDER, ".extraction_cache")
+        )
+        self.max_bytes = (
+            max_bytes
+            if max_bytes is not None
+            else int(os.getenv("EXTRACTION_CACHE_MAX_MB", 512)) * 1024 * 1024
+        )
+        self.enabled = (
+            enabled
+            if enabled is not None
+            else os.getenv("EXTRACTION_CACHE", "true").lower() == "true"
+        )
+        self._store = GzipJsonStore(self.cache_dir, ExtractionCacheEntry)
+        self._lock = asyncio.Lock()
+
+    def _usable(self, content_hash: str) -> bool:
+        return self.enabled and self._store.is_key(content_hash)
+
+    async def get(self, content_hash: str) -> Optional[ExtractionCacheEntry]:
+        if not self._usable(content_hash):
+            return None
+        entry = await asyncio.to_thread(self._store.read, content_hash)
+        logger.info(
+            "Extraction cache %s for %s", "hit" if entry else "miss", content_hash
+        )
+        return entry
+
+    async def put(self, content_hash: str, entry: ExtractionCacheEntry) -> None:
+        if not self._usable(content_hash):
+            return
+        async with self._lock:
+            try:
+                await asyncio.to_thread(self._store.write, content_hash, entry)
+                await asyncio.to_thread(self._store.evict, self.max_bytes)
+            except OSError as e:
+                logger.warning("Could not store extraction cache entry: %s", e)
+
+    def page_writer(self, content_hash: str) -> Optional["ExtractionCacheWriter"]:
+        """A writer that caches the pages of a document while they stream, or
+        None when ``content_hash`` cannot be cached."""
+        if not self._usable(content_hash):
+            return None
+        return ExtractionCacheWriter(self, content_hash)
+
+    async def _publish(self, writer: GzipEntryWriter) -> None:
+        async with self._lock:
+            try:
+                await asyncio.to_thread(writer.commit)
+                await asyncio.to_thread(self._store.evict, self.max_bytes)
+            except OSError as e:
+                logger.warning("Could not store extraction cache entry: %s", e)
+
+    async def add_token_count(
+        self, content_hash: str, encoder_name: str, tokens: int
+    ) -> None:
+        """Record the token count of an already cached text for another encoder."""
+        entry = await self.get(content_hash)
+        if entry is not None and encoder_name not in entry.token_counts:
+            entry.token_counts[encoder_name] = tokens
+            await self.put(content_hash, entry)
+
+
+class ExtractionCacheWriter:
+    """Writes the pages of one document into the cache as they are extracted.
+
+    The entry is serialized page by page into a gzip temporary file, in the
+    same JSON layout as ``ExtractionCacheEntry``, so the document is never
+    held in memory; ``commit`` publishes it with its token count.
+    """
+
+    def __init__(self, cache: ExtractionCacheService, content_hash: str) -> None:
+        self._cache = cache
+        self._content_hash = content_hash
+        self._writer: Optional[GzipEntryWriter] = None
+        self._page_offsets: List[int] = []
+        self._position = 0
+        self._failed = False
+
+    async def _write(self, data: str) -> None:
+        if self._failed:
+            return
+        try:
+            if self._writer is None:
+                self._writer = await asyncio.to_thread(
+                    self._cache._store.writer, self._content_hash
+                )
+                data = '{"text":"' + data
+            await asyncio.to_thread(self._writer.write, data.encode("utf-8"))
+        except OSError as e:
+            logger.warning("Could not write extraction cache entry: %s", e)
+            self._failed = True
+            self.discard()
+
+    async def add_page(self, page: str) -> None:
+        separator = "\\n" if self._page_offsets else ""
+        self._page_offsets.append(self._position)
+        self._position += len(page) + 1
+        # json.dumps escapes the page as a JSON string; drop its quotes.
+        await self._write(separator + json.dumps(page)[1:-1])
+
+    async def commit(self, encoder_name: str, tokens: int) -> None:
+        await self._write(
+            '","page_offsets":'
+            + json.dumps(self._page_offsets or [0])
+            + ',"token_counts":'
+            + json.dumps({encoder_name: tokens})
+            + "}"
+        )
+        if self._writer is not None and not self._failed:
+            writer, self._writer = self._writer, None
+            await self._cache._publish(writer)
+
+    def discard(self) -> None:
+        if self._writer is not None:
+            writer, self._writer = self._writer, None
+            writer.discard()
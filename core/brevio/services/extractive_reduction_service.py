@@ -0,0 +1,116 @@
+import logging
+import re
+from typing import List
+
+import numpy as np
+
+from core.brevio.enums.summary_level import KEEP_RATIO_BY_SUMMARY_LEVEL, SummaryLevel
+
+logger = logging.getLogger(__name__)
+
+_SECTION_SPLIT = re.compile(r"\n\s*\n")
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?。！？])\s+")
+_LINE_BREAK = re.compile(r"\s*\n\s*")
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+class ExtractiveReductionService:
+    """CPU-only TextRank pre-reduction applied before ``chunk_text``.
+
+    The text is split into sections (blank-line separated blocks merged up to
+    ``max_section_sentences``) and, inside each section, sentences are scored by
+    TextRank over a TF-IDF cosine-similarity graph. The top ``keep_ratio`` of
+    sentences of every section is kept in its original order, so the outline of
+    the document survives while redundant sentences are dropped.
+
+    Single line breaks inside a block are hard wraps (as in PDF pages) and are
+    joined before splitting on terminal punctuation; transcripts, whose lines
+    rarely end in punctuation, are reduced with ``by_line`` instead.
+    """
+
+    def __init__(
+        self,
+        max_section_sentences: int = 300,
+        damping: float = 0.85,
+        iterations: int = 30,
+    ) -> None:
+        self.max_section_sentences = max_section_sentences
+        self.damping = damping
+        self.iterations = iterations
+
+    def reduce(
+        self, text: str, summary_level: SummaryLevel, by_line: bool = False
+    ) -> str:
+        keep_ratio = KEEP_RATIO_BY_SUMMARY_LEVEL[summary_level]
+        if keep_ratio >= 1:
+            return text
+
+        kept_sections = [
+            " ".join(self._reduce_section(sentences, keep_ratio))
+            for sentences in self._split_sections(text, by_line)
+        ]
+        return "\n\n".join(section for section in kept_sections if section)
+
+    def _split_sections(self, text: str, by_line: bool = False) -> List[List[str]]:
+        sections: List[List[str]] = []
+        current: List[str] = []
+        for block in _SECTION_SPLIT.split(text):
+            pieces = block.splitlines() if by_line else [_LINE_BREAK.sub(" ", block)]
+            sentences = [
+                s.strip()
+                for piece in pieces
+                for s in _SENTENCE_SPLIT.split(piece)
+                if s.strip()
+            ]
+            if current and len(current) + len(sentences) > self.max_section_sentences:
+                sections.append(current)
+                current = []
+            current.extend(sentences)
+            while len(current) > self.max_section_sentences:
+                sections.append(current[: self.max_section_sentences])
+                current = current[self.max_section_sentences :]
+        if current:
+            sections.append(current)
+        return sections
+
+    def _reduce_section(self, sentences: List[str], keep_ratio: float) -> List[str]:
+        keep = max(1, round(len(sentences) * keep_ratio))
+        if keep >= len(sentences):
+            return sentences
+        scores = self.score_sentences(sentences)
+        selected = np.sort(np.argsort(-scores, kind="stable")[:keep])
+        return [sentences[i] for i in selected]
+
+    def score_sentences(self, sentences: List[str]) -> np.ndarray:
+        """Return a TextRank score per sentence."""
+        tokenized = [_WORD.findall(sentence.lower()) for sentence in sentences]
+        vocabulary, term_ids = np.unique(
+            np.array([word for words in tokenized for word in words] or [""]),
+            return_inverse=True,
+        )
+        n = len(sentences)
+        lengths = np.array([len(words) for words in tokenized])
+        rows = np.repeat(np.arange(n), lengths)
+
+        tf = np.zeros((n, len(vocabulary)), dtype=np.float32)
+        np.add.at(tf, (rows, term_ids[: rows.size]), 1.0)
+        document_frequency = np.count_nonzero(tf, axis=0)
+        idf = np.log((1 + n) / (1 + document_frequency)) + 1
+        tfidf = tf * idf.astype(np.float32)
+        norms = np.linalg.norm(tfidf, axis=1, keepdims=True)
+        tfidf /= np.where(norms == 0, 1, norms)
+
+        similarity = tfidf @ tfidf.T
+        np.fill_diagonal(similarity, 0)
+        out_weight = similarity.sum(axis=1, keepdims=True)
+        transition = np.divide(
+            similarity,
+            out_weight,
+            out=np.full_like(similarity, 1 / n),
+            where=out_weight > 0,
+        )
+
+        scores = np.full(n, 1 / n, dtype=np.float32)
+        for _ in range(self.iterations):
+            scores = (1 - self.damping) / n + self.damping * (transition.T @ scores)
+        return scores
@@ -0,0 +1,134 @@
+import logging
+import os
+import subprocess
+import tempfile
+from typing import BinaryIO, Optional
+
+import numpy as np
+
+from core.shared.utils.audio_segment_utils import SAMPLE_RATE
+
+logger = logging.getLogger(__name__)
+
+# Audio longer than this is spilled to a memory-mapped .npy instead of RAM.
+MEDIA_DECODE_MMAP_SECONDS = float(os.getenv("MEDIA_DECODE_MMAP_SECONDS", 3600))
+_READ_BYTES = 1 << 20
+_SAMPLE_BYTES = 4
+
+
+def _write_npy_header(fp: BinaryIO, samples: int) -> None:
+    # numpy pads the header so that the shape can grow in place, which lets
+    # the header be written first and rewritten once the length is known.
+    np.lib.format.write_array_header_1_0(
+        fp, {"descr": "<f4", "fortran_order": False, "shape": (samples,)}
+    )
+
+
+class MediaDecodeService:
+    """Decodes media once with ffmpeg into 16 kHz mono float32 PCM.
+
+    ffmpeg writes raw samples to a pipe that is read straight into a NumPy
+    buffer, so no intermediate audio file is written. Audio longer than
+    ``mmap_seconds`` is spilled to a memory-mapped ``.npy`` so that it does not
+    have to fit in RAM and worker processes can open it without copying.
+    VAD, segmentation and transcription all work on views of the result.
+    """
+
+    def __init__(self, mmap_seconds: Optional[float] = None) -> None:
+        self.mmap_seconds = (
+            mmap_seconds if mmap_seconds is not None else MEDIA_DECODE_MMAP_SECONDS
+        )
+
+    @staticmethod
+    def mmap_path_for(path: str) -> str:
+        return f"{os.path.splitext(path)[0]}.pcm.npy"
+
+    def decode(
+        self,
+        path: str,
+        mmap_path: Optional[str] = None,
+        mmap_seconds: Optional[float] = None,
+    ) -> np.ndarray:
+        """Decode ``path`` to a float32 array.
+
+        With ``mmap_path`` the samples move to that file once more than
+        ``mmap_seconds`` (the service default) have been decoded, and the
+        result is a copy-on-write memory map of it; 0 always maps.
+        """
+        limit = self.mmap_seconds if mmap_seconds is None else mmap_seconds
+        spill_bytes = int(limit * SAMPLE_RATE) * _SAMPLE_BYTES
+        errors = tempfile.TemporaryFile()
+        process = subprocess.Popen(
+            [
+                "ffmpeg",
+                "-hide_banner",
+                "-loglevel",
+                "error",
+                "-nostdin",
+                "-i",
+                path,
+                "-f",
+                "f32le",
+                "-ac",
+                "1",
+                "-ar",
+                str(SAMPLE_RATE),
+                "-",
+            ],
+            stdout=subprocess.PIPE,
+            # A file rather than a pipe: ffmpeg can log enough on damaged
+            # input to fill a pipe nobody reads until the end.
+            stderr=errors,
+        )
+        assert process.stdout is not None
+        buffer = bytearray()
+        spill: Optional[BinaryIO] = None
+        header_bytes = written = 0
+        try:
+            while chunk := process.stdout.read(_READ_BYTES):
+                if spill is None:
+                    buffer += chunk
+                    if mmap_path is None or len(buffer) <= spill_bytes:
+                        continue
+                    spill = open(mmap_path, "wb")
+                    _write_npy_header(spill, 0)
+                    header_bytes = spill.tell()
+                    chunk, buffer = buffer, bytearray()
+                spill.write(chunk)
+                written += len(chunk)
+            if process.wait() != 0:
+                errors.seek(0)
+                message = errors.read().decode(errors="replace")[-300:].strip()
+                raise RuntimeError(f"ffmpeg no pudo decodificar {path}: {message}")
+        except BaseException:
+            process.kill()
+            process.wait()
+            if spill is not None:
+                spill.close()
+                os.remove(mmap_path)  # type: ignore[arg-type]
+            raise
+        finally:
+            process.stdout.close()
+            errors.close()
+
+        if spill is None:
+            samples = len(buffer) // _SAMPLE_BYTES
+            logger.debug("Decoded %s in memory (%.1f s)", path, samples / SAMPLE_RATE)
+            return np.frombuffer(buffer, np.float32, count=samples)
+
+        assert mmap_path is not None  # spilling only happens with a path
+        samples = written // _SAMPLE_BYTES
+        with spill:
+            spill.truncate(header_bytes + samples * _SAMPLE_BYTES)
+            spill.seek(0)
+            _write_npy_header(spill, samples)
+            if spill.tell() != header_bytes:
+                raise RuntimeError(f"Unexpected .npy header size for {mmap_path}")
+        logger.debug(
+            "Decoded %s to memory map %s (%.1f s)",
+            path,
+            mmap_path,
+            samples / SAMPLE_RATE,
+        )
+        decoded: np.ndarray = np.load(mmap_path, mmap_mode="c")
+        return decoded
@@ -0,0 +1,265 @@
+import asyncio
+import itertools
+import logging
+import os
+import threading
+from typing import Any, AsyncGenerator, Dict, Iterator, List, NamedTuple, Optional
+
+import yt_dlp
+from pydantic import HttpUrl
+
+from core.shared.utils.ttl_cache_utils import SharedTTLCache
+
+logger = logging.getLogger(__name__)
+
+MEDIA_METADATA_TTL_SECONDS = float(os.getenv("MEDIA_METADATA_TTL_SECONDS", 6 * 3600))
+# Shared by the API and the Celery workers; unset keeps the cache per process.
+MEDIA_METADATA_REDIS_URL = os.getenv("MEDIA_METADATA_REDIS_URL") or os.getenv(
+    "REDIS_URL"
+)
+# Playlist entries extracted ahead of the consumer; the extractor stops paging
+# while this many are waiting.
+PLAYLIST_PREFETCH_WINDOW = max(1, int(os.getenv("PLAYLIST_PREFETCH_WINDOW", 50)))
+
+
+class _PlaylistEnd(NamedTuple):
+    """Last item handed over by the playlist pager."""
+
+    title: Optional[str]
+
+
+class MediaMetadataService:
+    """yt-dlp metadata of online media, extracted once per URL.
+
+    Videos are cached as ``{"title", "duration"}`` (seconds) and playlists as
+    ``{"title", "entries": [{"url", "title", "duration"}]}`` from a flat
+    extraction, for ``ttl_seconds``. Concurrent requests for the same URL in
+    one event loop share a single extraction. Failed extractions are not
+    cached and their errors reach the caller.
+    """
+
+    _shared: Optional["MediaMetadataService"] = None
+
+    def __init__(
+        self,
+        cache: Optional[SharedTTLCache] = None,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        self.cache = cache or SharedTTLCache(
+            "brevio:media-metadata", MEDIA_METADATA_REDIS_URL
+        )
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None else MEDIA_METADATA_TTL_SECONDS
+        )
+        self._inflight: Dict[str, "asyncio.Task[Optional[Dict[str, Any]]]"] = {}
+
+    @classmethod
+    def shared(cls) -> "MediaMetadataService":
+        """Process-wide instance used by the services that need metadata."""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    async def get_video(self, url: HttpUrl) -> Optional[Dict[str, Any]]:
+        return await self._get(str(url), playlist=False)
+
+    async def get_playlist(self, url: HttpUrl) -> Optional[Dict[str, Any]]:
+        return await self._get(str(url), playlist=True)
+
+    async def iter_playlist(
+        self, url: HttpUrl, start: int = 0, limit: Optional[int] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Yield the flat entries ``{"url", "title", "duration"}`` of a playlist,
+        skipping the first ``start`` and stopping after ``limit``.
+
+        Entries come out while the extractor pages through the playlist, at
+        most ``PLAYLIST_PREFETCH_WINDOW`` ahead of the consumer. A cached
+        playlist is served from the cache; a complete enumeration is cached
+        like ``get_playlist`` would.
+        """
+        key = f"playlist:{url}"
+        cached = await asyncio.to_thread(self.cache.get, key)
+        if cached is not None:
+            stop = start + limit if limit is not None else None
+            for entry in cached["entries"][start:stop]:
+                yield entry
+            return
+
+        # The pager runs in its own thread and hands entries to the loop with
+        # call_soon_threadsafe, so a long enumeration holds no thread of the
+        # default executor, neither for paging nor for waiting on entries.
+        loop = asyncio.get_running_loop()
+        window: "asyncio.Queue[Any]" = asyncio.Queue()
+        slots = threading.Semaphore(PLAYLIST_PREFETCH_WINDOW)
+        closed = threading.Event()
+        complete = start == 0 and limit is None
+        threading.Thread(
+            target=self._sync_page_playlist,
+            args=(str(url), start, limit, loop, window, slots, closed),
+            name="playlist-pager",
+            daemon=True,
+        ).start()
+        entries: List[Dict[str, Any]] = []
+        try:
+            while True:
+                item = await window.get()
+                slots.release()
+                if isinstance(item, _PlaylistEnd):
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                if complete:
+                    entries.append(item)
+                yield item
+            if complete:
+                metadata = {"title": item.title, "entries": entries}
+                await asyncio.to_thread(self.cache.set, key, metadata, self.ttl_seconds)
+        finally:
+            closed.set()
+
+    @staticmethod
+    def _sync_page_playlist(
+        url: str,
+        start: int,
+        limit: Optional[int],
+        loop: asyncio.AbstractEventLoop,
+        window: "asyncio.Queue[Any]",
+        slots: threading.Semaphore,
+        closed: threading.Event,
+    ) -> None:
+        def put(item: Any) -> bool:
+            # Waits while PLAYLIST_PREFETCH_WINDOW entries are pending,
+            # giving up once the consumer has gone away.
+            while not closed.is_set():
+                if not slots.acquire(timeout=0.5):
+                    continue
+                try:
+                    loop.call_soon_threadsafe(window.put_nowait, item)
+                except RuntimeError:  # The event loop is closed.
+                    return False
+                return True
+            return False
+
+        title: Optional[str] = None
+        try:
+            ydl_opts: Dict[str, Any] = {
+                "quiet": True,
+                "skip_download": True,
+                "ignoreerrors": True,
+                "extract_flat": "in_playlist",
+            }
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                info = MediaMetadataService._resolve_unprocessed(ydl, url)
+                title = info.get("title") if info else None
+                for entry in itertools.islice(
+                    MediaMetadataService._flat_entries(url, info),
+                    start,
+                    start + limit if limit is not None else None,
+                ):
+                    if not put(entry):
+                        return
+        except Exception as e:
+            put(e)
+        put(_PlaylistEnd(title))
+
+    @staticmethod
+    def _resolve_unprocessed(ydl: Any, url: str) -> Optional[Dict[str, Any]]:
+        # Without processing, yt-dlp hands back redirects (e.g. watch?list= to
+        # the playlist page) and a lazy ``entries`` iterator that fetches
+        # pages on demand.
+        info: Optional[Dict[str, Any]] = ydl.extract_info(
+            url, download=False, process=False
+        )
+        for _ in range(5):
+            if not info or info.get("_type") not in ("url", "url_transparent"):
+                break
+            info = ydl.extract_info(
+                info["url"], download=False, process=False, ie_key=info.get("ie_key")
+            )
+        return info
+
+    @staticmethod
+    def _flat_entries(
+        url: str, info: Optional[Dict[str, Any]]
+    ) -> Iterator[Dict[str, Any]]:
+        if not info:
+            return
+        if "entries" not in info:
+            # Not a playlist: the URL is the only entry.
+            yield {
+                "url": url,
+                "title": info.get("title"),
+                "duration": info.get("duration"),
+            }
+            return
+        for entry in info.get("entries") or []:
+            if entry and "url" in entry:
+                yield {
+                    "url": entry["url"],
+                    "title": entry.get("title"),
+                    "duration": entry.get("duration"),
+                }
+
+    async def _get(self, url: str, playlist: bool) -> Optional[Dict[str, Any]]:
+        key = f"{'playlist' if playlist else 'video'}:{url}"
+        cached = await asyncio.to_thread(self.cache.get, key)
+        if cached is not None:
+            logger.debug("Media metadata cache hit for %s", key)
+            return dict(cached)
+
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._extract(key, url, playlist))
+            self._inflight[key] = task
+
+            def forget(done: "asyncio.Task[Optional[Dict[str, Any]]]") -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+
+            task.add_done_callback(forget)
+        metadata = await asyncio.shield(task)
+        return dict(metadata) if metadata is not None else None
+
+    async def _extract(
+        self, key: str, url: str, playlist: bool
+    ) -> Optional[Dict[str, Any]]:
+        logger.info("Extracting media metadata for %s", key)
+        info = await asyncio.to_thread(self._sync_extract, url, playlist)
+        if not info:
+            return None
+        metadata: Dict[str, Any] = {"title": info.get("title")}
+        if playlist:
+            metadata["entries"] = [
+                {
+                    "url": entry["url"],
+                    "title": entry.get("title"),
+                    "duration": entry.get("duration"),
+                }
+                for entry in info.get("entries") or []
+                if entry and "url" in entry
+            ]
+            if "entries" not in info:
+                # Not a playlist: a flat extraction resolves the video itself.
+                metadata["duration"] = info.get("duration")
+        else:
+            metadata["duration"] = info.get("duration")
+        await asyncio.to_thread(self.cache.set, key, metadata, self.ttl_seconds)
+        return metadata
+
+    @staticmethod
+    def _sync_extract(url: str, playlist: bool) -> Optional[Dict[str, Any]]:
+        ydl_opts: Dict[str, Any] = {
+            "quiet": True,
+            "skip_download": True,
+            "ignoreerrors": True,
+        }
+        if playlist:
+            ydl_opts["extract_flat"] = "in_playlist"
+        else:
+            ydl_opts["noplaylist"] = True
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info: Optional[Dict[str, Any]] = ydl.extract_info(url, download=False)
+            return info
+
+    def clear(self) -> None:
+        self.cache.clear()
@@ -0,0 +1,111 @@
+import asyncio
+import json
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple, Union
+
+from core.brevio.models.media_probe_model import MediaProbe
+from core.brevio.services.media_metadata_service import MEDIA_METADATA_REDIS_URL
+from core.shared.utils.ttl_cache_utils import SharedTTLCache
+
+logger = logging.getLogger(__name__)
+
+MEDIA_PROBE_CONCURRENCY = max(1, int(os.getenv("MEDIA_PROBE_CONCURRENCY", 8)))
+MEDIA_PROBE_TTL_SECONDS = float(os.getenv("MEDIA_PROBE_TTL_SECONDS", 7 * 86400))
+
+PathLike = Union[str, Path]
+
+
+class MediaProbeService:
+    """Duration, container and audio stream of media files, via one ``ffprobe``.
+
+    Results are cached by content hash when the caller knows it (uploads) and
+    otherwise by path, size and modification time, in the same shared store as
+    the online media metadata. At most ``concurrency`` ffprobe processes run at
+    once per event loop.
+    """
+
+    _shared: Optional["MediaProbeService"] = None
+
+    def __init__(
+        self,
+        cache: Optional[SharedTTLCache] = None,
+        concurrency: Optional[int] = None,
+    ) -> None:
+        self.cache = cache or SharedTTLCache(
+            "brevio:media-probe", MEDIA_METADATA_REDIS_URL
+        )
+        self.concurrency = concurrency or MEDIA_PROBE_CONCURRENCY
+        self._slots: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = (
+            None
+        )
+
+    @classmethod
+    def shared(cls) -> "MediaProbeService":
+        """Process-wide instance used by the services that probe media."""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def _slot(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots[0] is not loop:
+            self._slots = (loop, asyncio.Semaphore(self.concurrency))
+        return self._slots[1]
+
+    @staticmethod
+    def _key(path: PathLike, content_hash: Optional[str]) -> str:
+        if content_hash:
+            return f"sha256:{content_hash}"
+        stat = os.stat(path)
+        return f"file:{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    async def probe(
+        self, path: PathLike, content_hash: Optional[str] = None
+    ) -> MediaProbe:
+        key = await asyncio.to_thread(self._key, path, content_hash)
+        cached = await asyncio.to_thread(self.cache.get, key)
+        if cached is not None:
+            return MediaProbe.model_validate(cached)
+
+        async with self._slot():
+            process = await asyncio.create_subprocess_exec(
+                "ffprobe",
+                "-v",
+                "error",
+                "-select_streams",
+                "a:0",
+                "-show_format",
+                "-show_streams",
+                "-of",
+                "json",
+                str(path),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            stdout, stderr = await process.communicate()
+        if process.returncode != 0:
+            raise RuntimeError(
+                f"ffprobe falló en {path}: {stderr.decode(errors='replace').strip()}"
+            )
+        try:
+            probe = MediaProbe.from_ffprobe(json.loads(stdout))
+        except (KeyError, TypeError, ValueError) as e:
+            raise RuntimeError(f"Error al obtener la duración de {path}: {e}") from e
+
+        logger.debug("Probed %s: %s", path, probe)
+        await asyncio.to_thread(
+            self.cache.set, key, probe.model_dump(), MEDIA_PROBE_TTL_SECONDS
+        )
+        return probe
+
+    async def probe_many(
+        self, files: Sequence[Tuple[PathLike, Optional[str]]]
+    ) -> List[MediaProbe]:
+        """Probe ``(path, content_hash)`` pairs concurrently, in order."""
+        return list(
+            await asyncio.gather(
+                *[self.probe(path, content_hash) for path, content_hash in files]
+            )
+        )
@@ -0,0 +1,77 @@
+import logging
+import os
+from typing import Dict, Optional
+
+from core.shared.enums.model import ModelType
+from core.shared.enums.pipeline_stage import PipelineStage
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_model(value: str) -> ModelType:
+    try:
+        return ModelType(value.strip())
+    except ValueError:
+        raise ValueError(f"Unknown model in routing configuration: {value!r}")
+
+
+def _parse_fallbacks(spec: str) -> Dict[ModelType, ModelType]:
+    """Parse ``MODEL_FALLBACKS`` entries such as ``gpt-4=gpt-4o-mini``."""
+    fallbacks: Dict[ModelType, ModelType] = {}
+    for entry in spec.split(","):
+        source, sep, target = entry.partition("=")
+        if sep and source.strip():
+            fallbacks[_parse_model(source)] = _parse_model(target)
+    return fallbacks
+
+
+class ModelRouterService:
+    """Choose the model used by each pipeline stage.
+
+    By default every stage uses the model selected by the user. A stage can be
+    pinned to another model with ``MODEL_ROUTE_<STAGE>`` (for example
+    ``MODEL_ROUTE_MAP=gpt-4o-mini`` to summarise chunks with a cheaper model
+    while the postprocess keeps the user's model), and ``MODEL_FALLBACKS``
+    lists the model to switch to once retries on rate limits are exhausted.
+    """
+
+    def __init__(
+        self,
+        stage_models: Optional[Dict[PipelineStage, ModelType]] = None,
+        fallbacks: Optional[Dict[ModelType, ModelType]] = None,
+    ) -> None:
+        if stage_models is None:
+            stage_models = {}
+            for stage in PipelineStage:
+                value = os.getenv(f"MODEL_ROUTE_{stage.name}", "").strip()
+                if value:
+                    stage_models[stage] = _parse_model(value)
+        if fallbacks is None:
+            fallbacks = _parse_fallbacks(os.getenv("MODEL_FALLBACKS", ""))
+
+        self.stage_models = stage_models
+        self.fallbacks = fallbacks
+        self._validate_fallbacks()
+        logger.debug(
+            "Model routing: stages=%s, fallbacks=%s",
+            {stage.value: model.value for stage, model in stage_models.items()},
+            {source.value: target.value for source, target in fallbacks.items()},
+        )
+
+    def _validate_fallbacks(self) -> None:
+        for start in self.fallbacks:
+            seen = {start}
+            current = self.fallbacks.get(start)
+            while current is not None:
+                if current in seen:
+                    raise ValueError(
+                        f"Model fallback chain starting at {start.value} is cyclic"
+                    )
+                seen.add(current)
+                current = self.fallbacks.get(current)
+
+    def resolve(self, stage: PipelineStage, requested: ModelType) -> ModelType:
+        return self.stage_models.get(stage, requested)
+
+    def fallback_for(self, model: ModelType) -> Optional[ModelType]:
+        return self.fallbacks.get(model)
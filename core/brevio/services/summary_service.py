@@ -1,9 +1,20 @@
 import asyncio
+import copy
 import logging
 import os
 import time
-from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator, Callable, Coroutine, List, Optional, Tuple
+from contextlib import asynccontextmanager, suppress
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    Callable,
+    Coroutine,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import aiofiles
 import httpx
@@ -22,6 +33,7 @@ from openai import (
 from openai.types import CompletionUsage
 from openai.types.chat import ChatCompletion, ChatCompletionMessageParam
 from tenacity import (
+    RetryError,
     retry,
     retry_if_exception_type,
     stop_after_attempt,
@@ -33,31 +45,57 @@ from core.brevio.enums.category import CategoryType
 from core.brevio.enums.language import LanguageType
 from core.brevio.enums.role import RoleType
 from core.brevio.enums.style import StyleType
+from core.brevio.enums.summary_level import SummaryLevel
 from core.brevio.managers.directory_manager import DirectoryManager
+from core.brevio.managers.transcription_backends import whisper_language_code
+from core.brevio.models.extraction_cache_model import ExtractionCacheEntry
 from core.brevio.models.file_config_model import FileConfig
 from core.brevio.models.prompt_config_model import PromptConfig
 from core.brevio.models.response_model import SummaryResponse
+from core.brevio.models.transcription_stats_model import TranscriptionStats
 from core.shared.enums.model import ModelType
+from core.shared.enums.pipeline_stage import PipelineStage
 from core.shared.enums.type_call import TypeCall
 from core.shared.models.brevio.history_token_call import HistoryTokenCall
 from core.shared.models.history_token_model import HistoryTokenModel
 from core.shared.models.user.data_result import DataResult
 from core.shared.utils.json_data_utils import save_log_to_json
-from core.shared.utils.model_tokens_utils import get_encoder
+from core.shared.utils.logging_utils import should_sample
+from core.shared.utils.model_tokens_utils import encoder_name, get_encoder
 
 from .advanced_content_generator import AdvancedPromptGenerator
 from .api_service import ApiService
+from .extraction_cache_service import ExtractionCacheService, ExtractionCacheWriter
+from .extractive_reduction_service import ExtractiveReductionService
+from .model_router_service import ModelRouterService
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-logger.propagate = False
-if not logger.handlers:
-    handler = logging.StreamHandler()
-    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+
+
+async def _iterate_chunks(chunks: List[str]) -> AsyncGenerator[str, None]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def _cache_pages(
+    pages: AsyncIterable[str],
+    writer: ExtractionCacheWriter,
+    encoder_key: str,
+    tokens: Callable[[], int],
+) -> AsyncGenerator[str, None]:
+    """Pass ``pages`` through while ``writer`` caches them; the entry is
+    committed with ``tokens()`` once the pages run out, and dropped if they
+    are not consumed to the end."""
+    try:
+        async for page in pages:
+            await writer.add_page(page)
+            yield page
+    except BaseException:
+        writer.discard()
+        raise
+    await writer.commit(encoder_key, tokens())
 
 
 class SummaryService:
@@ -71,6 +109,7 @@ class SummaryService:
         self.max_concurrent_files = 1000
         self.max_concurrent_requests = 100000
         self.token_bucket = self.tokens_per_minute
+        self.limiter_wait_seconds = 0.0
 
         self.last_token_reset = time.time()
         self.task_queue: asyncio.Queue[
@@ -98,19 +137,45 @@ class SummaryService:
             self.running_tasks,
         )
         self.client: Optional[AsyncOpenAI] = None
+        self.client_model: Optional[ModelType] = None
+        self.model_router = ModelRouterService()
         self.directory_manager = DirectoryManager()
         self.MIN_TOKENS_FOR_POSTPROCESS = 2000
+        self.extractive_reduction_enabled = (
+            os.getenv("EXTRACTIVE_REDUCTION", "false").lower() == "true"
+        )
+        self.extractive_reduction_min_tokens = int(
+            os.getenv("EXTRACTIVE_REDUCTION_MIN_TOKENS", 20000)
+        )
+        self.extractive_reduction = ExtractiveReductionService()
+        self.extraction_cache = ExtractionCacheService()
         logger.debug(
-            f"Initialized with max_tokens={self.max_tokens}, "
-            f"max_tokens_per_chunk={self.max_tokens_per_chunk}, "
-            f"tokens_per_minute={self.tokens_per_minute}, "
-            f"temperature={self.temperature}, "
-            f"max_concurrent_files={self.max_concurrent_files}, "
-            f"max_concurrent_requests={self.max_concurrent_requests}, "
-            f"overlap={self._percent_chunk_overlap}, "
-            f"context_limit={self.context_token_limit}"
+            "Initialized with max_tokens=%s, max_tokens_per_chunk=%s, "
+            "tokens_per_minute=%s, temperature=%s, max_concurrent_files=%s, "
+            "max_concurrent_requests=%s, overlap=%s, context_limit=%s",
+            self.max_tokens,
+            self.max_tokens_per_chunk,
+            self.tokens_per_minute,
+            self.temperature,
+            self.max_concurrent_files,
+            self.max_concurrent_requests,
+            self._percent_chunk_overlap,
+            self.context_token_limit,
         )
 
+    def for_job(self) -> "SummaryService":
+        """A view of this service for one job run concurrently with others.
+
+        It shares the API clients, caches and queues, but records its token
+        history, active client and limiter wait on its own.
+        """
+        job = copy.copy(self)
+        job.history_token_model = HistoryTokenModel()
+        job.client = None
+        job.client_model = None
+        job.limiter_wait_seconds = 0.0
+        return job
+
     async def start(self) -> None:
         if not self.running:
             self.running = True
@@ -133,7 +198,8 @@ class SummaryService:
                     if not task.done():
                         task.cancel()
                         logger.debug(
-                            f"Cancelled task: {task.get_name() if hasattr(task, 'get_name') else 'unnamed'}"
+                            "Cancelled task: %s",
+                            task.get_name() if hasattr(task, "get_name") else "unnamed",
                         )
                 # Esperar a que se cancelen
                 if self.running_tasks:
@@ -147,12 +213,15 @@ class SummaryService:
         self, text: str, chunk_size: int, overlap: float, model: ModelType
     ) -> List[str]:
         logger.debug(
-            f"Chunking text of length {len(text)} with chunk_size={chunk_size}, overlap={overlap}"
+            "Chunking text of length %s with chunk_size=%s, overlap=%s",
+            len(text),
+            chunk_size,
+            overlap,
         )
         encoder = get_encoder(model)
         tokens = encoder.encode(text)
         input_tokens = len(tokens)
-        logger.debug(f"Encoded text to {input_tokens} tokens")
+        logger.debug("Encoded text to %s tokens", input_tokens)
 
         chunks = []
         chunk_token_counts = []
@@ -163,23 +232,59 @@ class SummaryService:
             chunk_tokens = tokens[start:end]
             chunk_text = encoder.decode(chunk_tokens)
             chunks.append(chunk_text)
-            chunk_token_count = len(encoder.encode(chunk_text))
-            chunk_token_counts.append(chunk_token_count)
-            logger.debug(
-                f"Created chunk {len(chunks)-1}: {chunk_token_count} tokens, preview={chunk_text[:50]}..."
-            )
+            chunk_token_counts.append(len(chunk_tokens))
+            if should_sample(logger, len(chunks) - 1):
+                logger.debug(
+                    "Created chunk %s: %s tokens, preview=%s...",
+                    len(chunks) - 1,
+                    len(chunk_tokens),
+                    chunk_text[:50],
+                )
 
             overlap_tokens = int(chunk_size * overlap)
             start = end - overlap_tokens if end - overlap_tokens > start else end
 
         logger.info(
-            f"Text split into {len(chunks)} chunks, "
-            f"total_input_tokens={input_tokens}, "
-            f"chunk_size={chunk_size}, overlap={overlap}, "
-            f"chunk_token_counts={chunk_token_counts}"
+            "Text split into %s chunks, total_input_tokens=%s, chunk_size=%s, "
+            "overlap=%s, chunk_token_counts=%s",
+            len(chunks),
+            input_tokens,
+            chunk_size,
+            overlap,
+            chunk_token_counts,
         )
         return chunks
 
+    async def _extractive_reduce(
+        self,
+        text: str,
+        input_tokens: int,
+        summary_level: SummaryLevel,
+        encoder: Any,
+        by_line: bool = False,
+    ) -> Tuple[str, int]:
+        if (
+            not self.extractive_reduction_enabled
+            or input_tokens < self.extractive_reduction_min_tokens
+        ):
+            return text, input_tokens
+
+        reduced_text = await asyncio.to_thread(
+            self.extractive_reduction.reduce, text, summary_level, by_line
+        )
+        reduced_tokens = len(encoder.encode(reduced_text))
+        self.history_token_model.extractive_input_tokens = input_tokens
+        self.history_token_model.extractive_output_tokens = reduced_tokens
+        logger.info(
+            "Extractive pre-reduction (%s): input_tokens=%s, output_tokens=%s, "
+            "reduction=%.1f%%",
+            summary_level.value,
+            input_tokens,
+            reduced_tokens,
+            100 * (1 - reduced_tokens / input_tokens) if input_tokens else 0,
+        )
+        return reduced_text, reduced_tokens
+
     async def _update_token_bucket(self) -> None:
         current_time = time.time()
         elapsed_minutes = (current_time - self.last_token_reset) / 60
@@ -189,35 +294,60 @@ class SummaryService:
                 self.token_bucket + int(self.tokens_per_minute * elapsed_minutes),
             )
             self.last_token_reset = current_time
-            logger.info(f"Token bucket updated: tokens_available={self.token_bucket}")
+            logger.info("Token bucket updated: tokens_available=%s", self.token_bucket)
 
     async def _check_token_limit(self, tokens_needed: int) -> bool:
         await self._update_token_bucket()
         safety_margin = self.tokens_per_minute * 0.1
         if self.token_bucket >= (tokens_needed + safety_margin):
             logger.debug(
-                f"Token check passed: needed={tokens_needed}, available={self.token_bucket}"
+                "Token check passed: needed=%s, available=%s",
+                tokens_needed,
+                self.token_bucket,
             )
             return True
         waited = 0
         max_wait = int(os.getenv("MAX_TOKEN_WAIT", 300))  # 5 minutos
-        while waited <= max_wait:
-            logger.warning(
-                f"Token limit reached: needed={tokens_needed}, available={self.token_bucket}, waiting 5 seconds (waited {waited}s)"
-            )
-            await asyncio.sleep(5)
-            await self._update_token_bucket()
-            if self.token_bucket >= (tokens_needed + safety_margin):
-                logger.debug(
-                    f"Token check passed after waiting: needed={tokens_needed}, available={self.token_bucket}"
+        wait_started = time.monotonic()
+        try:
+            while waited <= max_wait:
+                logger.warning(
+                    "Token limit reached: needed=%s, available=%s, "
+                    "waiting 5 seconds (waited %ss)",
+                    tokens_needed,
+                    self.token_bucket,
+                    waited,
                 )
-                return True
-            waited += 5
-        logger.error(f"Waited too long ({waited}s) for tokens, aborting")
+                await asyncio.sleep(5)
+                await self._update_token_bucket()
+                if self.token_bucket >= (tokens_needed + safety_margin):
+                    logger.debug(
+                        "Token check passed after waiting: needed=%s, available=%s",
+                        tokens_needed,
+                        self.token_bucket,
+                    )
+                    return True
+                waited += 5
+        finally:
+            self.limiter_wait_seconds += time.monotonic() - wait_started
+        logger.error("Waited too long (%ss) for tokens, aborting", waited)
         raise TimeoutError(
             f"Could not acquire {tokens_needed} tokens after {max_wait}s"
         )
 
+    async def _get_client(self, model: ModelType) -> AsyncOpenAI:
+        if not self.client:
+            raise ValueError("Client not initialized")
+        if self.client_model is None or self.client_model == model:
+            return self.client
+        return await self.api_service._initialize_client(model)
+
+    @staticmethod
+    def _is_rate_limit_exhausted(error: BaseException) -> bool:
+        if isinstance(error, RetryError):
+            error = error.last_attempt.exception() or error
+        return isinstance(error, RateLimitError)
+
     @retry(
         wait=wait_exponential(multiplier=2, min=1, max=30),
         stop=stop_after_attempt(8),
@@ -245,17 +375,22 @@ class SummaryService:
 
         if retries > MAX_RETRIES_PER_CHUNK:
             logger.error(
-                f"Chunk {index} alcanzó máximo de retries ({MAX_RETRIES_PER_CHUNK}), descartado"
+                "Chunk %s alcanzó máximo de retries (%s), descartado",
+                index,
+                MAX_RETRIES_PER_CHUNK,
             )
             return index, None, 0
 
-        logger.info(
-            f"Processing chunk {index} (retry={retries}) for model {model.value}"
-        )
+        if should_sample(logger, index):
+            logger.debug(
+                "Processing chunk %s (retry=%s) for model %s",
+                index,
+                retries,
+                model.value,
+            )
 
         try:
             encoder = get_encoder(model)
-            chunk_tokens = len(encoder.encode(chunk))
             summary_tokens = encoder.encode(accumulated_summary)
             truncated_tokens = (
                 summary_tokens[-self.context_token_limit :]
@@ -280,12 +415,11 @@ class SummaryService:
                 {"role": RoleType.USER.value, "content": chunk},
             ]
 
-            if not self.client:
-                raise ValueError("Client not initialized")
+            client = await self._get_client(model)
 
             try:
                 response: ChatCompletion = await asyncio.wait_for(
-                    self.client.chat.completions.create(
+                    client.chat.completions.create(
                         model=model.value,
                         messages=messages,
                         max_tokens=self.max_tokens,
@@ -300,20 +434,17 @@ class SummaryService:
                     if response.usage is not None
                     else 0
                 )
-                self.history_token_model.history_tokens_per_call.append(
+                self.history_token_model.record_call(
                     HistoryTokenCall(
                         type_call=TypeCall.SUMMARY,
                         system_prompt_tokens=system_tokens,
                         user_prompt_tokens=user_tokens,
                         response_tokens=output_tokens,
+                        model=model,
                     )
                 )
-                self.history_token_model.total_tokens_summary_input += (
-                    system_tokens + user_tokens
-                )
-                self.history_token_model.total_tokens_summary_output += output_tokens
             except asyncio.TimeoutError:
-                logger.warning(f"Timeout processing chunk {index}, requeueing...")
+                logger.warning("Timeout processing chunk %s, requeueing...", index)
                 await self._requeue_chunk(
                     index,
                     chunk,
@@ -325,16 +456,16 @@ class SummaryService:
                 )
                 return index, None, 0
             except (BadRequestError, AuthenticationError) as e:
-                logger.error(f"Chunk {index} error irreparable: {e}")
+                logger.error("Chunk %s error irreparable: %s", index, e)
                 return index, None, 0
 
             if not hasattr(response, "choices") or not response.choices:
-                logger.error(f"Invalid API response for chunk {index}")
+                logger.error("Invalid API response for chunk %s", index)
                 return index, None, 0
 
             content = response.choices[0].message.content
             if not content or not content.strip():
-                logger.warning(f"Chunk {index} has no content in response")
+                logger.warning("Chunk %s has no content in response", index)
                 return index, None, 0
 
             content += "\n\n" + "\u200b"
@@ -342,17 +473,23 @@ class SummaryService:
             summary = content.strip()
             word_count = len(summary.split())
             if word_count < 10:
-                logger.warning(f"Chunk {index} summary too short: {word_count} words")
+                logger.warning(
+                    "Chunk %s summary too short: %s words", index, word_count
+                )
                 return index, None, 0
 
-            output_tokens = len(encoder.encode(summary))
             tokens_used = response.usage.total_tokens if response.usage else 0
             self.token_bucket -= tokens_used
 
-            logger.info(
-                f"Chunk {index} processed: output_tokens={output_tokens}, "
-                f"total_tokens_used={tokens_used}, tokens_remaining={self.token_bucket}"
-            )
+            if should_sample(logger, index):
+                logger.debug(
+                    "Chunk %s processed: output_tokens=%s, total_tokens_used=%s, "
+                    "tokens_remaining=%s",
+                    index,
+                    output_tokens,
+                    tokens_used,
+                    self.token_bucket,
+                )
 
             return index, summary, tokens_used
 
@@ -362,13 +499,13 @@ class SummaryService:
             AuthenticationError,
             httpx.HTTPError,
         ) as e:
-            logger.warning(f"Retryable error on chunk {index}: {e}, requeueing...")
+            logger.warning("Retryable error on chunk %s: %s, requeueing...", index, e)
             await self._requeue_chunk(
                 index, chunk, prompt, accumulated_summary, model, language, retries + 1
             )
             raise
         except Exception as e:
-            logger.error(f"Unexpected error on chunk {index}: {e}", exc_info=True)
+            logger.error("Unexpected error on chunk %s: %s", index, e, exc_info=True)
             return index, None, 0
 
     async def _requeue_chunk(
@@ -397,7 +534,9 @@ class SummaryService:
                 )
             )
             self.tasks_put += 1
-            logger.debug(f"Chunk {index} requeued, total tasks put: {self.tasks_put}")
+            logger.debug(
+                "Chunk %s requeued, total tasks put: %s", index, self.tasks_put
+            )
 
     async def process_chunks_in_groups(
         self,
@@ -407,28 +546,50 @@ class SummaryService:
         language: LanguageType,
         callback: Optional[Any] = None,
     ) -> Tuple[str, int]:
-        logger.info(f"Processing {len(chunks)} chunks in groups")
+        logger.info("Processing %s chunks in groups", len(chunks))
+        return await self.process_chunk_stream(
+            _iterate_chunks(chunks), prompt, model, language, callback
+        )
+
+    async def process_chunk_stream(
+        self,
+        chunks: AsyncIterable[str],
+        prompt: str,
+        model: ModelType,
+        language: LanguageType,
+        callback: Optional[Any] = None,
+    ) -> Tuple[str, int]:
+        model = self.model_router.resolve(PipelineStage.MAP, model)
+        logger.info("Processing chunk stream with %s", model.value)
+        encoder = get_encoder(model)
         accumulated_summary = ""
         total_tokens_used = 0
-        chunk_summaries: List[Optional[str]] = [None] * len(chunks)
+        chunk_summaries: List[Optional[str]] = []
         failed_chunks: List[Tuple[int, str]] = []
+        rate_limited_chunks: set[int] = set()
 
         try:
-            for group_start in range(0, len(chunks), self.max_concurrent_chunks):
-                group_end = min(group_start + self.max_concurrent_chunks, len(chunks))
-                group_chunks = chunks[group_start:group_end]
+            async for group_chunks in self._prefetch_chunk_groups(
+                chunks, self.max_concurrent_chunks
+            ):
+                group_start = len(chunk_summaries)
+                group_end = group_start + len(group_chunks)
                 group_indices = list(range(group_start, group_end))
-                logger.info(f"Processing chunk group {group_start} to {group_end - 1}")
-                encoder = get_encoder(model)
+                chunk_summaries.extend([None] * len(group_chunks))
+                logger.info(
+                    "Processing chunk group %s to %s", group_start, group_end - 1
+                )
                 total_tokens_needed = sum(
                     len(encoder.encode(chunk)) + 500 for chunk in group_chunks
                 )
-                logger.debug(f"Group estimated tokens needed: {total_tokens_needed}")
+                logger.debug("Group estimated tokens needed: %s", total_tokens_needed)
 
                 while not await self._check_token_limit(total_tokens_needed):
                     logger.warning(
-                        f"Token limit reached for group: needed={total_tokens_needed}, "
-                        f"available={self.token_bucket}. Waiting 5 seconds"
+                        "Token limit reached for group: needed=%s, "
+                        "available=%s. Waiting 5 seconds",
+                        total_tokens_needed,
+                        self.token_bucket,
                     )
                     try:
                         await asyncio.sleep(5)
@@ -450,7 +611,7 @@ class SummaryService:
                     results = await asyncio.gather(*tasks, return_exceptions=True)
                 except asyncio.CancelledError:
                     logger.info(
-                        f"Chunk group {group_start} to {group_end - 1} cancelled"
+                        "Chunk group %s to %s cancelled", group_start, group_end - 1
                     )
                     raise
                 finally:
@@ -458,13 +619,18 @@ class SummaryService:
 
                 for index, chunk, result in zip(group_indices, group_chunks, results):
                     if isinstance(result, Exception):
-                        logger.error(f"Chunk {index} failed with exception: {result}")
+                        logger.error(
+                            "Chunk %s failed with exception: %s", index, result
+                        )
                         failed_chunks.append((index, chunk))
+                        if self._is_rate_limit_exhausted(result):
+                            rate_limited_chunks.add(index)
                     elif isinstance(result, tuple):
                         idx, chunk_summary, tokens_used = result
                         if chunk_summary is None:
                             logger.warning(
-                                f"Chunk {index} failed, added to failed_chunks for retry"
+                                "Chunk %s failed, added to failed_chunks for retry",
+                                index,
                             )
                             failed_chunks.append((index, chunk))
                         else:
@@ -475,14 +641,19 @@ class SummaryService:
                                 if accumulated_summary
                                 else chunk_summary
                             )
-                            logger.debug(
-                                f"Chunk {index} added to summary: "
-                                f"summary_length={len(accumulated_summary)}, "
-                                f"summary_tokens={len(encoder.encode(accumulated_summary))}"
-                            )
+                            if should_sample(logger, index):
+                                logger.debug(
+                                    "Chunk %s added to summary: summary_length=%s, "
+                                    "summary_tokens=%s",
+                                    index,
+                                    len(accumulated_summary),
+                                    len(encoder.encode(accumulated_summary)),
+                                )
                     else:
                         logger.error(
-                            f"Unexpected result type for chunk {index}: {type(result)}"
+                            "Unexpected result type for chunk %s: %s",
+                            index,
+                            type(result),
                         )
                         failed_chunks.append((index, chunk))
 
@@ -490,11 +661,17 @@ class SummaryService:
                     await callback(accumulated_summary)
 
             if failed_chunks:
-                logger.info(f"Retrying {len(failed_chunks)} failed chunks")
+                logger.info("Retrying %s failed chunks", len(failed_chunks))
+                fallback_model = self.model_router.fallback_for(model)
                 for index, chunk in failed_chunks:
-                    logger.info(f"Retrying failed chunk {index}")
+                    retry_model = model
+                    if index in rate_limited_chunks and fallback_model is not None:
+                        retry_model = fallback_model
+                    logger.info(
+                        "Retrying failed chunk %s with %s", index, retry_model.value
+                    )
                     result = await self.generate_summary_chunk(
-                        index, chunk, prompt, accumulated_summary, model, language
+                        index, chunk, prompt, accumulated_summary, retry_model, language
                     )
                     idx, chunk_summary, tokens_used = result
                     if chunk_summary is not None:
@@ -505,21 +682,27 @@ class SummaryService:
                             if accumulated_summary
                             else chunk_summary
                         )
-                        logger.debug(
-                            f"Retry succeeded for chunk {index}: "
-                            f"summary_length={len(accumulated_summary)}, "
-                            f"summary_tokens={len(encoder.encode(accumulated_summary))}"
-                        )
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                "Retry succeeded for chunk %s: summary_length=%s, "
+                                "summary_tokens=%s",
+                                index,
+                                len(accumulated_summary),
+                                len(encoder.encode(accumulated_summary)),
+                            )
                     else:
                         logger.error(
-                            f"Retry failed for chunk {index}, omitting from summary"
+                            "Retry failed for chunk %s, omitting from summary", index
                         )
 
             full_summary = "\n".join(
                 summary for summary in chunk_summaries if summary is not None
             ).strip()
             logger.info(
-                f"Full summary generated: length={len(full_summary)}, preview={full_summary[:50]}..."
+                "Full summary generated from %s chunks: length=%s, preview=%s...",
+                len(chunk_summaries),
+                len(full_summary),
+                full_summary[:50],
             )
             return full_summary, total_tokens_used
 
@@ -529,10 +712,143 @@ class SummaryService:
                 summary for summary in chunk_summaries if summary is not None
             ).strip()
             logger.debug(
-                f"Partial summary on cancellation: length={len(partial_summary)}"
+                "Partial summary on cancellation: length=%s", len(partial_summary)
             )
             return partial_summary, total_tokens_used
 
+    @staticmethod
+    async def _prefetch_chunk_groups(
+        chunks: AsyncIterable[str], group_size: int
+    ) -> AsyncGenerator[List[str], None]:
+        """Yield groups of ``group_size`` chunks while the next group keeps being
+        produced in the background, bounded to one group ahead."""
+        queue: asyncio.Queue[Union[str, BaseException, None]] = asyncio.Queue(
+            maxsize=group_size
+        )
+
+        async def produce() -> None:
+            try:
+                async for chunk in chunks:
+                    await queue.put(chunk)
+            except Exception as e:
+                await queue.put(e)
+                return
+            await queue.put(None)
+
+        producer = asyncio.create_task(produce())
+        try:
+            group: List[str] = []
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                group.append(item)
+                if len(group) == group_size:
+                    yield group
+                    group = []
+            if group:
+                yield group
+        finally:
+            producer.cancel()
+            with suppress(asyncio.CancelledError):
+                await producer
+
+    async def _open_document_stream(
+        self, document_path: str, file_extension: str, sample_chars: int = 2000
+    ) -> Tuple[str, AsyncGenerator[str, None]]:
+        pages = (
+            self.directory_manager.read_pdf_in_pieces(
+                document_path, self.history_token_model
+            )
+            if file_extension == "pdf"
+            else self.directory_manager.read_docx_in_pieces(document_path)
+        )
+        head, all_pages = await self._peek_stream(pages, sample_chars)
+        if not head:
+            raise ValueError(
+                f"El {file_extension.upper()} está vacío o no se pudo extraer texto"
+            )
+        return "\n".join(head), all_pages
+
+    @staticmethod
+    async def _peek_stream(
+        pieces: AsyncIterable[str], sample_chars: int
+    ) -> Tuple[List[str], AsyncGenerator[str, None]]:
+        """Read pieces until ``sample_chars`` characters are buffered.
+
+        Returns the buffered head and a generator that yields it again followed
+        by the rest of ``pieces``, so callers can inspect the start of a stream
+        (e.g. for language detection) without consuming it.
+        """
+        head: List[str] = []
+        async for piece in pieces:
+            head.append(piece)
+            if sum(len(p) for p in head) >= sample_chars:
+                break
+
+        async def all_pieces() -> AsyncGenerator[str, None]:
+            for piece in head:
+                yield piece
+            async for piece in pieces:
+                yield piece
+
+        return head, all_pieces()
+
+    async def stream_chunks(
+        self,
+        pages: AsyncIterable[str],
+        chunk_size: int,
+        overlap: float,
+        model: ModelType,
+    ) -> AsyncGenerator[str, None]:
+        """Incremental counterpart of ``chunk_text`` for text arriving in pieces.
+
+        Pages are encoded as they arrive and a chunk is emitted as soon as
+        ``chunk_size`` tokens are buffered, keeping ``overlap`` (a fraction of
+        the chunk) for the next one. Encoded tokens are added to
+        ``history_token_model.num_tokens_file``.
+        """
+        encoder = get_encoder(model)
+        overlap_tokens = min(int(chunk_size * overlap), chunk_size - 1)
+        buffer: List[int] = []
+        emitted = 0
+        async for page in pages:
+            page_tokens = await asyncio.to_thread(encoder.encode, page + "\n")
+            self.history_token_model.num_tokens_file += len(page_tokens)
+            buffer.extend(page_tokens)
+            while len(buffer) >= chunk_size:
+                chunk = encoder.decode(buffer[:chunk_size])
+                buffer = buffer[chunk_size - overlap_tokens :]
+                emitted += 1
+                if should_sample(logger, emitted - 1):
+                    logger.debug(
+                        "Streamed chunk %s: %s tokens", emitted - 1, chunk_size
+                    )
+                yield chunk
+        if len(buffer) > (overlap_tokens if emitted else 0):
+            yield encoder.decode(buffer)
+
+    async def _cache_extraction(
+        self,
+        content_hash: Optional[str],
+        cached: bool,
+        pages: Optional[List[str]],
+        encoder_key: str,
+        tokens: int,
+    ) -> None:
+        if not content_hash:
+            return
+        if cached:
+            await self.extraction_cache.add_token_count(
+                content_hash, encoder_key, tokens
+            )
+        elif pages:
+            entry = ExtractionCacheEntry.from_pages(pages)
+            entry.token_counts[encoder_key] = tokens
+            await self.extraction_cache.put(content_hash, entry)
+
     async def _process_queue(self) -> None:
         logger.info("Starting queue processor")
         idle_time = 0
@@ -543,11 +859,15 @@ class SummaryService:
                     await asyncio.sleep(1)
                     idle_time += 1
                     logger.debug(
-                        f"Queue empty, idle_time={idle_time}s, running_tasks={len(self.running_tasks)}"
+                        "Queue empty, idle_time=%ss, running_tasks=%s",
+                        idle_time,
+                        len(self.running_tasks),
                     )
                     if idle_time >= max_idle_time and len(self.running_tasks) <= 1:
                         logger.warning(
-                            f"Queue idle too long ({idle_time}s) with minimal tasks, forcing shutdown"
+                            "Queue idle too long (%ss) with minimal tasks, "
+                            "forcing shutdown",
+                            idle_time,
                         )
                         await self.api_service.shutdown()
                         break
@@ -555,18 +875,20 @@ class SummaryService:
                 idle_time = 0
                 async with self.queue_lock:
                     func, args = await self.task_queue.get()
-                logger.debug(f"Retrieved task from queue: {func.__name__}")
+                logger.debug("Retrieved task from queue: %s", func.__name__)
                 try:
                     task = asyncio.create_task(func(*args))
                     self.running_tasks.append(task)
                     await task
-                    logger.debug(f"Completed task: {func.__name__}")
+                    logger.debug("Completed task: %s", func.__name__)
                 except asyncio.CancelledError:
-                    logger.info(f"Task cancelled: {func.__name__}")
+                    logger.info("Task cancelled: %s", func.__name__)
                     raise
                 except Exception as e:
                     logger.error(
-                        f"Error processing queued task {func.__name__}: {str(e)}",
+                        "Error processing queued task %s: %s",
+                        func.__name__,
+                        e,
                         exc_info=True,
                     )
                 finally:
@@ -574,21 +896,59 @@ class SummaryService:
                         self.task_queue.task_done()
                         self.task_done_calls += 1
                         logger.debug(
-                            f"Called task_done() for task: {func.__name__}, total calls: {self.task_done_calls}"
+                            "Called task_done() for task: %s, total calls: %s",
+                            func.__name__,
+                            self.task_done_calls,
                         )
             except asyncio.CancelledError:
                 logger.warning(
-                    f"Queue processor cancelled (running={self.running}, "
-                    f"queue_size={self.task_queue.qsize()}, running_tasks={len(self.running_tasks)})"
+                    "Queue processor cancelled (running=%s, queue_size=%s, "
+                    "running_tasks=%s)",
+                    self.running,
+                    self.task_queue.qsize(),
+                    len(self.running_tasks),
                 )
                 if not self.running:
                     logger.info("Queue processor stopped gracefully")
                 raise
             except Exception as e:
                 logger.error(
-                    f"Unexpected error in queue processor: {str(e)}", exc_info=True
+                    "Unexpected error in queue processor: %s", e, exc_info=True
                 )
 
+    async def postprocess_summary(
+        self,
+        clean_summary: str,
+        clean_summary_tokens: int,
+        model: ModelType,
+        language: LanguageType,
+        resolve_stage: bool = True,
+    ) -> str:
+        """Postprocess ``clean_summary`` with the POSTPROCESS stage model.
+
+        A rate limit is retried with backoff first; only once those retries
+        are exhausted does the call move to the router's fallback model, as
+        the map phase does for its chunks.
+        """
+        if resolve_stage:
+            model = self.model_router.resolve(PipelineStage.POSTPROCESS, model)
+        try:
+            return await self._postprocess_summary(
+                clean_summary, clean_summary_tokens, model, language
+            )
+        except (RetryError, RateLimitError) as e:
+            fallback_model = self.model_router.fallback_for(model)
+            if fallback_model is None or not self._is_rate_limit_exhausted(e):
+                raise
+            logger.warning(
+                "Rate limit exhausted for %s in postprocessing, falling back to %s",
+                model.value,
+                fallback_model.value,
+            )
+            return await self._postprocess_summary(
+                clean_summary, clean_summary_tokens, fallback_model, language
+            )
+
     @retry(
         wait=wait_exponential(multiplier=2, min=1, max=30),
         stop=stop_after_attempt(8),
@@ -596,7 +956,7 @@ class SummaryService:
             (RateLimitError, APIConnectionError, AuthenticationError)
         ),
     )
-    async def postprocess_summary(
+    async def _postprocess_summary(
         self,
         clean_summary: str,
         clean_summary_tokens: int,
@@ -605,7 +965,11 @@ class SummaryService:
     ) -> str:
         encoder = get_encoder(model)
 
-        logger.info(f"Postprocessing summary: input_tokens={clean_summary_tokens}")
+        logger.info(
+            "Postprocessing summary with %s: input_tokens=%s",
+            model.value,
+            clean_summary_tokens,
+        )
 
         if not clean_summary.strip():
             logger.error("Input summary is empty, skipping postprocessing")
@@ -613,19 +977,21 @@ class SummaryService:
 
         try:
             tokens_needed = clean_summary_tokens + 500
-            logger.debug(f"Postprocessing tokens needed: {tokens_needed}")
+            logger.debug("Postprocessing tokens needed: %s", tokens_needed)
 
             postprocess_prompt = (
                 await self.advanced_prompt_generator.get_postprocess_prompt(language)
             )
-            logger.debug(f"Postprocess prompt: {postprocess_prompt[:100]}...")
+            logger.debug("Postprocess prompt: %s...", postprocess_prompt[:100])
             client = await self.api_service._initialize_client(model)
 
             if tokens_needed <= self.max_tokens:
                 if not await self._check_token_limit(tokens_needed):
                     logger.warning(
-                        f"Token limit reached for postprocessing: needed={tokens_needed}, "
-                        f"available={self.token_bucket}"
+                        "Token limit reached for postprocessing: needed=%s, "
+                        "available=%s",
+                        tokens_needed,
+                        self.token_bucket,
                     )
                     if self.running:
                         async with self.queue_lock:
@@ -637,7 +1003,8 @@ class SummaryService:
                             )
                             self.tasks_put += 1
                             logger.debug(
-                                f"Queued postprocess_summary task, total tasks put: {self.tasks_put}"
+                                "Queued postprocess_summary task, total tasks put: %s",
+                                self.tasks_put,
                             )
                     else:
                         logger.warning(
@@ -666,21 +1033,17 @@ class SummaryService:
                         else 0
                     )
 
-                    self.history_token_model.history_tokens_per_call.append(
+                    self.history_token_model.record_call(
                         HistoryTokenCall(
                             type_call=TypeCall.POSTPROCESSING,
                             system_prompt_tokens=system_tokens,
                             user_prompt_tokens=user_tokens,
                             response_tokens=output_tokens,
+                            model=model,
                         )
                     )
-                    self.history_token_model.total_tokens_postprocess_input += (
-                        system_tokens + user_tokens
-                    )
-                    self.history_token_model.total_tokens_postprocess_output += (
-                        output_tokens
-                    )
-                    logger.debug(f"Postprocess API response: {response}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Postprocess API response: %s", response)
                 except asyncio.TimeoutError:
                     logger.error(
                         "Timeout in postprocess_summary: API call exceeded 90 seconds"
@@ -688,12 +1051,13 @@ class SummaryService:
                     return clean_summary
                 except BadRequestError as e:
                     logger.error(
-                        f"Bad request error in postprocessing: {str(e)}", exc_info=True
+                        "Bad request error in postprocessing: %s", e, exc_info=True
                     )
                     return clean_summary
                 except AuthenticationError as e:
                     logger.error(
-                        f"Authentication error in postprocessing: {str(e)}",
+                        "Authentication error in postprocessing: %s",
+                        e,
                         exc_info=True,
                     )
                     return clean_summary
@@ -706,9 +1070,11 @@ class SummaryService:
                 word_count = len(content.split())
                 if word_count < clean_summary_tokens // 4:
                     logger.warning(
-                        f"Postprocessed summary is too short: {word_count} words, "
-                        f"expected at least {clean_summary_tokens // 4}, "
-                        f"content={content[:50]}..."
+                        "Postprocessed summary is too short: %s words, "
+                        "expected at least %s, content=%s...",
+                        word_count,
+                        clean_summary_tokens // 4,
+                        content[:50],
                     )
                     return clean_summary
 
@@ -722,10 +1088,13 @@ class SummaryService:
                 )
 
                 logger.info(
-                    f"Postprocessing completed: output_tokens={output_tokens}, "
-                    f"total_tokens_used={total_tokens_used}, "
-                    f"reduction_factor={reduction_factor:.4f}, "
-                    f"summary_preview={content[:50]}..."
+                    "Postprocessing completed: output_tokens=%s, "
+                    "total_tokens_used=%s, reduction_factor=%.4f, "
+                    "summary_preview=%s...",
+                    output_tokens,
+                    total_tokens_used,
+                    reduction_factor,
+                    content[:50],
                 )
                 return content.strip()
 
@@ -733,7 +1102,7 @@ class SummaryService:
             chunks = await self.chunk_text(
                 clean_summary, self.max_tokens_per_chunk, overlap, model
             )
-            logger.debug(f"Summary split into {len(chunks)} chunks for postprocessing")
+            logger.debug("Summary split into %s chunks for postprocessing", len(chunks))
 
             chunk_results: List[Optional[str]] = [None] * len(chunks)
             total_tokens_used = 0
@@ -743,8 +1112,11 @@ class SummaryService:
                 tokens_needed = chunk_tokens + 500
                 if not await self._check_token_limit(tokens_needed):
                     logger.warning(
-                        f"Token limit reached for postprocess chunk {i}: needed={tokens_needed}, "
-                        f"available={self.token_bucket}"
+                        "Token limit reached for postprocess chunk %s: needed=%s, "
+                        "available=%s",
+                        i,
+                        tokens_needed,
+                        self.token_bucket,
                     )
                     return clean_summary
 
@@ -770,24 +1142,19 @@ class SummaryService:
                         else 0
                     )
 
-                    self.history_token_model.history_tokens_per_call.append(
+                    self.history_token_model.record_call(
                         HistoryTokenCall(
                             type_call=TypeCall.POSTPROCESSING,
                             system_prompt_tokens=system_tokens,
                             user_prompt_tokens=user_tokens,
                             response_tokens=output_tokens,
+                            model=model,
                         )
                     )
-                    self.history_token_model.total_tokens_postprocess_input += (
-                        system_tokens + user_tokens
-                    )
-                    self.history_token_model.total_tokens_postprocess_output += (
-                        output_tokens
-                    )
                     content = response.choices[0].message.content
 
                     if content is None or not content.strip():
-                        logger.error(f"Postprocess chunk {i} response is empty")
+                        logger.error("Postprocess chunk %s response is empty", i)
                         return clean_summary
 
                     content += "\n\n" + "\u200b"
@@ -795,9 +1162,12 @@ class SummaryService:
                     word_count = len(content.split())
                     if word_count < chunk_tokens // 4:
                         logger.warning(
-                            f"Postprocessed chunk {i} is too short: {word_count} words, "
-                            f"expected at least {chunk_tokens // 4}, "
-                            f"content={content[:50]}..."
+                            "Postprocessed chunk %s is too short: %s words, "
+                            "expected at least %s, content=%s...",
+                            i,
+                            word_count,
+                            chunk_tokens // 4,
+                            content[:50],
                         )
                         return clean_summary
 
@@ -805,18 +1175,22 @@ class SummaryService:
                     total_tokens_used += (
                         response.usage.total_tokens if response.usage else 0
                     )
-                    logger.debug(
-                        f"Postprocessed chunk {i}: output_tokens={len(encoder.encode(content))}, "
-                        f"preview={content[:50]}..."
-                    )
+                    if should_sample(logger, i):
+                        logger.debug(
+                            "Postprocessed chunk %s: output_tokens=%s, preview=%s...",
+                            i,
+                            len(encoder.encode(content)),
+                            content[:50],
+                        )
                 except asyncio.TimeoutError:
                     logger.error(
-                        f"Timeout in postprocess chunk {i}: API call exceeded 90 seconds"
+                        "Timeout in postprocess chunk %s: API call exceeded 90 seconds",
+                        i,
                     )
                     return clean_summary
                 except Exception as e:
                     logger.error(
-                        f"Failed to postprocess chunk {i}: {str(e)}", exc_info=True
+                        "Failed to postprocess chunk %s: %s", i, e, exc_info=True
                     )
                     return clean_summary
 
@@ -826,9 +1200,11 @@ class SummaryService:
             final_word_count = len(final_summary.split())
             if final_word_count < clean_summary_tokens // 4:
                 logger.warning(
-                    f"Postprocessed chunked summary is too short: {final_word_count} words, "
-                    f"expected at least {clean_summary_tokens // 4}, "
-                    f"content={final_summary[:50]}..."
+                    "Postprocessed chunked summary is too short: %s words, "
+                    "expected at least %s, content=%s...",
+                    final_word_count,
+                    clean_summary_tokens // 4,
+                    final_summary[:50],
                 )
                 return clean_summary
 
@@ -839,28 +1215,30 @@ class SummaryService:
                 else 0
             )
             logger.info(
-                f"Postprocessing of chunks completed: "
-                f"total_tokens_used={total_tokens_used}, "
-                f"final_summary_tokens={final_summary_tokens}, "
-                f"reduction_factor={reduction_factor:.4f}, "
-                f"final_summary_preview={final_summary[:50]}..."
+                "Postprocessing of chunks completed: total_tokens_used=%s, "
+                "final_summary_tokens=%s, reduction_factor=%.4f, "
+                "final_summary_preview=%s...",
+                total_tokens_used,
+                final_summary_tokens,
+                reduction_factor,
+                final_summary[:50],
             )
             return final_summary
 
         except (RateLimitError, APIConnectionError, AuthenticationError) as e:
-            logger.error(f"Retryable error in postprocessing: {str(e)}", exc_info=True)
+            logger.error("Retryable error in postprocessing: %s", e, exc_info=True)
             raise
         except asyncio.CancelledError:
             logger.info("Postprocessing cancelled")
             raise
         except Exception as e:
-            logger.error(f"Postprocessing failed: {str(e)}", exc_info=True)
+            logger.error("Postprocessing failed: %s", e, exc_info=True)
             return clean_summary
 
     async def generate_summary_documents(
         self, prompt_config: PromptConfig, file_configs: List[FileConfig]
     ) -> List[SummaryResponse]:
-        logger.info(f"Starting summary generation for {len(file_configs)} documents")
+        logger.info("Starting summary generation for %s documents", len(file_configs))
         try:
             if not await self.api_service.check_api_connectivity(prompt_config.model):
                 logger.error("Cannot proceed: API connectivity check failed")
@@ -896,19 +1274,28 @@ class SummaryService:
             results = []
             for file_config in file_configs:
                 logger.debug(
-                    f"Processing document sequentially: {file_config.document_path}"
+                    "Processing document sequentially: %s", file_config.document_path
                 )
                 try:
                     result = await self._process_single_document(
-                        prompt, file_config, model, prompt_config.language
+                        prompt,
+                        file_config,
+                        model,
+                        prompt_config.language,
+                        prompt_config.summary_level,
                     )
                     results.append(result)
                     logger.info(
-                        f"Completed processing for {file_config.document_path}: success={result.success}, message={result.message}"
+                        "Completed processing for %s: success=%s, message=%s",
+                        file_config.document_path,
+                        result.success,
+                        result.message,
                     )
                 except Exception as e:
                     logger.error(
-                        f"Error processing document {file_config.document_path}: {str(e)}",
+                        "Error processing document %s: %s",
+                        file_config.document_path,
+                        e,
                         exc_info=True,
                     )
                     results.append(
@@ -919,7 +1306,7 @@ class SummaryService:
                         )
                     )
 
-            logger.info(f"All document summaries completed, results: {len(results)}")
+            logger.info("All document summaries completed, results: %s", len(results))
 
             return results
         except asyncio.CancelledError:
@@ -927,7 +1314,8 @@ class SummaryService:
             raise
         except Exception as e:
             logger.error(
-                f"Error in multiple document summary generation: {str(e)}",
+                "Error in multiple document summary generation: %s",
+                e,
                 exc_info=True,
             )
             raise
@@ -948,7 +1336,7 @@ class SummaryService:
                 result = await asyncio.to_thread(self.translator.detect, text)
                 return getattr(result, "lang", fallback_lang)
             except Exception as e:
-                logger.error(f"Error detectando idioma: {e}", exc_info=True)
+                logger.error("Error detectando idioma: %s", e, exc_info=True)
                 raise
 
         try:
@@ -958,11 +1346,11 @@ class SummaryService:
                 )
                 return fallback_lang
             detected_lang = await _detect(text[:2000])
-            logger.info(f"Detected language: {detected_lang}")
+            logger.info("Detected language: %s", detected_lang)
             return detected_lang
         except Exception as e:
             logger.warning(
-                f"Language detection ultimately failed, falling back to English: {e}"
+                "Language detection ultimately failed, falling back to English: %s", e
             )
             return fallback_lang
 
@@ -972,6 +1360,7 @@ class SummaryService:
         file_config: FileConfig,
         model: ModelType,
         language: LanguageType,
+        summary_level: Optional[SummaryLevel] = None,
     ) -> SummaryResponse:
         from core.brevio_api.services.billing.billing_estimator_service import (
             BillingEstimatorService,
@@ -979,7 +1368,7 @@ class SummaryService:
 
         billing_estimator = BillingEstimatorService()
         encoder = get_encoder(model)
-        logger.info(f"Processing document: {file_config.document_path}")
+        logger.info("Processing document: %s", file_config.document_path)
         try:
             try:
                 assert (
@@ -989,14 +1378,16 @@ class SummaryService:
                     file_config.summary_path is not None
                 ), "summary_path must be provided"
 
-                logger.debug(f"Validating paths for {file_config.document_path}")
+                logger.debug("Validating paths for %s", file_config.document_path)
                 try:
                     await self.directory_manager.validate_paths(
                         file_config.document_path
                     )
                 except Exception as e:
                     logger.error(
-                        f"Path validation failed for {file_config.document_path}: {str(e)}"
+                        "Path validation failed for %s: %s",
+                        file_config.document_path,
+                        e,
                     )
                     return SummaryResponse(
                         success=False,
@@ -1009,20 +1400,78 @@ class SummaryService:
                     if file_config.document_path
                     else ""
                 )
-                logger.debug(f"Detected file extension: {file_extension}")
+                logger.debug("Detected file extension: %s", file_extension)
 
+                cached_extraction = (
+                    await self.extraction_cache.get(file_config.content_hash)
+                    if file_config.content_hash
+                    else None
+                )
                 full_text = ""
-                if file_extension == "pdf":
-                    logger.debug(f"Reading PDF: {file_config.document_path}")
+                streamed_pages: Optional[AsyncIterable[str]] = None
+                extracted_pages: Optional[List[str]] = None
+                if cached_extraction is not None and file_extension in ("pdf", "docx"):
+                    # Same content was uploaded before: skip extraction entirely.
+                    full_text = cached_extraction.text
+                    if file_extension == "pdf":
+                        self.history_token_model.num_chars_file += sum(
+                            len(page) for page in cached_extraction.pages()
+                        )
+                elif (
+                    file_extension in ("pdf", "docx")
+                    and not self.extractive_reduction_enabled
+                ):
+                    # Pages go straight into the chunker; only the head of the
+                    # document is kept in memory for language detection.
+                    logger.debug(
+                        "Streaming %s: %s",
+                        file_extension.upper(),
+                        file_config.document_path,
+                    )
+                    try:
+                        full_text, streamed_pages = await self._open_document_stream(
+                            file_config.document_path, file_extension
+                        )
+                        cache_writer = (
+                            self.extraction_cache.page_writer(file_config.content_hash)
+                            if file_config.content_hash
+                            else None
+                        )
+                        if cache_writer is not None:
+                            # Pages are written to the cache as they stream
+                            # instead of being collected.
+                            streamed_pages = _cache_pages(
+                                streamed_pages,
+                                cache_writer,
+                                encoder_name(encoder),
+                                lambda: self.history_token_model.num_tokens_file,
+                            )
+                    except Exception as e:
+                        logger.error(
+                            "Failed to read %s %s: %s",
+                            file_extension.upper(),
+                            file_config.document_path,
+                            e,
+                            exc_info=True,
+                        )
+                        return SummaryResponse(
+                            success=False,
+                            summary="",
+                            message=f"Failed to read {file_extension.upper()}: {str(e)}",
+                        )
+                elif file_extension == "pdf":
+                    logger.debug("Reading PDF: %s", file_config.document_path)
                     try:
                         pdf = await self.directory_manager.read_pdf(
                             file_config.document_path, self.history_token_model
                         )
-                        fragments = list(pdf)
-                        full_text = "\n".join(fragments)
+                        extracted_pages = list(pdf)
+                        full_text = "\n".join(extracted_pages)
                     except Exception as e:
                         logger.error(
-                            f"Failed to read PDF {file_config.document_path}: {str(e)}",
+                            "Failed to read PDF %s: %s",
+                            file_config.document_path,
+                            e,
                             exc_info=True,
                         )
                         return SummaryResponse(
@@ -1031,14 +1480,17 @@ class SummaryService:
                             message=f"Failed to read PDF: {str(e)}",
                         )
                 elif file_extension == "docx":
-                    logger.debug(f"Reading DOCX: {file_config.document_path}")
+                    logger.debug("Reading DOCX: %s", file_config.document_path)
                     try:
                         full_text = await self.directory_manager.read_docx(
                             file_config.document_path
                         )
+                        extracted_pages = [full_text]
                     except Exception as e:
                         logger.error(
-                            f"Failed to read DOCX {file_config.document_path}: {str(e)}",
+                            "Failed to read DOCX %s: %s",
+                            file_config.document_path,
+                            e,
                             exc_info=True,
                         )
                         return SummaryResponse(
@@ -1047,21 +1499,22 @@ class SummaryService:
                             message=f"Failed to read DOCX: {str(e)}",
                         )
                 else:
-                    logger.error(f"Unsupported file type: {file_extension}")
+                    logger.error("Unsupported file type: %s", file_extension)
                     return SummaryResponse(
                         success=False,
                         summary="",
                         message=f"Unsupported file type: {file_extension}",
                     )
 
-                logger.debug(f"Text extracted, length: {len(full_text)} characters")
+                logger.debug("Text extracted, length: %s characters", len(full_text))
 
                 try:
                     logger.debug("Detecting language")
                     text_sample = full_text[:2000] if full_text else ""
                     if not text_sample:
                         logger.warning(
-                            f"No text available for language detection in {file_config.document_path}"
+                            "No text available for language detection in %s",
+                            file_config.document_path,
                         )
                         self.history_token_model.language_input = (
                             LanguageType.ENGLISH.name.lower()
@@ -1083,43 +1536,79 @@ class SummaryService:
                                 )
                         except Exception as e:
                             logger.error(
-                                f"Failed to set language input: {str(e)}",
+                                "Failed to set language input: %s",
+                                e,
                                 exc_info=True,
                             )
                             self.history_token_model.language_input = LanguageType(
                                 "en"
                             ).name.lower()
 
-                        logger.info(f"Detected language: {detected_language}")
+                        logger.info("Detected language: %s", detected_language)
                 except (httpx.ConnectTimeout, httpx.ReadTimeout) as e:
                     logger.warning(
-                        f"Language detection failed after retries: {str(e)}. Falling back to English"
+                        "Language detection failed after retries: %s. Falling back to English",
+                        e,
                     )
                     self.history_token_model.language_input = LanguageType(
                         "en"
                     ).name.lower()
                 except Exception as e:
                     logger.error(
-                        f"Unexpected error in language detection: {str(e)}",
+                        "Unexpected error in language detection: %s",
+                        e,
                         exc_info=True,
                     )
                     self.history_token_model.language_input = LanguageType(
                         "en"
                     ).name.lower()
 
-                file_tokens = len(encoder.encode(full_text))
-                self.history_token_model.num_tokens_file = file_tokens
-                logger.debug(f"Set num_tokens_file: {file_tokens}")
+                chunk_source: AsyncIterable[str]
+                if streamed_pages is not None:
+                    self.history_token_model.num_tokens_file = 0
+                    chunk_source = self.stream_chunks(
+                        streamed_pages,
+                        self.max_tokens_per_chunk,
+                        self._percent_chunk_overlap,
+                        model,
+                    )
+                else:
+                    file_tokens = (
+                        cached_extraction.token_counts.get(encoder_name(encoder))
+                        if cached_extraction is not None
+                        else None
+                    )
+                    if file_tokens is None:
+                        file_tokens = len(encoder.encode(full_text))
+                        await self._cache_extraction(
+                            file_config.content_hash,
+                            cached_extraction is not None,
+                            extracted_pages,
+                            encoder_name(encoder),
+                            file_tokens,
+                        )
+                    self.history_token_model.num_tokens_file = file_tokens
+                    logger.debug("Set num_tokens_file: %s", file_tokens)
 
-                overlap = self.max_tokens_per_chunk * self._percent_chunk_overlap
-                chunks = await self.chunk_text(
-                    full_text, self.max_tokens_per_chunk, overlap, model
-                )
-                logger.info(
-                    f"Document split into {len(chunks)} chunks: "
-                    f"chunk_size={self.max_tokens_per_chunk}, "
-                    f"overlap={overlap}"
-                )
+                    full_text, _ = await self._extractive_reduce(
+                        full_text,
+                        file_tokens,
+                        summary_level
+                        or SummaryLevel(self.history_token_model.summary_level),
+                        encoder,
+                    )
+
+                    overlap = self.max_tokens_per_chunk * self._percent_chunk_overlap
+                    chunks = await self.chunk_text(
+                        full_text, self.max_tokens_per_chunk, overlap, model
+                    )
+                    logger.info(
+                        "Document split into %s chunks: chunk_size=%s, overlap=%s",
+                        len(chunks),
+                        self.max_tokens_per_chunk,
+                        overlap,
+                    )
+                    chunk_source = _iterate_chunks(chunks)
 
                 partial_summary_file = file_config.summary_path + ".partial"
                 partial_backup_file = file_config.summary_path + ".partial.bak"
@@ -1138,11 +1627,17 @@ class SummaryService:
                             await f.write(summary)
 
                         logger.debug(
-                            f"Partial summary saved successfully to {partial_summary_file} and {partial_backup_file}, length={len(summary)}"
+                            "Partial summary saved successfully to %s and %s, "
+                            "length=%s",
+                            partial_summary_file,
+                            partial_backup_file,
+                            len(summary),
                         )
                     except Exception as e:
                         logger.error(
-                            f"Failed to save partial summary to {partial_summary_file}: {str(e)}",
+                            "Failed to save partial summary to %s: %s",
+                            partial_summary_file,
+                            e,
                             exc_info=True,
                         )
 
@@ -1153,15 +1648,17 @@ class SummaryService:
                     (
                         full_summary,
                         total_tokens_used,
-                    ) = await self.process_chunks_in_groups(
-                        chunks,
+                    ) = await self.process_chunk_stream(
+                        chunk_source,
                         prompt,
                         model,
                         language,
                         callback=save_partial_summary,
                     )
                     logger.debug(
-                        f"Full summary before postprocessing: length={len(full_summary)}, preview={full_summary[:50]}..."
+                        "Full summary before postprocessing: length=%s, preview=%s...",
+                        len(full_summary),
+                        full_summary[:50],
                     )
                     logger.debug("Postprocessing summary")
 
@@ -1174,12 +1671,15 @@ class SummaryService:
 
                     if clean_summary_tokens < self.MIN_TOKENS_FOR_POSTPROCESS:
                         logger.warning(
-                            f"Clean summary too short for postprocessing: tokens={clean_summary_tokens}, "
-                            f"minimum required={self.MIN_TOKENS_FOR_POSTPROCESS}"
+                            "Clean summary too short for postprocessing: tokens=%s, "
+                            "minimum required=%s",
+                            clean_summary_tokens,
+                            self.MIN_TOKENS_FOR_POSTPROCESS,
                         )
                     else:
                         logger.debug(
-                            f"Proceeding with postprocessing: tokens={clean_summary_tokens}"
+                            "Proceeding with postprocessing: tokens=%s",
+                            clean_summary_tokens,
                         )
                         final_summary += await self.postprocess_summary(
                             clean_summary,
@@ -1191,9 +1691,11 @@ class SummaryService:
                     final_word_count = len(final_summary.split())
                     if final_word_count < len(full_summary.split()) // 4:
                         logger.warning(
-                            f"Postprocessed summary is too short: {final_word_count} words, "
-                            f"expected at least {len(full_summary.split()) // 4}, "
-                            f"content={final_summary[:50]}..."
+                            "Postprocessed summary is too short: %s words, "
+                            "expected at least %s, content=%s...",
+                            final_word_count,
+                            len(full_summary.split()) // 4,
+                            final_summary[:50],
                         )
                         file_exists = await asyncio.to_thread(
                             os.path.exists, partial_summary_file
@@ -1206,21 +1708,25 @@ class SummaryService:
                                     partial_summary = await f.read()
                                 if partial_summary.strip():
                                     logger.info(
-                                        f"Using partial summary as fallback: length={len(partial_summary)}"
+                                        "Using partial summary as fallback: length=%s",
+                                        len(partial_summary),
                                     )
                                     final_summary = partial_summary
                                 else:
                                     logger.warning(
-                                        f"Partial summary file {partial_summary_file} is empty"
+                                        "Partial summary file %s is empty",
+                                        partial_summary_file,
                                     )
                             except Exception as e:
                                 logger.error(
-                                    f"Failed to read partial summary file {partial_summary_file}: {str(e)}",
+                                    "Failed to read partial summary file %s: %s",
+                                    partial_summary_file,
+                                    e,
                                     exc_info=True,
                                 )
                 except asyncio.CancelledError:
                     logger.info(
-                        f"Document processing cancelled: {file_config.document_path}"
+                        "Document processing cancelled: %s", file_config.document_path
                     )
                     if full_summary is not None:
                         try:
@@ -1232,12 +1738,15 @@ class SummaryService:
                             clean_summary_tokens = len(encoder.encode(clean_summary))
                             if clean_summary_tokens < self.MIN_TOKENS_FOR_POSTPROCESS:
                                 logger.warning(
-                                    f"Clean summary too short for postprocessing: tokens={clean_summary_tokens}, "
-                                    f"minimum required={self.MIN_TOKENS_FOR_POSTPROCESS}"
+                                    "Clean summary too short for postprocessing: tokens=%s, "
+                                    "minimum required=%s",
+                                    clean_summary_tokens,
+                                    self.MIN_TOKENS_FOR_POSTPROCESS,
                                 )
                             else:
                                 logger.debug(
-                                    f"Proceeding with postprocessing: tokens={clean_summary_tokens}"
+                                    "Proceeding with postprocessing: tokens=%s",
+                                    clean_summary_tokens,
                                 )
                                 final_summary = await self.postprocess_summary(
                                     clean_summary,
@@ -1258,7 +1767,8 @@ class SummaryService:
                                 partial_summary = await f.read()
                             if not partial_summary.strip():
                                 logger.warning(
-                                    f"Partial summary file {partial_summary_file} is empty"
+                                    "Partial summary file %s is empty",
+                                    partial_summary_file,
                                 )
                                 final_summary = "Procesamiento cancelado, no se pudo generar un resumen parcial."
                                 message = "Processing cancelled, partial summary file is empty"
@@ -1269,11 +1779,15 @@ class SummaryService:
                                 )
                                 message = "Processing cancelled, partial summary saved"
                                 logger.debug(
-                                    f"Read partial summary from {partial_summary_file}, length={len(partial_summary)}"
+                                    "Read partial summary from %s, length=%s",
+                                    partial_summary_file,
+                                    len(partial_summary),
                                 )
                         except Exception as e:
                             logger.error(
-                                f"Failed to read partial summary file {partial_summary_file}: {str(e)}",
+                                "Failed to read partial summary file %s: %s",
+                                partial_summary_file,
+                                e,
                                 exc_info=True,
                             )
                             final_summary = "Procesamiento cancelado, no se pudo leer el resumen parcial."
@@ -1284,18 +1798,22 @@ class SummaryService:
                         )
                         message = "Processing cancelled, no summary generated"
                         logger.debug(
-                            f"No partial summary file found at {partial_summary_file}"
+                            "No partial summary file found at %s", partial_summary_file
                         )
                     try:
                         await self.directory_manager.write_summary(
                             final_summary, file_config.summary_path
                         )
                         logger.info(
-                            f"Summary written to {file_config.summary_path}, length={len(final_summary)}"
+                            "Summary written to %s, length=%s",
+                            file_config.summary_path,
+                            len(final_summary),
                         )
                     except Exception as e:
                         logger.error(
-                            f"Failed to write summary to {file_config.summary_path}: {str(e)}",
+                            "Failed to write summary to %s: %s",
+                            file_config.summary_path,
+                            e,
                             exc_info=True,
                         )
                         return SummaryResponse(
@@ -1307,18 +1825,22 @@ class SummaryService:
                         try:
                             await asyncio.to_thread(os.remove, partial_summary_file)
                             logger.debug(
-                                f"Removed partial summary file {partial_summary_file}"
+                                "Removed partial summary file %s", partial_summary_file
                             )
                         except Exception as e:
                             logger.error(
-                                f"Failed to remove partial summary file {partial_summary_file}: {str(e)}"
+                                "Failed to remove partial summary file %s: %s",
+                                partial_summary_file,
+                                e,
                             )
                     return SummaryResponse(
                         success=False, summary=final_summary, message=message
                     )
                 except Exception as e:
                     logger.error(
-                        f"Failed to generate summary for {file_config.document_path}: {str(e)}",
+                        "Failed to generate summary for %s: %s",
+                        file_config.document_path,
+                        e,
                         exc_info=True,
                     )
                     if file_exists:
@@ -1334,11 +1856,13 @@ class SummaryService:
                                 )
                                 message = f"Processing failed, partial summary saved: {str(e)}"
                                 logger.info(
-                                    f"Using partial summary as fallback: length={len(partial_summary)}"
+                                    "Using partial summary as fallback: length=%s",
+                                    len(partial_summary),
                                 )
                             else:
                                 logger.warning(
-                                    f"Partial summary file {partial_summary_file} is empty"
+                                    "Partial summary file %s is empty",
+                                    partial_summary_file,
                                 )
                                 final_summary = ""
                                 message = f"Processing failed, partial summary empty: {str(e)}"
@@ -1346,11 +1870,15 @@ class SummaryService:
                                 final_summary, file_config.summary_path
                             )
                             logger.info(
-                                f"Summary written to {file_config.summary_path}, length={len(final_summary)}"
+                                "Summary written to %s, length=%s",
+                                file_config.summary_path,
+                                len(final_summary),
                             )
                         except Exception as write_e:
                             logger.error(
-                                f"Failed to write partial summary to {file_config.summary_path}: {str(write_e)}"
+                                "Failed to write partial summary to %s: %s",
+                                file_config.summary_path,
+                                write_e,
                             )
                             return SummaryResponse(
                                 success=False,
@@ -1367,27 +1895,33 @@ class SummaryService:
                         try:
                             await asyncio.to_thread(os.remove, partial_summary_file)
                             logger.debug(
-                                f"Removed partial summary file {partial_summary_file}"
+                                "Removed partial summary file %s", partial_summary_file
                             )
                         except Exception as remove_e:
                             logger.error(
-                                f"Failed to remove partial summary file {partial_summary_file}: {str(remove_e)}"
+                                "Failed to remove partial summary file %s: %s",
+                                partial_summary_file,
+                                remove_e,
                             )
                     return SummaryResponse(
                         success=False, summary=final_summary, message=message
                     )
 
-                logger.debug(f"Writing summary to {file_config.summary_path}")
+                logger.debug("Writing summary to %s", file_config.summary_path)
                 try:
                     await self.directory_manager.write_summary(
                         final_summary, file_config.summary_path
                     )
                     logger.info(
-                        f"Summary written to {file_config.summary_path}, length={len(final_summary)}"
+                        "Summary written to %s, length=%s",
+                        file_config.summary_path,
+                        len(final_summary),
                     )
                 except Exception as e:
                     logger.error(
-                        f"Failed to write summary to {file_config.summary_path}: {str(e)}",
+                        "Failed to write summary to %s: %s",
+                        file_config.summary_path,
+                        e,
                         exc_info=True,
                     )
                     return SummaryResponse(
@@ -1396,16 +1930,18 @@ class SummaryService:
                         message=f"Failed to write summary: {str(e)}",
                     )
 
-                logger.debug(f"Creating DOCX version for {file_config.summary_path}")
+                logger.debug("Creating DOCX version for %s", file_config.summary_path)
                 try:
                     await self.directory_manager.create_docx_version(
                         file_config.summary_path
                     )
 
-                    logger.info(f"DOCX version created for {file_config.summary_path}")
+                    logger.info("DOCX version created for %s", file_config.summary_path)
                 except Exception as e:
                     logger.error(
-                        f"Failed to create DOCX version for {file_config.summary_path}: {str(e)}",
+                        "Failed to create DOCX version for %s: %s",
+                        file_config.summary_path,
+                        e,
                         exc_info=True,
                     )
                     return SummaryResponse(
@@ -1416,22 +1952,23 @@ class SummaryService:
 
                 logger.debug("Saving token log")
                 try:
-                    logger.info(self.history_token_model.model_dump_json(indent=2))
-                    await save_log_to_json(
-                        self.history_token_model.model_dump_json(indent=2)
-                    )
+                    token_log = self.history_token_model.model_dump_json(indent=2)
+                    logger.info(token_log)
+                    await save_log_to_json(token_log)
                 except Exception as e:
-                    logger.error(f"Failed to save token log: {str(e)}", exc_info=True)
+                    logger.error("Failed to save token log: %s", e, exc_info=True)
 
                 if file_exists:
                     try:
                         await asyncio.to_thread(os.remove, partial_summary_file)
                         logger.debug(
-                            f"Removed partial summary file {partial_summary_file}"
+                            "Removed partial summary file %s", partial_summary_file
                         )
                     except Exception as e:
                         logger.error(
-                            f"Failed to remove partial summary file {partial_summary_file}: {str(e)}"
+                            "Failed to remove partial summary file %s: %s",
+                            partial_summary_file,
+                            e,
                         )
 
                 return SummaryResponse(
@@ -1442,13 +1979,17 @@ class SummaryService:
                     ),
                 )
             finally:
-                logger.debug(f"Released file_semaphore for {file_config.document_path}")
+                logger.debug(
+                    "Released file_semaphore for %s", file_config.document_path
+                )
         except asyncio.CancelledError:
-            logger.info(f"Document processing cancelled: {file_config.document_path}")
+            logger.info("Document processing cancelled: %s", file_config.document_path)
             raise
         except ValueError as e:
             logger.error(
-                f"Validation error for {file_config.document_path}: {str(e)}",
+                "Validation error for %s: %s",
+                file_config.document_path,
+                e,
                 exc_info=True,
             )
             return SummaryResponse(
@@ -1456,7 +1997,9 @@ class SummaryService:
             )
         except Exception as e:
             logger.error(
-                f"Error processing document {file_config.document_path}: {str(e)}",
+                "Error processing document %s: %s",
+                file_config.document_path,
+                e,
                 exc_info=True,
             )
             return SummaryResponse(
@@ -1470,14 +2013,25 @@ class SummaryService:
         prompt_config: PromptConfig,
         file_config: FileConfig,
         data_result: DataResult,
+        transcript_stream: Optional[AsyncIterable[str]] = None,
+        transcription_stats: Optional[TranscriptionStats] = None,
     ) -> SummaryResponse:
+        """Summarize a transcription read from ``file_config.transcription_path``.
+
+        When ``transcript_stream`` is given, transcript lines are consumed as
+        they are produced instead: they are chunked incrementally and the map
+        phase starts with the first full chunk, while transcription continues.
+        ``transcription_stats`` (complete once the transcript is) goes into
+        the token history of the job.
+        """
         encoder = get_encoder(prompt_config.model)
         logger.info(
-            f"Starting transcription processing: {file_config.transcription_path}"
+            "Starting transcription processing: %s", file_config.transcription_path
         )
 
         try:
             self.client = await self.api_service._initialize_client(prompt_config.model)
+            self.client_model = prompt_config.model
             logger.debug("Generating prompt...")
 
             try:
@@ -1488,9 +2042,9 @@ class SummaryService:
                     lang=prompt_config.language,
                     summary_level=prompt_config.summary_level,
                 )
-                logger.debug(f"Prompt generated successfully, length: {len(prompt)}")
+                logger.debug("Prompt generated successfully, length: %s", len(prompt))
             except Exception as e:
-                logger.error(f"Failed to generate prompt: {str(e)}", exc_info=True)
+                logger.error("Failed to generate prompt: %s", e, exc_info=True)
                 return SummaryResponse(
                     success=False,
                     summary="",
@@ -1498,7 +2052,7 @@ class SummaryService:
                 )
 
             logger.debug(
-                f"Acquired file_semaphore for {file_config.transcription_path}"
+                "Acquired file_semaphore for %s", file_config.transcription_path
             )
 
             try:
@@ -1506,114 +2060,199 @@ class SummaryService:
                     raise ValueError(
                         "Both transcription_path and summary_path must be provided"
                     )
-                file_exists = await asyncio.to_thread(
-                    os.path.exists, file_config.transcription_path
-                )
-                if not file_exists:
-                    raise FileNotFoundError(
-                        f"Transcription file not found: {file_config.transcription_path}"
+                if transcript_stream is not None:
+                    # Lines arrive while the audio is still being transcribed;
+                    # only the head is needed before the map phase can start.
+                    head, transcript_stream = await self._peek_stream(
+                        transcript_stream, 2000
                     )
+                    transcription = "\n".join(head)
+                else:
+                    file_exists = await asyncio.to_thread(
+                        os.path.exists, file_config.transcription_path
+                    )
+                    if not file_exists:
+                        raise FileNotFoundError(
+                            f"Transcription file not found: {file_config.transcription_path}"
+                        )
 
-                try:
-                    await self.directory_manager.validate_paths(
+                    try:
+                        await self.directory_manager.validate_paths(
+                            file_config.transcription_path
+                        )
+                    except Exception as e:
+                        logger.error("Path validation failed: %s", e)
+                        return SummaryResponse(
+                            success=False,
+                            summary="",
+                            message=f"Path validation failed: {str(e)}",
+                        )
+
+                    transcription = await self.directory_manager.read_transcription(
                         file_config.transcription_path
                     )
-                except Exception as e:
-                    logger.error(f"Path validation failed: {str(e)}")
-                    return SummaryResponse(
-                        success=False,
-                        summary="",
-                        message=f"Path validation failed: {str(e)}",
-                    )
-
-                transcription = await self.directory_manager.read_transcription(
-                    file_config.transcription_path
-                )
                 if not transcription or transcription.strip() == "":
                     raise ValueError(
                         "Transcription is empty or contains only whitespace"
                     )
 
-                input_tokens = len(encoder.encode(transcription))
-                logger.debug(f"Transcription read successfully: {input_tokens} tokens")
+                if (
+                    prompt_config.input_language is not None
+                    and whisper_language_code(prompt_config.input_language) is not None
+                ):
+                    # The language is known and Whisper decoded with it; a
+                    # language Whisper does not support was auto-detected.
+                    self.history_token_model.language_input = (
+                        prompt_config.input_language.name.lower()
+                    )
+                    self.history_token_model.language_input_source = "hint"
+                    logger.info(
+                        "Using input language hint: %s",
+                        prompt_config.input_language.value,
+                    )
+                else:
+                    self.history_token_model.language_input_source = "detected"
+                    try:
+                        text_sample = transcription[:2000]
+                        if text_sample.strip():
+                            detected = await self.detect_language_with_retry_safe(
+                                text_sample
+                            )
+                            detected_language = (
+                                detected
+                                if detected in LanguageType._value2member_map_
+                                else "en"
+                            )
+                        else:
+                            detected_language = "en"
 
-                try:
-                    text_sample = transcription[:2000]
-                    if text_sample.strip():
-                        detected = await self.detect_language_with_retry_safe(
-                            text_sample
-                        )
-                        detected_language = (
-                            detected
-                            if detected in LanguageType._value2member_map_
-                            else "en"
+                        self.history_token_model.language_input = LanguageType(
+                            detected_language
+                        ).name.lower()
+                        logger.info("Detected language: %s", detected_language)
+                    except Exception as e:
+                        logger.error(
+                            "Language detection failed: %s, defaulting to English",
+                            e,
+                            exc_info=True,
                         )
-                    else:
                         detected_language = "en"
-
-                    self.history_token_model.language_input = LanguageType(
-                        detected_language
-                    ).name.lower()
-                    logger.info(f"Detected language: {detected_language}")
-                except Exception as e:
-                    logger.error(
-                        f"Language detection failed: {str(e)}, defaulting to English",
-                        exc_info=True,
-                    )
-                    detected_language = "en"
-                    self.history_token_model.language_input = LanguageType(
-                        "en"
-                    ).name.lower()
+                        self.history_token_model.language_input = LanguageType(
+                            "en"
+                        ).name.lower()
 
                 self.history_token_model.language_output = (
                     prompt_config.language.name.lower()
                 )
-                self.history_token_model.num_tokens_file = input_tokens
-                self.history_token_model.num_chars_file = len(transcription)
                 self.history_token_model.total_time = data_result.duration
 
-                total_input_tokens = len(encoder.encode(transcription))
-
-                logger.debug(
-                    f"Input statistics: total_tokens={total_input_tokens}, "
-                    f"prompt_tokens={len(encoder.encode(prompt))}, transcription_tokens={input_tokens}"
-                )
-
-                if total_input_tokens <= self.max_tokens_per_chunk:
-                    logger.debug("No chunking needed, processing as single chunk")
-                    chunks = [transcription]
-                else:
-                    overlap = int(
-                        self.max_tokens_per_chunk * self._percent_chunk_overlap
+                if transcript_stream is not None:
+                    self.history_token_model.num_tokens_file = 0
+                    self.history_token_model.num_chars_file = 0
+
+                    async def counted_lines() -> AsyncGenerator[str, None]:
+                        assert transcript_stream is not None
+                        async for line in transcript_stream:
+                            self.history_token_model.num_chars_file += len(line) + 1
+                            yield line
+
+                    logger.info("Summarizing transcription stream")
+                    summary_call = self.process_chunk_stream(
+                        self.stream_chunks(
+                            counted_lines(),
+                            self.max_tokens_per_chunk,
+                            self._percent_chunk_overlap,
+                            prompt_config.model,
+                        ),
+                        prompt,
+                        prompt_config.model,
+                        prompt_config.language,
                     )
+                else:
+                    input_tokens = len(encoder.encode(transcription))
                     logger.debug(
-                        f"Creating chunks: size={self.max_tokens_per_chunk}, overlap={overlap}"
+                        "Transcription read successfully: %s tokens", input_tokens
                     )
-                    chunks = await self.chunk_text(
+                    self.history_token_model.num_tokens_file = input_tokens
+                    self.history_token_model.num_chars_file = len(transcription)
+
+                    (
                         transcription,
-                        self.max_tokens_per_chunk,
-                        overlap,
-                        prompt_config.model,
+                        total_input_tokens,
+                    ) = await self._extractive_reduce(
+                        transcription,
+                        input_tokens,
+                        prompt_config.summary_level,
+                        encoder,
+                        by_line=True,
                     )
 
-                logger.info(f"Processing {len(chunks)} chunks for transcription")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Input statistics: total_tokens=%s, prompt_tokens=%s, "
+                            "transcription_tokens=%s",
+                            total_input_tokens,
+                            len(encoder.encode(prompt)),
+                            input_tokens,
+                        )
 
-                try:
-                    (
-                        full_summary,
-                        total_tokens_used,
-                    ) = await self.process_chunks_in_groups(
+                    if total_input_tokens <= self.max_tokens_per_chunk:
+                        logger.debug("No chunking needed, processing as single chunk")
+                        chunks = [transcription]
+                    else:
+                        overlap = int(
+                            self.max_tokens_per_chunk * self._percent_chunk_overlap
+                        )
+                        logger.debug(
+                            "Creating chunks: size=%s, overlap=%s",
+                            self.max_tokens_per_chunk,
+                            overlap,
+                        )
+                        chunks = await self.chunk_text(
+                            transcription,
+                            self.max_tokens_per_chunk,
+                            overlap,
+                            prompt_config.model,
+                        )
+
+                    logger.info("Processing %s chunks for transcription", len(chunks))
+                    summary_call = self.process_chunks_in_groups(
                         chunks, prompt, prompt_config.model, prompt_config.language
                     )
 
+                try:
+                    full_summary, total_tokens_used = await summary_call
+                    if transcript_stream is not None:
+                        input_tokens = total_input_tokens = (
+                            self.history_token_model.num_tokens_file
+                        )
+                    stats = transcription_stats or TranscriptionStats()
+                    self.history_token_model.vad_skipped_seconds = round(
+                        stats.vad_skipped_seconds, 3
+                    )
+                    self.history_token_model.vad_skipped_ratio = round(
+                        stats.vad_skipped_ratio, 4
+                    )
+                    if stats.model_load is not None:
+                        self.history_token_model.whisper_load_seconds = (
+                            stats.model_load.load_seconds
+                        )
+                        self.history_token_model.whisper_parameter_mb = (
+                            stats.model_load.parameter_mb
+                        )
+                        self.history_token_model.whisper_peak_rss_delta_mb = (
+                            stats.model_load.peak_rss_delta_mb
+                        )
+
                     if not full_summary or full_summary.strip() == "":
                         raise ValueError("Generated summary is empty")
 
                     logger.debug(
-                        f"Summary generated successfully: {len(full_summary)} characters"
+                        "Summary generated successfully: %s characters",
+                        len(full_summary),
                     )
                 except Exception as e:
-                    logger.error(f"Failed to generate summary: {str(e)}", exc_info=True)
+                    logger.error("Failed to generate summary: %s", e, exc_info=True)
                     return SummaryResponse(
                         success=False,
                         summary="",
@@ -1638,15 +2277,14 @@ class SummaryService:
                             prompt_config.language,
                         )
                         logger.debug(
-                            f"Summary postprocessed successfully: {len(final_summary)} characters"
+                            "Summary postprocessed successfully: %s characters",
+                            len(final_summary),
                         )
                     else:
                         logger.warning("Clean summary too short for postprocessing")
                         final_summary = clean_summary
                 except Exception as e:
-                    logger.error(
-                        f"Failed to postprocess summary: {str(e)}", exc_info=True
-                    )
+                    logger.error("Failed to postprocess summary: %s", e, exc_info=True)
                     final_summary = full_summary
 
                 try:
@@ -1659,10 +2297,10 @@ class SummaryService:
                         final_summary, file_config.summary_path
                     )
                     logger.info(
-                        f"Summary written successfully to {file_config.summary_path}"
+                        "Summary written successfully to %s", file_config.summary_path
                     )
                 except Exception as e:
-                    logger.error(f"Failed to write summary: {str(e)}", exc_info=True)
+                    logger.error("Failed to write summary: %s", e, exc_info=True)
                     return SummaryResponse(
                         success=False,
                         summary=final_summary,
@@ -1676,15 +2314,16 @@ class SummaryService:
 
                     logger.info("DOCX version created successfully")
                 except Exception as e:
-                    logger.error(
-                        f"Failed to create DOCX version: {str(e)}", exc_info=True
-                    )
+                    logger.error("Failed to create DOCX version: %s", e, exc_info=True)
 
                 summary_tokens = len(encoder.encode(final_summary))
                 logger.info(
-                    f"Summary completed successfully: "
-                    f"input_tokens={total_input_tokens}, summary_tokens={summary_tokens}, "
-                    f"total_used_tokens={total_tokens_used}, compression_ratio={summary_tokens/input_tokens:.2f}"
+                    "Summary completed successfully: input_tokens=%s, "
+                    "summary_tokens=%s, total_used_tokens=%s, compression_ratio=%.2f",
+                    total_input_tokens,
+                    summary_tokens,
+                    total_tokens_used,
+                    summary_tokens / input_tokens,
                 )
 
                 await save_log_to_json(
@@ -1701,27 +2340,27 @@ class SummaryService:
 
             except asyncio.CancelledError:
                 logger.warning(
-                    f"Processing cancelled: {file_config.transcription_path}"
+                    "Processing cancelled: %s", file_config.transcription_path
                 )
                 raise
             except Exception as e:
-                logger.error(f"Error in processing block: {str(e)}", exc_info=True)
+                logger.error("Error in processing block: %s", e, exc_info=True)
                 return SummaryResponse(
                     success=False, summary="", message=f"Processing error: {str(e)}"
                 )
             finally:
                 logger.debug(
-                    f"Released file_semaphore for {file_config.transcription_path}"
+                    "Released file_semaphore for %s", file_config.transcription_path
                 )
 
         except asyncio.CancelledError:
             logger.warning(
-                f"Transcription processing cancelled: {file_config.transcription_path}"
+                "Transcription processing cancelled: %s", file_config.transcription_path
             )
             raise
         except Exception as e:
             logger.error(
-                f"Unexpected error processing transcription: {str(e)}", exc_info=True
+                "Unexpected error processing transcription: %s", e, exc_info=True
             )
             return SummaryResponse(
                 success=False, summary="", message=f"Unexpected error: {str(e)}"
@@ -1733,9 +2372,10 @@ class SummaryService:
         file_config: FileConfig,
     ) -> SummaryResponse:
         logger.info(
-            f"Starting summary generation for document: {file_config.document_path}"
+            "Starting summary generation for document: %s", file_config.document_path
         )
         self.client = await self.api_service._initialize_client(prompt_config.model)
+        self.client_model = prompt_config.model
         try:
             async with self.lifespan():
                 results = await self.generate_summary_documents(
@@ -1745,7 +2385,7 @@ class SummaryService:
                     logger.error("No results returned from summary generation")
                     raise ValueError("No results returned from summary generation")
                 logger.info(
-                    f"Summary generation completed for {file_config.document_path}"
+                    "Summary generation completed for %s", file_config.document_path
                 )
                 await self.api_service.shutdown()
                 return results[0]
@@ -1757,9 +2397,7 @@ class SummaryService:
             await self.api_service.shutdown()
             raise
         except Exception as e:
-            logger.error(
-                f"Error generating summary for document: {str(e)}", exc_info=True
-            )
+            logger.error("Error generating summary for document: %s", e, exc_info=True)
             return SummaryResponse(
                 success=False, summary="", message=f"Error generating summary: {str(e)}"
             )
@@ -1769,35 +2407,44 @@ class SummaryService:
     ) -> None:
         async with self.lifespan():
             logger.info(
-                f"User {user_id} starting summary generation for {len(file_configs)} documents"
+                "User %s starting summary generation for %s documents",
+                user_id,
+                len(file_configs),
             )
             try:
                 results = await self.generate_summary_documents(
                     prompt_config, file_configs
                 )
+                if not logger.isEnabledFor(logging.INFO):
+                    return
+                encoder = get_encoder(prompt_config.model)
                 for file_config, result in zip(file_configs, results):
-                    encoder = get_encoder(prompt_config.model)
-                    tokens = encoder.encode(result.summary)
-                    summary_tokens = len(tokens)
                     logger.info(
-                        f"User {user_id} summary completed for {file_config.document_path}: "
-                        f"success={result.success}, "
-                        f"summary_tokens={summary_tokens}, "
-                        f"message={result.message}, "
-                        f"preview={result.summary[:50]}..."
+                        "User %s summary completed for %s: success=%s, "
+                        "summary_tokens=%s, message=%s, preview=%s...",
+                        user_id,
+                        file_config.document_path,
+                        result.success,
+                        len(encoder.encode(result.summary)),
+                        result.message,
+                        result.summary[:50],
                     )
             except asyncio.CancelledError:
-                logger.info(f"Summary processing cancelled for user {user_id}")
+                logger.info("Summary processing cancelled for user %s", user_id)
                 raise
             except KeyboardInterrupt:
                 logger.info(
-                    f"Received KeyboardInterrupt for user {user_id}, initiating graceful shutdown"
+                    "Received KeyboardInterrupt for user %s, "
+                    "initiating graceful shutdown",
+                    user_id,
                 )
                 await self.api_service.shutdown()
                 raise
             except Exception as e:
                 logger.error(
-                    f"Error processing summaries for user {user_id}: {str(e)}",
+                    "Error processing summaries for user %s: %s",
+                    user_id,
+                    e,
                     exc_info=True,
                 )
                 raise
@@ -0,0 +1,116 @@
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+from core.brevio.constants.constants import Constants
+from core.brevio.managers.whisper_model_registry import (
+    WHISPER_MODEL,
+    WhisperModelRegistry,
+)
+from core.brevio.models.transcription_cache_model import TranscriptionCacheEntry
+from core.shared.utils.gzip_store_utils import GzipJsonStore
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptionCacheService:
+    """On-disk store of finished transcriptions shared across jobs and users.
+
+    Entries are keyed by the media source (video id and extractor for online
+    media, content hash for uploads) together with the transcription backend,
+    model size and language hint, so a hit can skip the download and Whisper
+    entirely.
+    Entries older than ``ttl_seconds`` are dropped on read and, once the store
+    exceeds ``max_bytes``, the least recently used entries are evicted.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        enabled: Optional[bool] = None,
+    ) -> None:
+        self.cache_dir = Path(
+            cache_dir
+            or os.getenv("TRANSCRIPTION_CACHE_DIR")
+            or os.path.join(Constants.DESTINATION_FOLDER, ".transcription_cache")
+        )
+        self.max_bytes = (
+            max_bytes
+            if max_bytes is not None
+            else int(os.getenv("TRANSCRIPTION_CACHE_MAX_MB", 1024)) * 1024 * 1024
+        )
+        self.ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else float(os.getenv("TRANSCRIPTION_CACHE_TTL_DAYS", 30)) * 86400
+        )
+        self.enabled = (
+            enabled
+            if enabled is not None
+            else os.getenv("TRANSCRIPTION_CACHE", "true").lower() == "true"
+        )
+        self._store = GzipJsonStore(self.cache_dir, TranscriptionCacheEntry)
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def source_for_upload(content_hash: str) -> str:
+        return f"sha256:{content_hash}"
+
+    @staticmethod
+    def source_for_video(extractor: str, video_id: str) -> str:
+        return f"{extractor.lower()}:{video_id}"
+
+    @staticmethod
+    def _key(source: str, backend: str, model_size: str, language: str) -> str:
+        return hashlib.sha256(
+            f"{source}|{backend}|{model_size}|{language}".encode()
+        ).hexdigest()
+
+    async def get(
+        self,
+        source: str,
+        language: str = "auto",
+        model_size: Optional[str] = None,
+        backend: Optional[str] = None,
+    ) -> Optional[TranscriptionCacheEntry]:
+        if not self.enabled:
+            return None
+        backend = backend or WhisperModelRegistry.backend().name
+        key = self._key(source, backend, model_size or WHISPER_MODEL, language)
+        entry = await asyncio.to_thread(self._store.read, key)
+        if entry is not None and time.time() - entry.created_at > self.ttl_seconds:
+            await asyncio.to_thread(self._store.delete, key)
+            entry = None
+        logger.info("Transcription cache %s for %s", "hit" if entry else "miss", source)
+        return entry
+
+    async def put(
+        self,
+        source: str,
+        text: str,
+        language: str = "auto",
+        model_size: Optional[str] = None,
+        backend: Optional[str] = None,
+    ) -> None:
+        if not self.enabled or not text.strip():
+            return
+        entry = TranscriptionCacheEntry(
+            source=source,
+            backend=backend or WhisperModelRegistry.backend().name,
+            model_size=model_size or WHISPER_MODEL,
+            language=language,
+            text=text,
+        )
+        key = self._key(source, entry.backend, entry.model_size, language)
+        async with self._lock:
+            try:
+                await asyncio.to_thread(self._store.write, key, entry)
+                await asyncio.to_thread(self._store.evict, self.max_bytes)
+            except OSError as e:
+                logger.warning("Could not store transcription cache entry: %s", e)
@@ -1,14 +1,142 @@
 import asyncio
+import itertools
 import logging
 import os
+import time
+from collections import deque
+from contextlib import suppress
+from functools import partial
 from os.path import exists, join
-from typing import Any, Optional, Type
+from typing import (
+    Any,
+    AsyncGenerator,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
-import whisper
+import numpy as np
 
 from core.brevio.constants.constants import Constants
 from core.brevio.enums.language import LanguageType
+from core.brevio.managers.transcription_backends import whisper_language_code
+from core.brevio.managers.whisper_model_registry import (
+    WHISPER_MODEL,
+    WhisperModelRegistry,
+)
+from core.brevio.models.transcription_stats_model import TranscriptionStats
+from core.brevio.protocols.transcription_backend_protocol import (
+    TranscriptionBackendProtocol,
+)
+from core.brevio.services.media_decode_service import MediaDecodeService
 from core.brevio.utils.utils import format_time
+from core.shared.utils.audio_segment_utils import (
+    SAMPLE_RATE,
+    extract_speech,
+    load_audio_range,
+    plan_segments,
+    remap_timestamp,
+    silences_from_pcm,
+    speech_regions,
+)
+from core.shared.utils.process_pool_utils import available_cpus, get_process_pool
+
+# "single" transcribes the whole file in one call; "segmented" cuts it at
+# silences and transcribes the pieces in parallel worker processes.
+TRANSCRIPTION_MODE = os.getenv("TRANSCRIPTION_MODE", "single").lower()
+TRANSCRIPTION_WORKERS = max(
+    1, int(os.getenv("TRANSCRIPTION_WORKERS", 0)) or available_cpus() // 2
+)
+TRANSCRIPTION_SEGMENT_SECONDS = float(os.getenv("TRANSCRIPTION_SEGMENT_SECONDS", 300))
+TRANSCRIPTION_SEGMENT_MIN_SECONDS = float(
+    os.getenv("TRANSCRIPTION_SEGMENT_MIN_SECONDS", 600)
+)
+# Only transcribe the speech regions found by voice-activity detection.
+TRANSCRIPTION_VAD = os.getenv("TRANSCRIPTION_VAD", "false").lower() == "true"
+
+_torch_threads: Optional[int] = None
+
+
+def _set_torch_threads(threads: int) -> None:
+    global _torch_threads
+    if threads <= 0 or _torch_threads == threads:
+        return
+    import torch
+
+    torch.set_num_threads(threads)
+    _torch_threads = threads
+
+
+def transcribe_audio(
+    backend: TranscriptionBackendProtocol,
+    model: Any,
+    audio: np.ndarray,
+    vad: bool = False,
+    language: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], float]:
+    """Transcribe decoded ``audio``, only its speech regions when ``vad`` is set.
+
+    Returns the segments, timed from the start of ``audio``, and the number of
+    seconds VAD left out.
+    """
+    if not vad:
+        return backend.transcribe(model, audio, language), 0.0
+    speech, offsets = extract_speech(audio, speech_regions(audio))
+    skipped = (len(audio) - len(speech)) / SAMPLE_RATE
+    if not len(speech):
+        return [], skipped
+    return [
+        {
+            "start": remap_timestamp(segment["start"], offsets),
+            "end": remap_timestamp(segment["end"], offsets),
+            "text": segment["text"],
+        }
+        for segment in backend.transcribe(model, speech, language)
+    ], skipped
+
+
+def transcribe_segment(
+    audio: Union[str, np.ndarray],
+    start: float,
+    end: float,
+    model_size: str,
+    threads: int = 0,
+    vad: bool = False,
+    language: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], float]:
+    """Transcribe ``[start, end)`` of ``audio`` with absolute timestamps.
+
+    ``audio`` is either the decoded samples or a file path; process-pool
+    workers get the path of the memory-mapped samples. Each worker keeps its
+    own model in ``WhisperModelRegistry`` and limits torch to ``threads``
+    intra-op threads so that the workers together do not oversubscribe the
+    cores. Returns the segments and the seconds skipped by VAD.
+    """
+    _set_torch_threads(threads)
+    model = WhisperModelRegistry.load(model_size)
+    segments, skipped = transcribe_audio(
+        WhisperModelRegistry.backend(),
+        model,
+        (
+            audio[int(start * SAMPLE_RATE) : int(end * SAMPLE_RATE)]
+            if isinstance(audio, np.ndarray)
+            else load_audio_range(audio, start, end)
+        ),
+        vad,
+        language,
+    )
+    return [
+        {
+            "start": start + segment["start"],
+            "end": start + segment["end"],
+            "text": segment["text"],
+        }
+        for segment in segments
+    ], skipped
 
 
 class TranscriptionService:
@@ -24,14 +152,6 @@ class TranscriptionService:
         if not cls._instance:
             cls._instance = super(TranscriptionService, cls).__new__(cls)
             cls._instance.logger = logging.getLogger(__name__)
-            cls._instance.logger.setLevel(logging.DEBUG)
-            if not cls._instance.logger.handlers:
-                handler = logging.StreamHandler()
-                formatter = logging.Formatter(
-                    "%(asctime)s - %(levelname)s - %(message)s"
-                )
-                handler.setFormatter(formatter)
-                cls._instance.logger.addHandler(handler)
             cls._instance.logger.info("Creating new instance of TranscriptionService")
         else:
             cls._instance.logger.info(
@@ -44,6 +164,7 @@ class TranscriptionService:
             from ..managers.directory_manager import DirectoryManager
 
             self._directory_manager = DirectoryManager()
+            self._decoder = MediaDecodeService()
             self._directory_manager_initialized = True
             self.logger.debug("DirectoryManager initialized")
 
@@ -61,34 +182,330 @@ class TranscriptionService:
         with open(path, "w", encoding="utf-8") as f:
             f.write(content)
 
+    def _plan_segments(
+        self, audio: np.ndarray, streaming: bool = False
+    ) -> List[Tuple[float, float]]:
+        # Streaming always cuts at silences so that the first lines are out
+        # after one segment instead of after the whole file.
+        duration = len(audio) / SAMPLE_RATE
+        if TRANSCRIPTION_MODE != "segmented" and not streaming:
+            return []
+        if duration < TRANSCRIPTION_SEGMENT_MIN_SECONDS and not streaming:
+            return []
+        return plan_segments(
+            duration, silences_from_pcm(audio), TRANSCRIPTION_SEGMENT_SECONDS
+        )
+
+    @staticmethod
+    def needs_decoded_audio(streaming: bool = False) -> bool:
+        """Whether transcribing works on decoded samples (VAD, segmentation or
+        streaming) rather than letting the backend read the file itself."""
+        return TRANSCRIPTION_VAD or TRANSCRIPTION_MODE == "segmented" or streaming
+
+    async def decode_audio(
+        self, audio_path: str, streaming: bool = False
+    ) -> Optional[np.ndarray]:
+        """Decode ``audio_path`` ahead of ``generate_transcription`` or
+        ``stream_transcription``; None when the transcription will not need
+        the samples or decoding failed."""
+        if not self.needs_decoded_audio(streaming):
+            return None
+        return await self._decode(audio_path)
+
+    async def _iter_transcription(
+        self,
+        audio_path: str,
+        streaming: bool = False,
+        language: Optional[str] = None,
+        audio: Optional[np.ndarray] = None,
+        stats: Optional[TranscriptionStats] = None,
+    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """Yield the transcribed segments of ``audio_path`` in order, one batch
+        per planned audio segment (a single batch when it is not split).
+
+        ``language`` is passed to the backend as a decode hint; without it the
+        backend detects the spoken language itself. When VAD or segmentation
+        need the samples, the file is decoded once (or ``audio`` from
+        ``decode_audio`` is used) and every stage works on views of that buffer.
+        ``stats``, when given, receives the audio length and what VAD skipped.
+        """
+        self.logger.info(
+            "Transcription language for %s: %s",
+            audio_path,
+            f"hint {language}" if language else "auto-detect",
+        )
+        if audio is None and self.needs_decoded_audio(streaming):
+            audio = await self._decode(audio_path)
+        if audio is None:
+            # Only the backend needs the samples: it decodes the file itself
+            # in a single pass.
+            model = await WhisperModelRegistry.get_model()
+            self.logger.debug("Whisper model ready")
+            backend = WhisperModelRegistry.backend()
+            yield await WhisperModelRegistry.run_inference(
+                lambda: backend.transcribe(model, audio_path, language)
+            )
+            self._record_model_load(stats)
+            return
+
+        mmap_path = MediaDecodeService.mmap_path_for(audio_path)
+        try:
+            async for segments in self._iter_decoded(
+                audio_path, audio, mmap_path, streaming, language, stats
+            ):
+                yield segments
+        finally:
+            with suppress(FileNotFoundError):
+                os.remove(mmap_path)
+
+    async def _decode(self, audio_path: str) -> Optional[np.ndarray]:
+        start_time = time.perf_counter()
+        try:
+            audio = await asyncio.to_thread(
+                self._decoder.decode,
+                audio_path,
+                MediaDecodeService.mmap_path_for(audio_path),
+            )
+        except (OSError, RuntimeError) as e:
+            self.logger.warning(
+                "Decoding failed for %s, transcribing the file in one pass: %s",
+                audio_path,
+                e,
+            )
+            return None
+        self.logger.info(
+            "Decoded %s (%.0f s of audio) in %.2f s",
+            audio_path,
+            len(audio) / SAMPLE_RATE,
+            time.perf_counter() - start_time,
+        )
+        return audio
+
+    async def _iter_decoded(
+        self,
+        audio_path: str,
+        audio: np.ndarray,
+        mmap_path: str,
+        streaming: bool,
+        language: Optional[str],
+        stats: Optional[TranscriptionStats] = None,
+    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        plan = await asyncio.to_thread(self._plan_segments, audio, streaming)
+        if len(plan) <= 1:
+            model = await WhisperModelRegistry.get_model()
+            self.logger.debug("Whisper model ready")
+            backend = WhisperModelRegistry.backend()
+            segments, skipped = await WhisperModelRegistry.run_inference(
+                lambda: transcribe_audio(
+                    backend, model, audio, TRANSCRIPTION_VAD, language
+                )
+            )
+            self._record_vad_skip(audio_path, skipped, len(audio) / SAMPLE_RATE, stats)
+            self._record_model_load(stats)
+            yield segments
+            return
+
+        start_time = time.perf_counter()
+        skipped = 0.0
+        # The pool keeps a fixed size so that jobs of any length share the
+        # same workers (and their loaded models); each job keeps at most one
+        # segment per worker in flight so that overlapping jobs interleave.
+        workers = min(TRANSCRIPTION_WORKERS, len(plan))
+        # Streaming in "single" mode also plans segments, only to yield lines
+        # early: they run in process on the registry's model.
+        pool = (
+            get_process_pool("transcription", TRANSCRIPTION_WORKERS)
+            if workers > 1 and TRANSCRIPTION_MODE == "segmented"
+            else None
+        )
+        if pool is not None:
+            # Workers map the decoded samples from disk instead of each
+            # receiving a pickled copy.
+            if not isinstance(audio, np.memmap):
+                await asyncio.to_thread(np.save, mmap_path, audio)
+            threads = max(1, available_cpus() // TRANSCRIPTION_WORKERS)
+            loop = asyncio.get_running_loop()
+            pending: Deque["asyncio.Future[Tuple[List[Dict[str, Any]], float]]"] = (
+                deque()
+            )
+            remaining = iter(plan)
+
+            def submit() -> None:
+                for start, end in itertools.islice(remaining, workers - len(pending)):
+                    pending.append(
+                        loop.run_in_executor(
+                            pool,
+                            transcribe_segment,
+                            mmap_path,
+                            start,
+                            end,
+                            WHISPER_MODEL,
+                            threads,
+                            TRANSCRIPTION_VAD,
+                            language,
+                        )
+                    )
+
+            try:
+                submit()
+                while pending:
+                    segments, segment_skipped = await pending.popleft()
+                    submit()
+                    skipped += segment_skipped
+                    yield segments
+            finally:
+                for future in pending:
+                    future.cancel()
+        else:
+            # One process: the shared inference executor keeps the model single.
+            for start, end in plan:
+                segments, segment_skipped = await WhisperModelRegistry.run_inference(
+                    partial(
+                        transcribe_segment,
+                        audio,
+                        start,
+                        end,
+                        WHISPER_MODEL,
+                        vad=TRANSCRIPTION_VAD,
+                        language=language,
+                    )
+                )
+                skipped += segment_skipped
+                yield segments
+        self.logger.info(
+            "Transcribed %s in %s segments with %s workers in %.2f s (audio %.0f s)",
+            audio_path,
+            len(plan),
+            workers if pool is not None else 1,
+            time.perf_counter() - start_time,
+            plan[-1][1],
+        )
+        self._record_vad_skip(audio_path, skipped, plan[-1][1], stats)
+        if pool is None:
+            self._record_model_load(stats)
+
+    @staticmethod
+    def _record_model_load(stats: Optional[TranscriptionStats]) -> None:
+        if stats is not None:
+            stats.model_load = WhisperModelRegistry.metrics().get(WHISPER_MODEL)
+
+    def _record_vad_skip(
+        self,
+        audio_path: str,
+        skipped: float,
+        duration: float,
+        stats: Optional[TranscriptionStats],
+    ) -> None:
+        if stats is not None:
+            stats.audio_seconds = duration
+            stats.vad_skipped_seconds = skipped
+        if not TRANSCRIPTION_VAD:
+            return
+        self.logger.info(
+            "VAD skipped %.1f of %.1f s of %s (%.1f%%)",
+            skipped,
+            duration,
+            audio_path,
+            100 * skipped / duration if duration else 0.0,
+        )
+
+    async def _transcribe(
+        self,
+        audio_path: str,
+        language: Optional[str] = None,
+        audio: Optional[np.ndarray] = None,
+        stats: Optional[TranscriptionStats] = None,
+    ) -> List[Dict[str, Any]]:
+        return [
+            segment
+            async for segments in self._iter_transcription(
+                audio_path, language=language, audio=audio, stats=stats
+            )
+            for segment in segments
+        ]
+
+    async def stream_transcription(
+        self,
+        audio_path: str,
+        destination_path: str,
+        language: LanguageType,
+        input_language: Optional[LanguageType] = None,
+        audio: Optional[np.ndarray] = None,
+        stats: Optional[TranscriptionStats] = None,
+    ) -> AsyncGenerator[str, None]:
+        """Yield the formatted transcription line by line as audio is decoded.
+
+        Lines are appended to ``transcription.txt`` as they are produced, so
+        the file is complete once the generator is exhausted.
+        ``input_language`` is the spoken language, when known, ``audio``
+        the samples already returned by ``decode_audio`` and ``stats`` is
+        filled in once the generator is exhausted.
+        """
+        self.logger.info(
+            "Starting streaming transcription for %s in %s",
+            audio_path,
+            language.value,
+        )
+        self._validate_paths(audio_path, destination_path)
+        transcription_path = os.path.join(
+            destination_path, Constants.TRANSCRIPTION_FILE
+        )
+        lines_written = 0
+        f = await asyncio.to_thread(open, transcription_path, "w", encoding="utf-8")
+        try:
+            async for segments in self._iter_transcription(
+                audio_path, True, whisper_language_code(input_language), audio, stats
+            ):
+                lines = [
+                    f"{format_time(segment['start'])} {segment['text']}"
+                    for segment in segments
+                ]
+                if not lines:
+                    continue
+                content = ("\n" if lines_written else "") + "\n".join(lines)
+                await asyncio.to_thread(f.write, content)
+                lines_written += len(lines)
+                for line in lines:
+                    yield line
+        except Exception as e:
+            self.logger.error("Unexpected error in transcription: %s", e)
+            raise
+        finally:
+            f.close()
+        self.logger.info(
+            "Streaming transcription completed: %s lines to %s",
+            lines_written,
+            transcription_path,
+        )
+
     async def generate_transcription(
         self,
         audio_path: str,
         destination_path: str,
         language: LanguageType,
+        input_language: Optional[LanguageType] = None,
+        audio: Optional[np.ndarray] = None,
+        stats: Optional[TranscriptionStats] = None,
     ) -> str:
         try:
             self.logger.info(
-                f"Starting transcription for {audio_path} in {language.value}"
+                "Starting transcription for %s in %s", audio_path, language.value
             )
             self._validate_paths(audio_path, destination_path)
 
-            model = whisper.load_model("small")
-            self.logger.debug("Whisper model loaded successfully")
-
             loop = asyncio.get_running_loop()
-            result = await loop.run_in_executor(
-                None, lambda: model.transcribe(audio_path)
+            segments = await self._transcribe(
+                audio_path, whisper_language_code(input_language), audio, stats
             )
             self.logger.info("Transcription completed successfully")
 
-            if not result.get("segments"):
+            if not segments:
                 self.logger.info("No segments found in transcription result")
                 transcription_text = ""
             else:
                 transcription_text = "\n".join(
                     f"{format_time(segment['start'])} {segment['text']}"
-                    for segment in result["segments"]
+                    for segment in segments
                 )
 
             transcription_path = os.path.join(
@@ -103,5 +520,5 @@ class TranscriptionService:
 
             return transcription_text
         except Exception as e:
-            self.logger.error(f"Unexpected error in transcription: {str(e)}")
+            self.logger.error("Unexpected error in transcription: %s", e)
             raise
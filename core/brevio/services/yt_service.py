@@ -1,54 +1,129 @@
 import asyncio
+import glob
 import logging
 import os
-from typing import Any, Coroutine, Dict, List, Optional
+import weakref
+from typing import Any, AsyncGenerator, Coroutine, Dict, List, Optional, Tuple
 
 import yt_dlp
 from pydantic import HttpUrl, ValidationError
+from yt_dlp.extractor import gen_extractor_classes
+
+from core.brevio.services.media_metadata_service import MediaMetadataService
+
+# Per-video metadata extractions run at once when a playlist lacks durations.
+YT_DURATION_CONCURRENCY = max(1, int(os.getenv("YT_DURATION_CONCURRENCY", 8)))
+# "native" keeps the source audio stream (opus/m4a) for the decode stage;
+# "mp3" re-encodes it with ffmpeg after the download.
+YT_AUDIO_FORMAT = os.getenv("YT_AUDIO_FORMAT", "native").lower()
+YT_FRAGMENT_CONCURRENCY = max(1, int(os.getenv("YT_FRAGMENT_CONCURRENCY", 4)))
+YT_DOWNLOAD_CONCURRENCY = max(1, int(os.getenv("YT_DOWNLOAD_CONCURRENCY", 3)))
+# Download budget in MB/s shared by the concurrent downloads (0: unlimited).
+YT_DOWNLOAD_BANDWIDTH_MBPS = float(os.getenv("YT_DOWNLOAD_BANDWIDTH_MBPS", 0))
+# Most entries taken from one playlist or channel (0: all of them).
+YT_PLAYLIST_MAX_ENTRIES = max(0, int(os.getenv("YT_PLAYLIST_MAX_ENTRIES", 0)))
+
+_download_slots: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]"
+) = weakref.WeakKeyDictionary()
+
+
+def _download_slot() -> asyncio.Semaphore:
+    """Per-event-loop limit of YT_DOWNLOAD_CONCURRENCY downloads at once."""
+    loop = asyncio.get_running_loop()
+    slot = _download_slots.get(loop)
+    if slot is None:
+        slot = _download_slots[loop] = asyncio.Semaphore(YT_DOWNLOAD_CONCURRENCY)
+    return slot
 
 
 class YTService:
-    def __init__(self) -> None:
+    def __init__(self, metadata_service: Optional[MediaMetadataService] = None) -> None:
         self.logger = logging.getLogger(__name__)
-        if not self.logger.handlers:
-            self.logger.setLevel(logging.INFO)
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            )
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
+        self._metadata = metadata_service or MediaMetadataService.shared()
 
     async def download(
         self, url: HttpUrl, dest_folder: str, mp3_id: Optional[str] = None
     ) -> str:
         try:
             self.logger.info(f"Iniciando descarga de {url} a {dest_folder}")
-            await asyncio.to_thread(self._sync_download, str(url), dest_folder, mp3_id)
+            async with _download_slot():
+                await asyncio.to_thread(
+                    self._sync_download, str(url), dest_folder, mp3_id
+                )
             self.logger.info(f"Descarga exitosa de {url}")
             return "Descarga exitosa"
         except Exception as e:
             self.logger.error(f"Error en descarga de {url}: {str(e)}")
             return f"Error en descarga: {str(e)}"
 
+    async def download_audio(self, url: HttpUrl, dest_folder: str, name: str) -> str:
+        """Download the audio of ``url`` to ``dest_folder/name.<ext>`` and return
+        its path; ``<ext>`` is the native container unless YT_AUDIO_FORMAT=mp3."""
+        self.logger.info(f"Iniciando descarga de {url} a {dest_folder}")
+        async with _download_slot():
+            path = await asyncio.to_thread(
+                self._sync_download, str(url), dest_folder, name
+            )
+        if path is None:
+            raise FileNotFoundError(f"No se descargó el audio de {url}")
+        self.logger.info(f"Descarga exitosa de {url}: {os.path.basename(path)}")
+        return path
+
     def _sync_download(
         self, url: str, dest_folder: str, mp3_id: Optional[str] = None
-    ) -> None:
+    ) -> Optional[str]:
         os.makedirs(dest_folder, exist_ok=True)
         outtmpl = (
             f"{dest_folder}/{mp3_id}.%(ext)s"
             if mp3_id
             else f"{dest_folder}/%(autonumber)s.%(ext)s"
         )
-        ydl_opts = {
-            "format": "bestaudio",
-            "postprocessors": [{"key": "FFmpegExtractAudio", "preferredcodec": "mp3"}],
+        ydl_opts: Dict[str, Any] = {
+            "format": "bestaudio/best",
             "outtmpl": outtmpl,
             "quiet": True,
             "ignoreerrors": True,
+            "concurrent_fragment_downloads": YT_FRAGMENT_CONCURRENCY,
         }
+        if YT_AUDIO_FORMAT == "mp3":
+            ydl_opts["postprocessors"] = [
+                {"key": "FFmpegExtractAudio", "preferredcodec": "mp3"}
+            ]
+        if YT_DOWNLOAD_BANDWIDTH_MBPS > 0:
+            # Each of the concurrent downloads gets an equal share.
+            ydl_opts["ratelimit"] = int(
+                YT_DOWNLOAD_BANDWIDTH_MBPS * 1024 * 1024 / YT_DOWNLOAD_CONCURRENCY
+            )
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             ydl.download([url])
+        if not mp3_id:
+            return None
+        downloaded = [
+            path
+            for path in glob.glob(os.path.join(glob.escape(dest_folder), f"{mp3_id}.*"))
+            if not path.endswith((".part", ".ytdl", ".pcm.npy"))
+        ]
+        return max(downloaded, key=os.path.getmtime) if downloaded else None
+
+    @staticmethod
+    def _match_video_key(url: str) -> Optional[Tuple[str, str]]:
+        for extractor in gen_extractor_classes():
+            if extractor.suitable(url):
+                if extractor.ie_key() == "Generic":
+                    return None
+                video_id = extractor.get_temp_id(url)
+                return (extractor.ie_key(), video_id) if video_id else None
+        return None
+
+    async def get_video_key(self, url: HttpUrl) -> Optional[Tuple[str, str]]:
+        """Extractor name and video id of ``url``, resolved from the URL alone
+        without any network request (None for unrecognised URLs)."""
+        try:
+            return await asyncio.to_thread(self._match_video_key, str(url))
+        except Exception as e:
+            self.logger.warning(f"No se pudo identificar el video {url}: {e}")
+            return None
 
     async def process_video(
         self,
@@ -115,57 +190,72 @@ class YTService:
     async def count_media_in_yt_playlist(self, url: HttpUrl) -> int:
         try:
             self.logger.info(f"Contando medios en la lista de reproducción: {url}")
-            ydl_opts = {
-                "quiet": True,
-                "extract_flat": "in_playlist",
-                "force_generic_extractor": True,
-                "ignoreerrors": True,
-            }
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = await asyncio.to_thread(
-                    ydl.extract_info, str(url), download=False
-                )
-                return len(info.get("entries", [])) if info and "entries" in info else 1
+            info = await self._metadata.get_playlist(url)
+            return len(info["entries"]) if info and info["entries"] else 1
         except Exception as e:
             self.logger.error(f"Error contando medios: {str(e)}")
             raise
 
     async def get_video_duration(self, url: HttpUrl) -> Optional[float]:
         try:
-            ydl_opts = {
-                "quiet": True,
-                "skip_download": True,
-                "ignoreerrors": True,
-            }
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = await asyncio.to_thread(
-                    ydl.extract_info, str(url), download=False
-                )
-                duration = info.get("duration") if info else None
-                if duration is None:
-                    raise ValueError("No se pudo obtener la duración del video.")
+            info = await self._metadata.get_video(url)
+            duration = info.get("duration") if info else None
+            if duration is None:
+                raise ValueError("No se pudo obtener la duración del video.")
 
-                return float(duration) / 60
+            return float(duration) / 60
         except Exception as e:
             self.logger.error(f"Error obteniendo duración de {url}: {e}")
             return None
 
-    async def get_media_duration(self, url: HttpUrl) -> Dict[str, List[Dict[str, Any]]]:
-        durations: List[Dict[str, Any]] = []
+    async def iter_media_durations(
+        self, url: HttpUrl
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Yield ``{"url", "duration"}`` (minutes) for each media item of ``url``
+        as soon as its duration is known.
 
-        if await self.is_youtube_playlist(url):
-            urls = await self.get_video_urls_from_playlist(url)
-            if urls:
-                duration_results = await asyncio.gather(
-                    *[self.get_video_duration(HttpUrl(u)) for u in urls]
-                )
-                for u, d in zip(urls, duration_results):
-                    if d is not None and d > 0:
-                        durations.append({"url": str(u), "duration": d})
-        else:
+        Playlist entries use the durations of the flat playlist extraction, in
+        playlist order; only entries without one are extracted individually,
+        at most ``YT_DURATION_CONCURRENCY`` at a time, and yielded as they
+        finish. Items without a valid duration are skipped.
+        """
+        if not await self.is_youtube_playlist(url):
             duration = await self.get_video_duration(url)
             if duration is not None and duration > 0:
-                durations.append({"url": str(url), "duration": duration})
+                yield {"url": str(url), "duration": duration}
+            return
+
+        info = await self._metadata.get_playlist(url)
+        missing: List[str] = []
+        for entry in info["entries"] if info else []:
+            if entry.get("duration"):
+                yield {"url": entry["url"], "duration": float(entry["duration"]) / 60}
+            else:
+                missing.append(entry["url"])
+        if not missing:
+            return
+
+        self.logger.info(
+            f"Extrayendo duración de {len(missing)} videos sin duración en la lista"
+        )
+        semaphore = asyncio.Semaphore(YT_DURATION_CONCURRENCY)
+
+        async def resolve(video_url: str) -> Tuple[str, Optional[float]]:
+            async with semaphore:
+                return video_url, await self.get_video_duration(HttpUrl(video_url))
+
+        tasks = [asyncio.ensure_future(resolve(video_url)) for video_url in missing]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                video_url, duration = await next_done
+                if duration is not None and duration > 0:
+                    yield {"url": video_url, "duration": duration}
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def get_media_duration(self, url: HttpUrl) -> Dict[str, List[Dict[str, Any]]]:
+        durations = [item async for item in self.iter_media_durations(url)]
 
         if not durations:
             raise ValueError("No se pudieron obtener duraciones válidas de los medios.")
@@ -175,16 +265,17 @@ class YTService:
     async def is_youtube_playlist(self, url: HttpUrl) -> bool:
         return "list=" in str(url)
 
+    async def iter_video_urls_from_playlist(
+        self, url: HttpUrl, start: int = 0, limit: Optional[int] = None
+    ) -> AsyncGenerator[str, None]:
+        """Yield the video URLs of a playlist or channel as they are enumerated,
+        from entry ``start`` and at most ``limit`` of them (default
+        ``YT_PLAYLIST_MAX_ENTRIES``)."""
+        if limit is None and YT_PLAYLIST_MAX_ENTRIES:
+            limit = YT_PLAYLIST_MAX_ENTRIES
+        async for entry in self._metadata.iter_playlist(url, start, limit):
+            yield entry["url"]
+
     async def get_video_urls_from_playlist(self, url: HttpUrl) -> List[str]:
-        ydl_opts = {
-            "quiet": True,
-            "extract_flat": "in_playlist",
-            "ignoreerrors": True,
-        }
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = await asyncio.to_thread(ydl.extract_info, str(url), download=False)
-            return [
-                entry["url"]
-                for entry in (info.get("entries", []) if info else [])
-                if "url" in entry
-            ]
+        info = await self._metadata.get_playlist(url)
+        return [entry["url"] for entry in (info["entries"] if info else [])]
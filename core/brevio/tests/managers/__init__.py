@@ -0,0 +1,5 @@
+from core.brevio.managers import directory_manager
+
+__all__ = [
+    "directory_manager",
+]
@@ -0,0 +1,163 @@
+import asyncio
+import threading
+from typing import Any, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.brevio.managers.directory_manager import DirectoryManager
+from core.shared.models.history_token_model import HistoryTokenModel
+
+
+def _fake_reader(texts: List[str], extracted: List[int]) -> Any:
+    pages = []
+    for index, text in enumerate(texts):
+        page = MagicMock()
+
+        def extract_text(index: int = index, text: str = text) -> str:
+            extracted.append(index)
+            return text
+
+        page.extract_text.side_effect = extract_text
+        pages.append(page)
+    reader = MagicMock()
+    reader.pages = pages
+    return reader
+
+
+async def test_read_pdf_in_pieces_yields_pages_incrementally() -> None:
+    """Pages should be yielded while later pages are still pending extraction."""
+    texts = [f"Página {i}\n\n\ncontenido" for i in range(20)]
+    extracted: List[int] = []
+    history = HistoryTokenModel()
+
+    with patch("pypdf.PdfReader", return_value=_fake_reader(texts, extracted)):
+        pieces = DirectoryManager().read_pdf_in_pieces(
+            "doc.pdf", history, window_pages=2
+        )
+        first = await pieces.__anext__()
+        await asyncio.sleep(0.3)
+        # The extraction thread is paused by the bounded window.
+        assert len(extracted) < len(texts)
+        rest = [page async for page in pieces]
+
+    assert first == "Página 0\ncontenido"
+    assert len(rest) == len(texts) - 1
+    assert history.num_chars_file == sum(len(p) for p in [first, *rest])
+
+
+async def test_read_pdf_in_pieces_stops_thread_when_closed() -> None:
+    """Closing the generator early should stop the extraction thread."""
+    texts = [f"page {i}" for i in range(50)]
+    extracted: List[int] = []
+    threads_before = threading.active_count()
+
+    with patch("pypdf.PdfReader", return_value=_fake_reader(texts, extracted)):
+        pieces = DirectoryManager().read_pdf_in_pieces("doc.pdf", window_pages=1)
+        assert await pieces.__anext__() == "page 0"
+        await pieces.aclose()
+
+    assert len(extracted) < len(texts)
+    assert threading.active_count() <= threads_before + 1
+
+
+async def test_read_pdf_raises_on_empty_pdf() -> None:
+    """read_pdf should keep failing on PDFs without extractable text."""
+    with patch("pypdf.PdfReader", return_value=_fake_reader(["", "  "], [])):
+        with pytest.raises(ValueError, match="vacío"):
+            await DirectoryManager().read_pdf("doc.pdf", None)
+
+
+async def test_read_pdf_in_pieces_process_pool_preserves_order(
+    tmp_path: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Process-pool extraction should return the same pages, in order."""
+    from core.benchmarks.common import write_text_pdf
+    from core.brevio.managers import directory_manager
+
+    path = str(tmp_path / "doc.pdf")
+    write_text_pdf(path, pages=9, lines_per_page=3)
+    monkeypatch.setattr(directory_manager, "PDF_PROCESS_MIN_PAGES", 1)
+    monkeypatch.setattr(directory_manager, "PDF_PAGES_PER_TASK", 2)
+    manager = DirectoryManager()
+
+    threaded = [p async for p in manager.read_pdf_in_pieces(path, workers=1)]
+    pooled = [p async for p in manager.read_pdf_in_pieces(path, workers=2)]
+
+    assert len(threaded) == 9
+    assert pooled == threaded
+    assert [page.split("-")[0] for page in pooled] == [str(i) for i in range(9)]
+
+
+async def test_read_docx_in_pieces_includes_headings_and_tables(
+    tmp_path: Any,
+) -> None:
+    """The streaming reader should keep document order, headings and table rows."""
+    from core.benchmarks.common import write_docx
+
+    path = str(tmp_path / "doc.docx")
+    write_docx(path, pages=2, paragraphs_per_page=2, table_rows=2)
+
+    pieces = [
+        piece
+        async for piece in DirectoryManager().read_docx_in_pieces(path, piece_chars=300)
+    ]
+    lines = "\n".join(pieces).splitlines()
+
+    assert len(pieces) > 1
+    assert lines[0] == "# Sección 0"
+    assert lines[1].startswith("0-0 palabra0")
+    assert lines[3:5] == [
+        "celda 0.0.0 | celda 0.0.1 | celda 0.0.2",
+        "celda 0.1.0 | celda 0.1.1 | celda 0.1.2",
+    ]
+    assert lines[5] == "## Sección 1"
+    assert await DirectoryManager().read_docx(path) == "\n".join(pieces)
+
+
+async def test_create_docx_version_renders_markdown_structure(tmp_path: Any) -> None:
+    """Headings, lists, emphasis and tables should reach the DOCX export."""
+    from docx import Document
+
+    md_path = tmp_path / "summary.md"
+    md_path.write_text(
+        "# Título\n\nTexto con **negrita**.\n\n"
+        "- uno\n- dos\n\n1. primero\n2. segundo\n\n"
+        "| A | B |\n|---|---|\n| 1 | 2 |\n",
+        encoding="utf-8",
+    )
+
+    await DirectoryManager().create_docx_version(str(md_path))
+
+    doc = Document(str(tmp_path / "summary.docx"))
+    paragraphs = [
+        (p.style.name if p.style else None, p.text) for p in doc.paragraphs if p.text
+    ]
+    assert ("Heading 1", "Título") in paragraphs
+    assert ("List Bullet", "dos") in paragraphs
+    assert ("List Number", "2. segundo") in paragraphs
+    bold = [run.text for p in doc.paragraphs for run in p.runs if run.bold]
+    assert bold == ["negrita"]
+    assert [[cell.text for cell in row.cells] for row in doc.tables[0].rows] == [
+        ["A", "B"],
+        ["1", "2"],
+    ]
+
+
+async def test_lazy_docx_export_renders_on_first_request(
+    tmp_path: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """In lazy mode the DOCX should only be produced by get_docx_version."""
+    from core.brevio.managers import directory_manager
+
+    monkeypatch.setattr(directory_manager, "DOCX_EXPORT_MODE", "lazy")
+    md_path = tmp_path / "summary.md"
+    md_path.write_text("# Resumen\n\nContenido.\n", encoding="utf-8")
+    manager = DirectoryManager()
+
+    await manager.create_docx_version(str(md_path))
+    assert not (tmp_path / "summary.docx").exists()
+
+    docx_path = await manager.get_docx_version(str(md_path))
+    assert docx_path == str(tmp_path / "summary.docx")
+    assert (tmp_path / "summary.docx").exists()
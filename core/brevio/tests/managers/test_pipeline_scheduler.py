@@ -0,0 +1,171 @@
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, Dict, List
+
+import pytest
+
+from core.brevio.managers.pipeline_scheduler import PipelineScheduler, PipelineStage
+
+
+class _Load:
+    """Tracks how many handler calls of each stage run at once."""
+
+    def __init__(self) -> None:
+        self.running: Dict[str, int] = {}
+        self.peak: Dict[str, int] = {}
+
+    def stage(
+        self, name: str, seconds: float
+    ) -> Callable[[List[str]], Awaitable[List[str]]]:
+        async def handler(item: List[str]) -> List[str]:
+            self.running[name] = self.running.get(name, 0) + 1
+            self.peak[name] = max(self.peak.get(name, 0), self.running[name])
+            await asyncio.sleep(seconds)
+            self.running[name] -= 1
+            return item + [name]
+
+        return handler
+
+
+@pytest.mark.asyncio
+async def test_run_passes_items_through_stages_in_order() -> None:
+    """Should run every item through each stage and return results in input order."""
+    load = _Load()
+    scheduler: PipelineScheduler[List[str]] = PipelineScheduler(
+        [
+            PipelineStage("download", load.stage("download", 0.01), 3),
+            PipelineStage("transcribe", load.stage("transcribe", 0.02), 1),
+            PipelineStage("summarize", load.stage("summarize", 0.01), 2),
+        ]
+    )
+
+    results = await scheduler.run([[str(i)] for i in range(6)])
+
+    assert results == [
+        [str(i), "download", "transcribe", "summarize"] for i in range(6)
+    ]
+    assert load.peak["download"] == 3
+    assert load.peak["transcribe"] == 1
+    assert load.peak["summarize"] <= 2
+    metrics = scheduler.metrics()
+    assert metrics["transcribe"].completed == 6
+    assert metrics["transcribe"].queued == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_stage_applies_backpressure() -> None:
+    """Should stop upstream stages once the queue of a slow stage is full."""
+    started: List[int] = []
+    release = asyncio.Event()
+
+    async def download(item: int) -> int:
+        started.append(item)
+        return item
+
+    async def transcribe(item: int) -> int:
+        await release.wait()
+        return item
+
+    scheduler: PipelineScheduler[int] = PipelineScheduler(
+        [
+            PipelineStage("download", download, 1, queue_size=1),
+            PipelineStage("transcribe", transcribe, 1, queue_size=1),
+        ]
+    )
+    run = asyncio.ensure_future(scheduler.run(range(10)))
+    await asyncio.sleep(0.05)
+
+    # One item in transcription, one queued for it, one downloaded and
+    # waiting to be queued, one queued for download.
+    assert len(started) == 3
+    assert scheduler.metrics()["transcribe"].max_queued == 1
+    release.set()
+    assert await run == list(range(10))
+
+
+@pytest.mark.asyncio
+async def test_failed_item_skips_later_stages() -> None:
+    """Should return the exception of a failed item and keep processing the rest."""
+    summarized: List[int] = []
+
+    async def transcribe(item: int) -> int:
+        if item == 1:
+            raise RuntimeError("whisper failed")
+        return item
+
+    async def summarize(item: int) -> int:
+        summarized.append(item)
+        return item
+
+    scheduler = PipelineScheduler(
+        [
+            PipelineStage("transcribe", transcribe, 2),
+            PipelineStage("summarize", summarize, 2),
+        ]
+    )
+
+    results = await scheduler.run([0, 1, 2])
+
+    assert results[0] == 0 and results[2] == 2
+    assert isinstance(results[1], RuntimeError)
+    assert sorted(summarized) == [0, 2]
+    assert scheduler.metrics()["transcribe"].failed == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_handler_future_fails_only_its_item() -> None:
+    """Should record a CancelledError raised by a handler as that item's result."""
+    loop = asyncio.get_running_loop()
+
+    async def transcribe(item: int) -> int:
+        if item == 1:
+            future: "asyncio.Future[int]" = loop.create_future()
+            loop.call_soon(future.cancel)
+            return await future
+        return item
+
+    scheduler: PipelineScheduler[int] = PipelineScheduler(
+        [PipelineStage("transcribe", transcribe, 1)]
+    )
+
+    results = await asyncio.wait_for(scheduler.run([0, 1, 2]), 5)
+
+    assert results[0] == 0 and results[2] == 2
+    assert isinstance(results[1], asyncio.CancelledError)
+    assert scheduler.metrics()["transcribe"].failed == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_runs_share_stage_limits() -> None:
+    """Should enforce a stage limit across runs of the same scheduler."""
+    load = _Load()
+    scheduler: PipelineScheduler[List[str]] = PipelineScheduler(
+        [PipelineStage("transcribe", load.stage("transcribe", 0.02), 2)]
+    )
+
+    await asyncio.gather(
+        scheduler.run([["a"], ["b"], ["c"]]), scheduler.run([["d"], ["e"], ["f"]])
+    )
+
+    assert load.peak["transcribe"] == 2
+
+
+@pytest.mark.asyncio
+async def test_run_starts_work_while_async_items_are_produced() -> None:
+    """Should process the first items of an async iterable before it is exhausted."""
+    processed: List[int] = []
+    more = asyncio.Event()
+
+    async def produce() -> AsyncIterator[int]:
+        yield 0
+        await more.wait()
+        yield 1
+
+    async def download(item: int) -> int:
+        processed.append(item)
+        more.set()
+        return item
+
+    scheduler = PipelineScheduler([PipelineStage("download", download, 1)])
+
+    assert await scheduler.run(produce()) == [0, 1]
+    assert processed == [0, 1]
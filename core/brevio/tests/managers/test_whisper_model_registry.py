@@ -0,0 +1,160 @@
+import asyncio
+import importlib
+import sys
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.brevio.enums.language import LanguageType
+from core.brevio.managers import transcription_backends
+from core.brevio.managers.transcription_backends import (
+    FasterWhisperBackend,
+    WhisperBackend,
+    get_transcription_backend,
+)
+from core.brevio.managers.whisper_model_registry import WhisperModelRegistry
+
+
+@pytest.fixture(autouse=True)
+def clear_registry() -> Generator[None, None, None]:
+    """Each test should start without loaded models."""
+    WhisperModelRegistry.clear()
+    yield
+    WhisperModelRegistry.clear()
+
+
+async def test_model_is_loaded_once_per_size() -> None:
+    """Concurrent requests for the same size should share a single load."""
+
+    def slow_load(size: str) -> Any:
+        time.sleep(0.05)
+        return MagicMock(name=f"whisper-{size}")
+
+    with patch("whisper.load_model", side_effect=slow_load) as load_model:
+        models = await asyncio.gather(
+            *(WhisperModelRegistry.get_model("small") for _ in range(5))
+        )
+        base = await WhisperModelRegistry.get_model("base")
+
+    assert load_model.call_count == 2
+    assert all(model is models[0] for model in models)
+    assert base is not models[0]
+    metrics = WhisperModelRegistry.metrics()
+    assert set(metrics) == {"small", "base"}
+    assert metrics["small"].load_seconds >= 0.05
+
+
+async def test_inference_runs_on_bounded_executor() -> None:
+    """run_inference should not run more jobs at once than the executor allows."""
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def job() -> None:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+
+    await asyncio.gather(*(WhisperModelRegistry.run_inference(job) for _ in range(6)))
+
+    assert peak <= WhisperModelRegistry.executor()._max_workers
+
+
+def test_preload_logs_failures_instead_of_raising(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """A failed preload should not crash the worker process."""
+    with patch("whisper.load_model", side_effect=RuntimeError("sin disco")):
+        WhisperModelRegistry.preload("small")
+
+    assert "Whisper model preload failed" in caplog.text
+    assert WhisperModelRegistry.metrics() == {}
+
+
+def test_preload_in_background_returns_before_the_model_is_loaded() -> None:
+    """The worker init hook should not wait for the model load."""
+    release = threading.Event()
+
+    def slow_load(size: str) -> Any:
+        release.wait(5)
+        return MagicMock(name=f"whisper-{size}")
+
+    with patch("whisper.load_model", side_effect=slow_load):
+        thread = WhisperModelRegistry.preload_in_background("small")
+        assert thread.is_alive()
+        assert WhisperModelRegistry.metrics() == {}
+        release.set()
+        thread.join(5)
+
+    assert "small" in WhisperModelRegistry.metrics()
+
+
+def test_backends_return_the_same_segment_structure() -> None:
+    """Both backends should normalise their output to start/end/text dicts."""
+    whisper_model = MagicMock()
+    whisper_model.transcribe.return_value = {
+        "text": "Hola mundo",
+        "segments": [{"id": 0, "start": 0.0, "end": 1.5, "text": " Hola mundo"}],
+    }
+    faster_model = MagicMock()
+    faster_model.transcribe.return_value = (
+        (s for s in [SimpleNamespace(start=0.0, end=1.5, text=" Hola mundo")]),
+        SimpleNamespace(language="es"),
+    )
+
+    expected = [{"start": 0.0, "end": 1.5, "text": " Hola mundo"}]
+    assert WhisperBackend().transcribe(whisper_model, "audio.mp3") == expected
+    assert FasterWhisperBackend().transcribe(faster_model, "audio.mp3") == expected
+
+
+def test_registry_loads_models_through_configured_backend() -> None:
+    """The registry should load with the selected backend and record its name."""
+    backend = MagicMock()
+    backend.name = "faster-whisper"
+    with patch(
+        "core.brevio.managers.whisper_model_registry.get_transcription_backend",
+        return_value=backend,
+    ):
+        model = WhisperModelRegistry.load("small")
+
+    backend.load_model.assert_called_once_with("small")
+    assert model is backend.load_model.return_value
+    assert WhisperModelRegistry.metrics()["small"].backend == "faster-whisper"
+
+
+def test_faster_whisper_path_does_not_import_whisper() -> None:
+    """Selecting faster-whisper should work without openai-whisper or torch."""
+    faster_whisper = SimpleNamespace(WhisperModel=MagicMock(name="WhisperModel"))
+    tokenizer = SimpleNamespace(_LANGUAGE_CODES=("en", "es"))
+    with patch.dict(
+        sys.modules,
+        {
+            "whisper": None,
+            "whisper.tokenizer": None,
+            "torch": None,
+            "faster_whisper": faster_whisper,
+            "faster_whisper.tokenizer": tokenizer,
+        },
+    ):
+        backends = importlib.reload(transcription_backends)
+        with patch.object(backends, "TRANSCRIPTION_BACKEND", "faster-whisper"):
+            assert backends.whisper_language_code(LanguageType.SPANISH) == "es"
+            assert backends.whisper_language_code(LanguageType.CATALAN) is None
+        model = backends.get_transcription_backend("faster-whisper").load_model("small")
+
+    assert model is faster_whisper.WhisperModel.return_value
+    importlib.reload(transcription_backends)
+
+
+def test_unknown_backend_is_rejected() -> None:
+    """An unsupported TRANSCRIPTION_BACKEND should fail loudly."""
+    with pytest.raises(ValueError, match="Unknown transcription backend"):
+        get_transcription_backend("vosk")
@@ -1,12 +1,16 @@
 import logging
 import multiprocessing
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from pydantic import HttpUrl
 
+from core.brevio.models.media_probe_model import MediaProbe
 from core.brevio.services.audio_service import AudioService
+from core.brevio.services.media_metadata_service import MediaMetadataService
+from core.brevio.services.media_probe_service import MediaProbeService
+from core.shared.utils.ttl_cache_utils import SharedTTLCache
 
 multiprocessing.set_start_method("spawn", force=True)
 
@@ -20,19 +24,20 @@ def caplog(caplog: Any) -> Any:
 
 @pytest.fixture
 def audio_service() -> AudioService:
-    """Fixture that should instantiate the AudioService."""
-    return AudioService()
+    """Fixture that should instantiate the AudioService with empty caches."""
+    return AudioService(
+        MediaMetadataService(SharedTTLCache("test")),
+        MediaProbeService(SharedTTLCache("test-probe")),
+    )
 
 
 @pytest.mark.asyncio
 async def test_get_media_info_success(audio_service: AudioService, caplog: Any) -> None:
     """Should extract title and duration correctly using get_media_info."""
-    mock_result = Mock()
-    mock_result.stdout = ""
-    mock_result.stderr = "Duration: 01:02:03.45, other info"
-
-    with patch(
-        "core.brevio.services.audio_service.subprocess.run", return_value=mock_result
+    with patch.object(
+        audio_service._probe,
+        "probe",
+        AsyncMock(return_value=MediaProbe(duration=3723.45)),
     ):
         result = await audio_service.get_media_info("/path/to/test.mp3")
         assert result == {
@@ -49,12 +54,8 @@ async def test_get_media_info_no_duration(
     audio_service: AudioService, caplog: Any
 ) -> None:
     """Should return None when no duration is found in get_media_info."""
-    mock_result = Mock()
-    mock_result.stdout = ""
-    mock_result.stderr = "No duration here"
-
-    with patch(
-        "core.brevio.services.audio_service.subprocess.run", return_value=mock_result
+    with patch.object(
+        audio_service._probe, "probe", AsyncMock(return_value=MediaProbe(duration=0))
     ):
         result = await audio_service.get_media_info("/path/to/test.mp3")
 
@@ -78,7 +79,8 @@ async def test_get_media_info_yt_success(
     mock_ydl.extract_info.return_value = mock_info
 
     with patch(
-        "core.brevio.services.audio_service.yt_dlp.YoutubeDL", return_value=mock_ydl
+        "core.brevio.services.media_metadata_service.yt_dlp.YoutubeDL",
+        return_value=mock_ydl,
     ):
         url = HttpUrl("https://youtube.com/watch?v=test")
         result = await audio_service.get_media_info_yt(url)
@@ -107,7 +109,8 @@ async def test_get_media_info_yt_no_info(
     mock_ydl.extract_info.return_value = None
 
     with patch(
-        "core.brevio.services.audio_service.yt_dlp.YoutubeDL", return_value=mock_ydl
+        "core.brevio.services.media_metadata_service.yt_dlp.YoutubeDL",
+        return_value=mock_ydl,
     ):
         url = HttpUrl("https://youtube.com/watch?v=invalid")
         result = await audio_service.get_media_info_yt(url)
@@ -128,9 +131,10 @@ async def test_get_media_info_yt_no_info(
 @pytest.mark.asyncio
 async def test_get_media_info_exception(audio_service: AudioService) -> None:
     """Should raise an exception if an error occurs in get_media_info."""
-    with patch(
-        "core.brevio.services.audio_service.subprocess.run",
-        side_effect=Exception("FFmpeg crashed"),
+    with patch.object(
+        audio_service._probe,
+        "probe",
+        AsyncMock(side_effect=RuntimeError("ffprobe falló")),
     ):
         with pytest.raises(Exception) as exc_info:
             await audio_service.get_media_info("/path/to/test.mp3")
@@ -149,7 +153,7 @@ async def test_get_media_info_yt_exception(
 ) -> None:
     """Should raise an exception if an error occurs in get_media_info_yt."""
     with patch(
-        "core.brevio.services.audio_service.yt_dlp.YoutubeDL",
+        "core.brevio.services.media_metadata_service.yt_dlp.YoutubeDL",
         side_effect=Exception("YouTube API error"),
     ):
         url = HttpUrl("https://youtube.com/watch?v=test")
@@ -0,0 +1,144 @@
+import hashlib
+import os
+from pathlib import Path
+from typing import AsyncGenerator
+
+import pytest
+
+from core.brevio.models.extraction_cache_model import ExtractionCacheEntry
+from core.brevio.services.extraction_cache_service import ExtractionCacheService
+from core.brevio.services.summary_service import _cache_pages
+
+
+def _hash(content: str) -> str:
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def test_entry_rebuilds_pages() -> None:
+    """from_pages should keep page boundaries recoverable from the joined text."""
+    entry = ExtractionCacheEntry.from_pages(["uno", "", "dos\ntres"])
+
+    assert entry.text == "uno\n\ndos\ntres"
+    assert entry.pages() == ["uno", "", "dos\ntres"]
+
+
+async def test_put_and_get_round_trip(tmp_path: Path) -> None:
+    """Stored entries should be returned with their token counts."""
+    cache = ExtractionCacheService(cache_dir=str(tmp_path), enabled=True)
+    content_hash = _hash("doc")
+    entry = ExtractionCacheEntry.from_pages(["página 1", "página 2"])
+    entry.token_counts["cl100k_base"] = 12
+
+    await cache.put(content_hash, entry)
+    await cache.add_token_count(content_hash, "deepseek-ai/deepseek-v3", 14)
+    cached = await cache.get(content_hash)
+
+    assert cached is not None
+    assert cached.pages() == ["página 1", "página 2"]
+    assert cached.token_counts == {
+        "cl100k_base": 12,
+        "deepseek-ai/deepseek-v3": 14,
+    }
+    assert await cache.get(_hash("otro")) is None
+    assert await cache.get("../../etc/passwd") is None
+
+
+async def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    """Once over max_bytes the entries read least recently should be removed."""
+    cache = ExtractionCacheService(cache_dir=str(tmp_path), enabled=True)
+    hashes = [_hash(f"doc {i}") for i in range(3)]
+    for age, content_hash in enumerate(hashes):
+        await cache.put(
+            content_hash, ExtractionCacheEntry.from_pages([os.urandom(512).hex()])
+        )
+        path = next(tmp_path.glob(f"*/{content_hash}*"))
+        os.utime(path, (1000 + age, 1000 + age))
+    entry_size = max(path.stat().st_size for path in tmp_path.glob("*/*.json.gz"))
+
+    assert await cache.get(hashes[0]) is not None
+    cache.max_bytes = 2 * entry_size
+    await cache.put(hashes[2], ExtractionCacheEntry.from_pages(["corto"]))
+
+    assert await cache.get(hashes[1]) is None
+    assert await cache.get(hashes[0]) is not None
+    assert await cache.get(hashes[2]) is not None
+
+
+async def test_disabled_cache_is_a_no_op(tmp_path: Path) -> None:
+    """With the cache disabled nothing should be written."""
+    cache = ExtractionCacheService(cache_dir=str(tmp_path), enabled=False)
+
+    await cache.put(_hash("doc"), ExtractionCacheEntry.from_pages(["texto"]))
+
+    assert await cache.get(_hash("doc")) is None
+    assert not any(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize("pages", [["a"], ["a", "b", "c"]])
+def test_entry_offsets_match_pages(pages: list) -> None:
+    """page_offsets should point at the start of each page."""
+    entry = ExtractionCacheEntry.from_pages(pages)
+
+    assert [entry.text[offset] for offset in entry.page_offsets] == [
+        page[0] for page in pages
+    ]
+
+
+async def test_page_writer_streams_an_entry(tmp_path: Path) -> None:
+    """Pages written one by one should read back like from_pages."""
+    cache = ExtractionCacheService(cache_dir=str(tmp_path), enabled=True)
+    pages = ['página "1"', "", "dos\ntres\\"]
+    writer = cache.page_writer(_hash("doc"))
+    assert writer is not None
+
+    for page in pages:
+        await writer.add_page(page)
+    await writer.commit("cl100k_base", 9)
+    cached = await cache.get(_hash("doc"))
+
+    expected = ExtractionCacheEntry.from_pages(pages)
+    expected.token_counts["cl100k_base"] = 9
+    assert cached == expected
+    assert not list(tmp_path.glob("*/*.tmp"))
+
+
+async def test_discarded_page_writer_leaves_no_entry(tmp_path: Path) -> None:
+    """An extraction that does not finish should not be cached."""
+    cache = ExtractionCacheService(cache_dir=str(tmp_path), enabled=True)
+    writer = cache.page_writer(_hash("doc"))
+    assert writer is not None
+
+    await writer.add_page("página 1")
+    writer.discard()
+
+    assert await cache.get(_hash("doc")) is None
+    assert not list(tmp_path.glob("*/*"))
+    assert cache.page_writer("no es un hash") is None
+
+
+async def test_streamed_pages_are_cached_without_collecting_them(
+    tmp_path: Path,
+) -> None:
+    """_cache_pages should cache a fully consumed stream and drop a partial one."""
+
+    async def pages() -> AsyncGenerator[str, None]:
+        for index in range(3):
+            yield f"página {index}"
+
+    cache = ExtractionCacheService(cache_dir=str(tmp_path), enabled=True)
+    writer = cache.page_writer(_hash("completo"))
+    assert writer is not None
+    consumed = [page async for page in _cache_pages(pages(), writer, "enc", lambda: 6)]
+
+    partial_writer = cache.page_writer(_hash("parcial"))
+    assert partial_writer is not None
+    stream = _cache_pages(pages(), partial_writer, "enc", lambda: 6)
+    await stream.__anext__()
+    await stream.aclose()
+
+    cached = await cache.get(_hash("completo"))
+    assert cached is not None
+    assert cached.pages() == consumed
+    assert cached.token_counts == {"enc": 6}
+    assert await cache.get(_hash("parcial")) is None
+    assert not list(tmp_path.glob("*/*.tmp"))
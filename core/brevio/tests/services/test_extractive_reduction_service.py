@@ -0,0 +1,82 @@
+import pytest
+
+from core.brevio.enums.summary_level import KEEP_RATIO_BY_SUMMARY_LEVEL, SummaryLevel
+from core.brevio.services.extractive_reduction_service import (
+    ExtractiveReductionService,
+)
+
+
+@pytest.fixture
+def reducer() -> ExtractiveReductionService:
+    """Fixture that should instantiate the ExtractiveReductionService."""
+    return ExtractiveReductionService(max_section_sentences=50)
+
+
+def test_score_sentences_prefers_central_sentences(
+    reducer: ExtractiveReductionService,
+) -> None:
+    """Sentences sharing vocabulary with the rest should outrank outliers."""
+    scores = reducer.score_sentences(
+        [
+            "The budget covers schools and hospitals.",
+            "Schools and hospitals receive most of the budget.",
+            "The budget for hospitals grows next year.",
+            "Cats enjoy sleeping in the sun.",
+        ]
+    )
+
+    assert scores.shape == (4,)
+    assert scores[3] == scores.min()
+
+
+def test_reduce_keeps_ratio_per_section_in_original_order() -> None:
+    """Each section should keep its top sentences, preserving document order."""
+    section = " ".join(f"Sentence {i} about topic alpha beta." for i in range(10))
+    text = f"{section}\n\n{section.replace('alpha', 'gamma')}"
+
+    reduced = ExtractiveReductionService(max_section_sentences=10).reduce(
+        text, SummaryLevel.VERY_CONCISE
+    )
+    sections = reduced.split("\n\n")
+
+    keep = round(10 * KEEP_RATIO_BY_SUMMARY_LEVEL[SummaryLevel.VERY_CONCISE])
+    assert len(sections) == 2
+    for kept in sections:
+        numbers = [int(word) for word in kept.split() if word.isdigit()]
+        assert len(numbers) == keep
+        assert numbers == sorted(numbers)
+
+
+def test_reduce_short_text_is_unchanged(reducer: ExtractiveReductionService) -> None:
+    """A single sentence cannot be reduced further."""
+    assert reducer.reduce("Solo una frase.", SummaryLevel.CONCISE) == (
+        "Solo una frase."
+    )
+
+
+def test_reduce_joins_hard_wrapped_lines_into_sentences() -> None:
+    """Should keep whole sentences when a block wraps them across lines."""
+    sentences = [
+        f"Sentence {i} about the budget\nof schools and hospitals." for i in range(10)
+    ]
+
+    reduced = ExtractiveReductionService().reduce(
+        "\n".join(sentences), SummaryLevel.VERY_CONCISE
+    )
+
+    kept = [s for s in reduced.split(". ") if s]
+    assert kept
+    assert all(s.rstrip(".").endswith("of schools and hospitals") for s in kept)
+    assert "\n" not in reduced
+
+
+def test_reduce_by_line_treats_transcript_lines_as_sentences() -> None:
+    """Should split unpunctuated transcript lines when reducing by line."""
+    lines = [f"[00:00:{i:02d}] linea {i} sobre el presupuesto" for i in range(10)]
+
+    reduced = ExtractiveReductionService().reduce(
+        "\n".join(lines), SummaryLevel.VERY_CONCISE, by_line=True
+    )
+
+    keep = round(10 * KEEP_RATIO_BY_SUMMARY_LEVEL[SummaryLevel.VERY_CONCISE])
+    assert reduced.count("[00:00:") == keep
@@ -0,0 +1,71 @@
+import io
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from core.brevio.services.media_decode_service import MediaDecodeService
+from core.shared.utils.audio_segment_utils import SAMPLE_RATE, load_audio_range
+
+
+class _FakeFfmpeg:
+    def __init__(self, pcm: bytes, returncode: int = 0) -> None:
+        self.stdout = io.BytesIO(pcm)
+        self.returncode = returncode
+
+    def wait(self) -> int:
+        return self.returncode
+
+    def kill(self) -> None:
+        pass
+
+
+def _popen(pcm: bytes, returncode: int = 0) -> Any:
+    def popen(command: Any, stdout: Any, stderr: Any) -> _FakeFfmpeg:
+        stderr.write(b"Invalid data found when processing input")
+        return _FakeFfmpeg(pcm, returncode)
+
+    return popen
+
+
+def test_decode_reads_short_audio_into_memory(tmp_path: Path) -> None:
+    """Short audio should stay in RAM and never touch the memory-map path."""
+    samples = np.linspace(-1, 1, SAMPLE_RATE, dtype=np.float32)
+    mmap_path = tmp_path / "audio.pcm.npy"
+
+    with patch("subprocess.Popen", _popen(samples.tobytes())):
+        audio = MediaDecodeService(mmap_seconds=10).decode("a.mp3", str(mmap_path))
+
+    assert not isinstance(audio, np.memmap)
+    np.testing.assert_array_equal(audio, samples)
+    assert not mmap_path.exists()
+
+
+def test_decode_spills_long_audio_to_memory_mapped_npy(tmp_path: Path) -> None:
+    """Long audio should end up in a valid .npy that segments can be sliced from."""
+    samples = np.arange(3 * SAMPLE_RATE, dtype=np.float32)
+    mmap_path = tmp_path / "audio.pcm.npy"
+
+    with patch("subprocess.Popen", _popen(samples.tobytes() + b"\x00\x01")):
+        audio = MediaDecodeService(mmap_seconds=1).decode("a.mp3", str(mmap_path))
+
+    assert isinstance(audio, np.memmap)
+    np.testing.assert_array_equal(audio, samples)
+    np.testing.assert_array_equal(np.load(mmap_path), samples)
+    np.testing.assert_array_equal(
+        load_audio_range(str(mmap_path), 1.0, 2.0), samples[SAMPLE_RATE:-SAMPLE_RATE]
+    )
+
+
+def test_decode_raises_and_cleans_up_when_ffmpeg_fails(tmp_path: Path) -> None:
+    """A failed decode should report ffmpeg's error and leave no partial file."""
+    mmap_path = tmp_path / "audio.pcm.npy"
+
+    with patch("subprocess.Popen", _popen(b"\x00" * 64, returncode=1)), pytest.raises(
+        RuntimeError, match="Invalid data found"
+    ):
+        MediaDecodeService().decode("a.mp3", str(mmap_path), mmap_seconds=0)
+
+    assert not mmap_path.exists()
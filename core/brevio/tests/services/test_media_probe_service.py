@@ -0,0 +1,111 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, List
+from unittest.mock import patch
+
+import pytest
+
+from core.brevio.services.media_probe_service import MediaProbeService
+from core.shared.utils.ttl_cache_utils import SharedTTLCache
+
+FFPROBE_OUTPUT = {
+    "streams": [
+        {"codec_name": "opus", "sample_rate": "48000", "channels": 2},
+    ],
+    "format": {"format_name": "matroska,webm", "duration": "125.5"},
+}
+
+
+class _FakeFfprobe:
+    def __init__(self, stdout: bytes, stderr: bytes = b"", returncode: int = 0):
+        self._stdout = stdout
+        self._stderr = stderr
+        self.returncode = returncode
+
+    async def communicate(self) -> Any:
+        await asyncio.sleep(0.01)
+        return self._stdout, self._stderr
+
+
+def _fake_exec(calls: List[Any], **result: Any) -> Any:
+    async def create_subprocess_exec(*args: Any, **kwargs: Any) -> _FakeFfprobe:
+        calls.append(args)
+        return _FakeFfprobe(**result)
+
+    return create_subprocess_exec
+
+
+@pytest.fixture
+def media(tmp_path: Path) -> Path:
+    """Fixture that should provide a media file on disk."""
+    path = tmp_path / "talk.webm"
+    path.write_bytes(b"\x1aE\xdf\xa3")
+    return path
+
+
+@pytest.mark.asyncio
+async def test_probe_parses_format_and_audio_stream(media: Path) -> None:
+    """Should read duration, container and audio stream from one ffprobe call."""
+    calls: List[Any] = []
+    service = MediaProbeService(SharedTTLCache("test-probe"))
+
+    with patch(
+        "asyncio.create_subprocess_exec",
+        _fake_exec(calls, stdout=json.dumps(FFPROBE_OUTPUT).encode()),
+    ):
+        probe = await service.probe(media)
+        again = await service.probe(media)
+
+    assert probe.duration == 125.5
+    assert probe.format_name == "matroska,webm"
+    assert (probe.codec, probe.sample_rate, probe.channels) == ("opus", 48000, 2)
+    assert again == probe
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_probe_many_bounds_concurrency_and_keys_by_hash(media: Path) -> None:
+    """Should probe each content hash once, with at most `concurrency` ffprobes."""
+    running = peak = 0
+    calls = 0
+
+    async def create_subprocess_exec(*args: Any, **kwargs: Any) -> _FakeFfprobe:
+        nonlocal running, peak, calls
+        calls += 1
+        running += 1
+        peak = max(peak, running)
+
+        class _Tracked(_FakeFfprobe):
+            async def communicate(self) -> Any:
+                nonlocal running
+                result = await super().communicate()
+                running -= 1
+                return result
+
+        return _Tracked(json.dumps(FFPROBE_OUTPUT).encode())
+
+    service = MediaProbeService(SharedTTLCache("test-probe"), concurrency=2)
+    files = [(media, f"hash-{i}") for i in range(6)]
+    with patch("asyncio.create_subprocess_exec", create_subprocess_exec):
+        probes = await service.probe_many(files)
+        await service.probe_many(files)
+
+    assert [probe.duration for probe in probes] == [125.5] * 6
+    assert peak == 2
+    assert calls == 6
+
+
+@pytest.mark.asyncio
+async def test_probe_raises_on_ffprobe_failure(media: Path) -> None:
+    """Should surface ffprobe's error and cache nothing."""
+    calls: List[Any] = []
+    service = MediaProbeService(SharedTTLCache("test-probe"))
+
+    with patch(
+        "asyncio.create_subprocess_exec",
+        _fake_exec(calls, stdout=b"", stderr=b"Invalid data", returncode=1),
+    ), pytest.raises(RuntimeError, match="Invalid data"):
+        await service.probe(media)
+
+    assert service.cache.get(service._key(media, None)) is None
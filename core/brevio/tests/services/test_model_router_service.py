@@ -0,0 +1,178 @@
+from typing import Any, List, Tuple
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from openai import RateLimitError
+from tenacity import stop_after_attempt, wait_none
+
+from core.brevio.enums.language import LanguageType
+from core.brevio.services.model_router_service import ModelRouterService
+from core.brevio.services.summary_service import SummaryService
+from core.shared.enums.model import ModelType
+from core.shared.enums.pipeline_stage import PipelineStage
+from core.shared.enums.type_call import TypeCall
+from core.shared.models.brevio.history_token_call import HistoryTokenCall
+from core.shared.models.history_token_model import HistoryTokenModel
+
+
+def test_resolve_defaults_to_requested_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without configuration every stage keeps the user's model."""
+    monkeypatch.delenv("MODEL_ROUTE_MAP", raising=False)
+    monkeypatch.delenv("MODEL_ROUTE_POSTPROCESS", raising=False)
+    monkeypatch.delenv("MODEL_FALLBACKS", raising=False)
+    router = ModelRouterService()
+
+    assert router.resolve(PipelineStage.MAP, ModelType.GPT_4) == ModelType.GPT_4
+    assert router.resolve(PipelineStage.POSTPROCESS, ModelType.GPT_4) == (
+        ModelType.GPT_4
+    )
+    assert router.fallback_for(ModelType.GPT_4) is None
+
+
+def test_stage_overrides_and_fallbacks_from_env(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Stage overrides and fallbacks should be read from the environment."""
+    monkeypatch.setenv("MODEL_ROUTE_MAP", "gpt-4o-mini")
+    monkeypatch.delenv("MODEL_ROUTE_POSTPROCESS", raising=False)
+    monkeypatch.setenv(
+        "MODEL_FALLBACKS", "gpt-4=gpt-4o-mini, gpt-4o-mini=deepseek-chat"
+    )
+    router = ModelRouterService()
+
+    assert router.resolve(PipelineStage.MAP, ModelType.GPT_4) == ModelType.GPT_4O_MINI
+    assert router.resolve(PipelineStage.POSTPROCESS, ModelType.GPT_4) == (
+        ModelType.GPT_4
+    )
+    assert router.fallback_for(ModelType.GPT_4) == ModelType.GPT_4O_MINI
+    assert router.fallback_for(ModelType.GPT_4O_MINI) == ModelType.DEEPSEEK_CHAT
+
+
+def test_invalid_configuration_is_rejected() -> None:
+    """Unknown models and cyclic fallback chains should raise ValueError."""
+    with patch.dict("os.environ", {"MODEL_ROUTE_MAP": "gpt-5-ultra"}):
+        with pytest.raises(ValueError, match="Unknown model"):
+            ModelRouterService()
+    with pytest.raises(ValueError, match="cyclic"):
+        ModelRouterService(
+            stage_models={},
+            fallbacks={
+                ModelType.GPT_4: ModelType.GPT_4O_MINI,
+                ModelType.GPT_4O_MINI: ModelType.GPT_4,
+            },
+        )
+
+
+def test_history_token_model_records_per_model_ledger() -> None:
+    """record_call should keep stage totals and a ledger per model."""
+    history = HistoryTokenModel(model=ModelType.GPT_4)
+    history.record_call(
+        HistoryTokenCall(
+            type_call=TypeCall.SUMMARY,
+            system_prompt_tokens=10,
+            user_prompt_tokens=90,
+            response_tokens=20,
+            model=ModelType.GPT_4O_MINI,
+        )
+    )
+    history.record_call(
+        HistoryTokenCall(
+            type_call=TypeCall.POSTPROCESSING,
+            system_prompt_tokens=5,
+            user_prompt_tokens=20,
+            response_tokens=15,
+        )
+    )
+
+    assert history.total_tokens_summary_input == 100
+    assert history.total_tokens_summary_output == 20
+    assert history.total_tokens_postprocess_input == 25
+    assert history.total_tokens_postprocess_output == 15
+    assert history.tokens_per_model["gpt-4o-mini"].input_tokens == 100
+    assert history.tokens_per_model["gpt-4"].calls == 1
+    assert history.tokens_per_model["gpt-4"].output_tokens == 15
+
+
+async def test_map_stage_uses_routed_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    """process_chunks_in_groups should summarise chunks with the map-stage model."""
+    monkeypatch.setenv("MODEL_ROUTE_MAP", "gpt-4o-mini")
+    service = SummaryService()
+    used_models = []
+
+    async def fake_generate(
+        index: int,
+        chunk: str,
+        prompt: str,
+        accumulated_summary: str,
+        model: ModelType,
+        language: LanguageType,
+        retries: int = 0,
+    ) -> Tuple[int, str, int]:
+        used_models.append(model)
+        return index, f"summary {index}", 10
+
+    encoder: Any = MagicMock()
+    encoder.encode = lambda text: text.split()
+    with patch(
+        "core.brevio.services.summary_service.get_encoder", return_value=encoder
+    ), patch.object(service, "generate_summary_chunk", side_effect=fake_generate):
+        summary, tokens = await service.process_chunks_in_groups(
+            ["uno dos", "tres cuatro"], "prompt", ModelType.GPT_4, LanguageType.SPANISH
+        )
+
+    assert used_models == [ModelType.GPT_4O_MINI, ModelType.GPT_4O_MINI]
+    assert summary == "summary 0\nsummary 1"
+    assert tokens == 20
+
+
+async def test_postprocess_falls_back_after_rate_limit_retries() -> None:
+    """A 429 should be retried on the same model before moving to the fallback."""
+    service = SummaryService()
+    service.model_router = ModelRouterService(
+        stage_models={}, fallbacks={ModelType.GPT_4: ModelType.GPT_4O_MINI}
+    )
+    calls: List[str] = []
+
+    async def create(model: str, **kwargs: Any) -> Any:
+        calls.append(model)
+        if model == ModelType.GPT_4.value:
+            raise RateLimitError(
+                "rate limited",
+                response=httpx.Response(
+                    429, request=httpx.Request("POST", "http://api")
+                ),
+                body=None,
+            )
+        response = MagicMock()
+        response.choices[0].message.content = "resumen final del texto"
+        response.usage.completion_tokens = 4
+        response.usage.total_tokens = 10
+        return response
+
+    client = MagicMock()
+    client.chat.completions.create = create
+    encoder: Any = MagicMock()
+    encoder.encode = lambda text: text.split()
+    retrying = SummaryService._postprocess_summary.retry  # type: ignore[attr-defined]
+    with patch(
+        "core.brevio.services.summary_service.get_encoder", return_value=encoder
+    ), patch.object(
+        service.api_service, "_initialize_client", AsyncMock(return_value=client)
+    ), patch.object(
+        service.advanced_prompt_generator,
+        "get_postprocess_prompt",
+        AsyncMock(return_value="prompt"),
+    ), patch.object(
+        service, "_check_token_limit", AsyncMock(return_value=True)
+    ), patch.object(
+        retrying, "wait", wait_none()
+    ), patch.object(
+        retrying, "stop", stop_after_attempt(3)
+    ):
+        summary = await service.postprocess_summary(
+            "resumen previo del texto", 4, ModelType.GPT_4, LanguageType.SPANISH
+        )
+
+    assert summary.startswith("resumen final del texto")
+    assert calls == [ModelType.GPT_4.value] * 3 + [ModelType.GPT_4O_MINI.value]
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 import time
-from typing import Any, Tuple
+from typing import Any, AsyncGenerator, List, Optional, Tuple
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -10,8 +10,17 @@ from openai.types import CompletionUsage
 from openai.types.chat import ChatCompletion, ChatCompletionMessage
 
 from core.brevio.enums.language import LanguageType
+from core.brevio.enums.output_format_type import OutputFormatType
+from core.brevio.enums.summary_level import SummaryLevel
+from core.brevio.models.file_config_model import FileConfig
+from core.brevio.models.prompt_config_model import PromptConfig
+from core.brevio.models.transcription_stats_model import (
+    ModelLoadStats,
+    TranscriptionStats,
+)
 from core.brevio.services.summary_service import SummaryService
 from core.shared.enums.model import ModelType
+from core.shared.models.user.data_result import DataResult
 from core.shared.utils.model_tokens_utils import get_encoder
 
 
@@ -298,3 +307,224 @@ async def test_generate_summary_chunk_with_mock_patching(
         == "Este es un resumen simulado con suficientes palabras para validación\n\n\u200b"
     )
     assert tokens_used == 100
+
+
+class _WordEncoder:
+    def encode(self, text: str) -> list:
+        return text.split()
+
+    def decode(self, tokens: list) -> str:
+        return " ".join(tokens)
+
+
+@pytest.mark.asyncio
+async def test_stream_chunks_emits_overlapping_chunks_incrementally(
+    summary_service: SummaryService,
+) -> None:
+    """stream_chunks should emit a chunk as soon as enough tokens are buffered."""
+    pulled = []
+
+    async def pages() -> AsyncGenerator[str, None]:
+        for page in range(5):
+            pulled.append(page)
+            yield " ".join(f"p{page}w{i}" for i in range(6))
+
+    with patch(
+        "core.brevio.services.summary_service.get_encoder",
+        return_value=_WordEncoder(),
+    ):
+        stream = summary_service.stream_chunks(pages(), 10, 0.2, ModelType.GPT_4)
+        first = await stream.__anext__()
+        assert pulled == [0, 1]
+        chunks = [first] + [chunk async for chunk in stream]
+
+    assert [len(chunk.split()) for chunk in chunks] == [10, 10, 10, 6]
+    assert chunks[1].split()[:2] == first.split()[-2:]
+    assert summary_service.history_token_model.num_tokens_file == 30
+
+
+@pytest.mark.asyncio
+async def test_process_chunk_stream_dispatches_before_stream_ends(
+    summary_service: SummaryService,
+) -> None:
+    """The first group should be summarised while later chunks are pending."""
+    summary_service.max_concurrent_chunks = 2
+    produced = []
+    produced_at_dispatch = []
+
+    async def chunks() -> AsyncGenerator[str, None]:
+        for index in range(6):
+            produced.append(index)
+            yield f"chunk {index}"
+
+    async def fake_generate(
+        index: int, chunk: str, *args: Any, **kwargs: Any
+    ) -> Tuple[int, str, int]:
+        produced_at_dispatch.append(len(produced))
+        return index, f"summary {index}", 1
+
+    with patch(
+        "core.brevio.services.summary_service.get_encoder",
+        return_value=_WordEncoder(),
+    ), patch.object(
+        summary_service, "generate_summary_chunk", side_effect=fake_generate
+    ):
+        summary, tokens = await summary_service.process_chunk_stream(
+            chunks(), "prompt", ModelType.GPT_4, LanguageType.SPANISH
+        )
+
+    assert produced_at_dispatch[0] < 6
+    assert summary == "\n".join(f"summary {i}" for i in range(6))
+    assert tokens == 6
+
+
+@pytest.mark.asyncio
+async def test_process_single_transcription_summarizes_stream_while_transcribing(
+    summary_service: SummaryService, tmp_path: Any
+) -> None:
+    """Map calls should start before the transcript stream is exhausted."""
+    summary_service.max_tokens_per_chunk = 50
+    stats = TranscriptionStats(
+        model_load=ModelLoadStats(
+            backend="openai-whisper",
+            size="small",
+            load_seconds=1.5,
+            parameter_mb=460.0,
+            peak_rss_delta_mb=900.0,
+        )
+    )
+    produced: List[int] = []
+    produced_at_first_call: List[int] = []
+
+    async def transcript() -> AsyncGenerator[str, None]:
+        for index in range(40):
+            produced.append(index)
+            yield f"[00:00:{index:02d}] " + " ".join(f"palabra{i}" for i in range(10))
+
+    async def fake_generate(
+        index: int, chunk: str, *args: Any, **kwargs: Any
+    ) -> Tuple[int, str, int]:
+        if not produced_at_first_call:
+            produced_at_first_call.append(len(produced))
+        return index, f"resumen {index}", 1
+
+    prompt_config = PromptConfig(
+        model=ModelType.GPT_4,
+        category="education",
+        style="quick_ref",
+        format=OutputFormatType.MARKDOWN,
+        language=LanguageType.SPANISH,
+        summary_level=SummaryLevel.MODERATE,
+    )
+    with patch(
+        "core.brevio.services.summary_service.get_encoder",
+        return_value=_WordEncoder(),
+    ), patch(
+        "core.brevio.services.summary_service.save_log_to_json", AsyncMock()
+    ), patch.object(
+        summary_service.api_service, "_initialize_client", AsyncMock()
+    ), patch.object(
+        summary_service.advanced_prompt_generator,
+        "generate_prompt",
+        AsyncMock(return_value="prompt"),
+    ), patch.object(
+        summary_service, "detect_language_with_retry_safe", AsyncMock(return_value="es")
+    ), patch.object(
+        summary_service, "generate_summary_chunk", side_effect=fake_generate
+    ), patch.object(
+        summary_service.directory_manager, "create_docx_version", AsyncMock()
+    ):
+        result = await summary_service._process_single_transcription(
+            prompt_config,
+            FileConfig(
+                transcription_path=str(tmp_path / "transcription.txt"),
+                summary_path=str(tmp_path / "summary.md"),
+            ),
+            DataResult(name="Video 0"),
+            transcript_stream=transcript(),
+            transcription_stats=stats,
+        )
+
+    assert result.success
+    assert produced_at_first_call[0] < 40
+    assert summary_service.history_token_model.num_tokens_file == 40 * 11
+    assert summary_service.history_token_model.whisper_load_seconds == 1.5
+    assert summary_service.history_token_model.whisper_peak_rss_delta_mb == 900.0
+    assert (tmp_path / "summary.md").read_text(encoding="utf-8").startswith("resumen 0")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("whisper_code, source", [("es", "hint"), (None, "detected")])
+async def test_process_single_transcription_uses_input_language_hint(
+    summary_service: SummaryService,
+    tmp_path: Any,
+    whisper_code: Optional[str],
+    source: str,
+) -> None:
+    """Should record a hint Whisper decoded with and detect the language otherwise."""
+
+    async def transcript() -> AsyncGenerator[str, None]:
+        yield "[00:00:00] hola a todos"
+
+    detect = AsyncMock(return_value="en")
+    prompt_config = PromptConfig(
+        model=ModelType.GPT_4,
+        category="education",
+        style="quick_ref",
+        format=OutputFormatType.MARKDOWN,
+        language=LanguageType.ENGLISH,
+        summary_level=SummaryLevel.MODERATE,
+        input_language=LanguageType.SPANISH,
+    )
+    with patch(
+        "core.brevio.services.summary_service.get_encoder",
+        return_value=_WordEncoder(),
+    ), patch(
+        "core.brevio.services.summary_service.whisper_language_code",
+        return_value=whisper_code,
+    ), patch(
+        "core.brevio.services.summary_service.save_log_to_json", AsyncMock()
+    ), patch.object(
+        summary_service.api_service, "_initialize_client", AsyncMock()
+    ), patch.object(
+        summary_service.advanced_prompt_generator,
+        "generate_prompt",
+        AsyncMock(return_value="prompt"),
+    ), patch.object(
+        summary_service, "detect_language_with_retry_safe", detect
+    ), patch.object(
+        summary_service,
+        "generate_summary_chunk",
+        AsyncMock(return_value=(0, "resumen", 1)),
+    ), patch.object(
+        summary_service.directory_manager, "create_docx_version", AsyncMock()
+    ):
+        result = await summary_service._process_single_transcription(
+            prompt_config,
+            FileConfig(
+                transcription_path=str(tmp_path / "transcription.txt"),
+                summary_path=str(tmp_path / "summary.md"),
+            ),
+            DataResult(name="Video 0"),
+            transcript_stream=transcript(),
+        )
+
+    assert result.success
+    assert detect.called == (source == "detected")
+    assert summary_service.history_token_model.language_input_source == source
+    assert prompt_config.input_language == LanguageType.SPANISH
+
+
+def test_for_job_isolates_per_job_state(summary_service: SummaryService) -> None:
+    """Should give each job its own token history while sharing the API service."""
+    summary_service.history_token_model.num_tokens_file = 7
+    summary_service.limiter_wait_seconds = 3.0
+
+    first, second = summary_service.for_job(), summary_service.for_job()
+    first.history_token_model.num_tokens_file = 10
+    first.limiter_wait_seconds = 1.0
+
+    assert second.history_token_model.num_tokens_file == 0
+    assert second.limiter_wait_seconds == 0.0 and second.client is None
+    assert summary_service.history_token_model.num_tokens_file == 7
+    assert first.api_service is summary_service.api_service
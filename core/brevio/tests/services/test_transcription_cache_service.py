@@ -0,0 +1,70 @@
+import os
+from pathlib import Path
+from typing import Any
+
+from core.brevio.services.transcription_cache_service import (
+    TranscriptionCacheService,
+)
+
+
+def _cache(tmp_path: Path, **kwargs: Any) -> TranscriptionCacheService:
+    return TranscriptionCacheService(cache_dir=str(tmp_path), enabled=True, **kwargs)
+
+
+async def test_entries_are_keyed_by_source_and_model(tmp_path: Path) -> None:
+    """A hit needs the same source, backend and model size."""
+    cache = _cache(tmp_path)
+    source = TranscriptionCacheService.source_for_video("Youtube", "dQw4w9WgXcQ")
+
+    await cache.put(source, "[00:00:00] Hola", "es", "small", "whisper")
+    entry = await cache.get(source, "es", "small", "whisper")
+
+    assert entry is not None
+    assert entry.text == "[00:00:00] Hola"
+    assert entry.language == "es"
+    assert await cache.get(source, "es", "medium", "whisper") is None
+    assert await cache.get(source, "es", "small", "faster-whisper") is None
+    assert await cache.get(source, "auto", "small", "whisper") is None
+    assert (
+        await cache.get(TranscriptionCacheService.source_for_upload("ab" * 32)) is None
+    )
+
+
+async def test_expired_entries_are_dropped(tmp_path: Path) -> None:
+    """Entries older than the TTL should be a miss and be removed from disk."""
+    cache = _cache(tmp_path, ttl_seconds=60)
+    source = TranscriptionCacheService.source_for_upload("cd" * 32)
+    await cache.put(source, "texto", "en", "small", "whisper")
+
+    cache.ttl_seconds = -1
+    assert await cache.get(source, "en", "small", "whisper") is None
+    assert not list(tmp_path.glob("*/*.json.gz"))
+
+
+async def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    """Once over max_bytes the entries read least recently should be removed."""
+    cache = _cache(tmp_path)
+    sources = [f"youtube:video{i}" for i in range(3)]
+    for age, source in enumerate(sources[:2]):
+        await cache.put(source, os.urandom(512).hex(), "es", "small", "whisper")
+        path = cache._store.path(cache._key(source, "whisper", "small", "es"))
+        os.utime(path, (1000 + age, 1000 + age))
+    entry_size = max(path.stat().st_size for path in tmp_path.glob("*/*.json.gz"))
+
+    assert await cache.get(sources[0], "es", "small", "whisper") is not None
+    cache.max_bytes = 2 * entry_size
+    await cache.put(sources[2], "corto", "es", "small", "whisper")
+
+    assert await cache.get(sources[1], "es", "small", "whisper") is None
+    assert await cache.get(sources[0], "es", "small", "whisper") is not None
+    assert await cache.get(sources[2], "es", "small", "whisper") is not None
+
+
+async def test_disabled_cache_is_a_no_op(tmp_path: Path) -> None:
+    """With the cache disabled nothing should be written or returned."""
+    cache = TranscriptionCacheService(cache_dir=str(tmp_path), enabled=False)
+
+    await cache.put("youtube:abc", "texto", "es", "small", "whisper")
+
+    assert await cache.get("youtube:abc", "es", "small", "whisper") is None
+    assert not any(tmp_path.iterdir())
@@ -1,12 +1,36 @@
 import logging
-from typing import Any, Awaitable, Dict, List, Union
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Awaitable, Dict, List, Tuple, Union
 from unittest.mock import MagicMock, Mock, patch
 
+import numpy as np
 import pytest
 
 from core.brevio.constants.constants import Constants
 from core.brevio.enums.language import LanguageType
+from core.brevio.managers.whisper_model_registry import WhisperModelRegistry
+from core.brevio.models.transcription_stats_model import TranscriptionStats
 from core.brevio.services.transcription_service import TranscriptionService
+from core.shared.utils.audio_segment_utils import (
+    SAMPLE_RATE,
+    plan_segments,
+    silences_from_pcm,
+    speech_regions,
+)
+
+
+def _tone(seconds: float, frequency: float, amplitude: float = 0.3) -> np.ndarray:
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+
+def _silence(seconds: float) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return (0.001 * rng.standard_normal(int(seconds * SAMPLE_RATE))).astype(np.float32)
 
 
 @pytest.fixture
@@ -20,6 +44,7 @@ def caplog(caplog: pytest.LogCaptureFixture) -> pytest.LogCaptureFixture:
 def transcription_service() -> TranscriptionService:
     """Should provide a fresh instance of TranscriptionService for testing by resetting the singleton."""
     TranscriptionService._instance = None
+    WhisperModelRegistry.clear()
     return TranscriptionService()
 
 
@@ -241,6 +266,40 @@ async def test_generate_transcription_custom_format_time(
         assert args[1] == expected_text
 
 
+@pytest.mark.asyncio
+async def test_generate_transcription_passes_input_language_hint(
+    transcription_service: TranscriptionService, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Should decode in the hinted language instead of auto-detecting it."""
+    mock_model = Mock()
+    mock_model.transcribe.return_value = {"segments": [{"start": 0.0, "text": "Hola"}]}
+    tokenizer = SimpleNamespace(LANGUAGES={"es": "spanish", "en": "english"})
+
+    with patch("whisper.load_model", return_value=mock_model), patch.dict(
+        sys.modules, {"whisper.tokenizer": tokenizer}
+    ), patch(
+        "core.brevio.services.transcription_service.exists", return_value=True
+    ), patch.object(
+        transcription_service, "_write_transcription", Mock()
+    ):
+        await transcription_service.generate_transcription(
+            audio_path="/audio.mp3",
+            destination_path="./backend/audios",
+            language=LanguageType.ENGLISH,
+            input_language=LanguageType.SPANISH,
+        )
+        await transcription_service.generate_transcription(
+            audio_path="/audio.mp3",
+            destination_path="./backend/audios",
+            language=LanguageType.ENGLISH,
+        )
+
+    first, second = mock_model.transcribe.call_args_list
+    assert first.kwargs["language"] == "es"
+    assert "language" not in second.kwargs
+    assert "hint es" in caplog.text
+
+
 @pytest.mark.asyncio
 async def test_generate_transcription_no_segments(
     transcription_service: TranscriptionService, caplog: pytest.LogCaptureFixture
@@ -345,3 +404,228 @@ async def test_generate_transcription_io_error(
     # Check error handling
     assert "Unexpected error in transcription: No space left" in caplog.text
     assert str(exc_info.value) == "No space left"
+
+
+def test_silences_from_pcm_finds_quiet_runs() -> None:
+    """Should report quiet stretches longer than the minimum, in seconds."""
+    audio = np.concatenate(
+        [_tone(2, 440), _silence(1), _tone(2, 440), _silence(0.2), _tone(1, 440)]
+    )
+
+    silences = silences_from_pcm(audio)
+
+    assert len(silences) == 1
+    start, end = silences[0]
+    assert 1.95 <= start <= 2.05
+    assert 2.95 <= end <= 3.05
+
+
+def test_plan_segments_cuts_at_silences_near_target() -> None:
+    """Should cut in the middle of the nearest silence and hard-cut without one."""
+    silences = [(95.0, 97.0), (180.0, 182.0), (290.0, 292.0)]
+    plan = plan_segments(500.0, silences, target_seconds=100.0, max_seconds=150.0)
+    assert plan == [
+        (0.0, 96.0),
+        (96.0, 181.0),
+        (181.0, 291.0),
+        (291.0, 391.0),
+        (391.0, 500.0),
+    ]
+    assert plan_segments(120.0, silences, target_seconds=100.0) == [(0.0, 120.0)]
+
+
+@pytest.mark.asyncio
+async def test_generate_transcription_segmented_stitches_timestamps(
+    transcription_service: TranscriptionService,
+) -> None:
+    """Should transcribe each silence-bounded segment and keep absolute timestamps."""
+    mock_model = Mock()
+    mock_model.transcribe.side_effect = [
+        {"segments": [{"start": 0.0, "end": 2.0, "text": "Primero"}]},
+        {"segments": [{"start": 1.0, "end": 3.0, "text": "Segundo"}]},
+    ]
+    write_transcription_mock = Mock()
+
+    with patch("whisper.load_model", return_value=mock_model), patch(
+        "core.brevio.services.transcription_service.exists", return_value=True
+    ), patch(
+        "core.brevio.services.transcription_service.TRANSCRIPTION_MODE", "segmented"
+    ), patch(
+        "core.brevio.services.transcription_service.TRANSCRIPTION_WORKERS", 1
+    ), patch(
+        "core.brevio.services.transcription_service.TRANSCRIPTION_SEGMENT_SECONDS", 6
+    ), patch(
+        "core.brevio.services.transcription_service.TRANSCRIPTION_SEGMENT_MIN_SECONDS",
+        10,
+    ), patch.object(
+        transcription_service._decoder,
+        "decode",
+        return_value=np.concatenate([_tone(9.5, 440), _silence(1), _tone(9.5, 440)]),
+    ), patch.object(
+        transcription_service, "_write_transcription", write_transcription_mock
+    ):
+        result = await transcription_service.generate_transcription(
+            audio_path="/audio.mp3",
+            destination_path="./backend/audios",
+            language=LanguageType.SPANISH,
+        )
+
+    assert result == "[00:00:00] Primero\n[00:00:11] Segundo"
+    assert mock_model.transcribe.call_count == 2
+    first, second = (call.args[0] for call in mock_model.transcribe.call_args_list)
+    assert abs(len(first) - 10 * SAMPLE_RATE) < 0.1 * SAMPLE_RATE
+    assert len(first) + len(second) == 20 * SAMPLE_RATE
+
+
+@pytest.mark.asyncio
+async def test_segmented_transcription_bounds_segments_in_flight(
+    transcription_service: TranscriptionService, tmp_path: Any
+) -> None:
+    """Should use the fixed-size pool and keep one segment per worker in flight."""
+    audio_path = tmp_path / "audio.mp3"
+    audio_path.write_bytes(b"")
+    lock = threading.Lock()
+    load = {"running": 0, "peak": 0}
+
+    def transcribe_segment(
+        audio: Any, start: float, end: float, *args: Any
+    ) -> Tuple[List[Dict[str, Any]], float]:
+        with lock:
+            load["running"] += 1
+            load["peak"] = max(load["peak"], load["running"])
+        time.sleep(0.05)
+        with lock:
+            load["running"] -= 1
+        return [{"start": start, "end": end, "text": f"{start:.0f}"}], 0.0
+
+    pool = ThreadPoolExecutor(max_workers=8)
+    get_process_pool = Mock(return_value=pool)
+    tones = [_tone(4.5, 440)] * 4
+    with patch(
+        "core.brevio.services.transcription_service.get_process_pool",
+        get_process_pool,
+    ), patch(
+        "core.brevio.services.transcription_service.transcribe_segment",
+        transcribe_segment,
+    ), patch(
+        "core.brevio.services.transcription_service.TRANSCRIPTION_MODE", "segmented"
+    ), patch(
+        "core.brevio.services.transcription_service.TRANSCRIPTION_WORKERS", 2
+    ), patch(
+        "core.brevio.services.transcription_service.TRANSCRIPTION_SEGMENT_SECONDS", 5
+    ), patch(
+        "core.brevio.services.transcription_service.TRANSCRIPTION_SEGMENT_MIN_SECONDS",
+        10,
+    ), patch.object(
+        transcription_service._decoder,
+        "decode",
+        return_value=np.concatenate(
+            [part for tone in tones for part in (tone, _silence(1))]
+        ),
+    ):
+        result = await transcription_service.generate_transcription(
+            audio_path=str(audio_path),
+            destination_path=str(tmp_path),
+            language=LanguageType.SPANISH,
+        )
+    pool.shutdown()
+
+    assert result.count("\n") == 3
+    get_process_pool.assert_called_once_with("transcription", 2)
+    assert load["peak"] == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_transcription_yields_lines_per_segment(
+    transcription_service: TranscriptionService, tmp_path: Any
+) -> None:
+    """Should yield each segment's lines before the next segment is transcribed,
+    on the in-process model while the mode is not segmented."""
+    audio_path = tmp_path / "audio.mp3"
+    audio_path.write_bytes(b"")
+    mock_model = Mock()
+    mock_model.transcribe.side_effect = [
+        {"segments": [{"start": 0.0, "end": 2.0, "text": "Primero"}]},
+        {"segments": [{"start": 1.5, "end": 3.0, "text": "Segundo"}]},
+    ]
+    get_process_pool = Mock()
+
+    with patch("whisper.load_model", return_value=mock_model), patch(
+        "core.brevio.services.transcription_service.get_process_pool",
+        get_process_pool,
+    ), patch(
+        "core.brevio.services.transcription_service.TRANSCRIPTION_WORKERS", 2
+    ), patch(
+        "core.brevio.services.transcription_service.TRANSCRIPTION_SEGMENT_SECONDS", 5
+    ), patch.object(
+        transcription_service._decoder,
+        "decode",
+        return_value=np.concatenate([_tone(4.5, 440), _silence(1), _tone(8.5, 440)]),
+    ):
+        stream = transcription_service.stream_transcription(
+            str(audio_path), str(tmp_path), LanguageType.SPANISH
+        )
+        first = await stream.__anext__()
+        assert first == "[00:00:00] Primero"
+        assert mock_model.transcribe.call_count == 1
+        rest = [line async for line in stream]
+
+    assert rest == ["[00:00:06] Segundo"]
+    get_process_pool.assert_not_called()
+    transcription = (tmp_path / Constants.TRANSCRIPTION_FILE).read_text(
+        encoding="utf-8"
+    )
+    assert transcription == "[00:00:00] Primero\n[00:00:06] Segundo"
+
+
+def test_speech_regions_skip_silence_and_out_of_band_music() -> None:
+    """Only the voice-band tone should be reported as speech, with padding."""
+    audio = np.concatenate(
+        [_silence(4), _tone(3, 800), _silence(2), _tone(4, 80), _silence(2)]
+    )
+
+    regions = speech_regions(audio)
+
+    assert len(regions) == 1
+    start, end = regions[0]
+    assert 3.7 <= start <= 4.0
+    assert 7.0 <= end <= 7.3
+    assert speech_regions(audio, block_frames=7) == regions
+
+
+@pytest.mark.asyncio
+async def test_generate_transcription_vad_remaps_timestamps(
+    transcription_service: TranscriptionService, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Whisper should only see speech and timestamps should map back to the file."""
+    audio = np.concatenate([_silence(10), _tone(3, 800), _silence(10)])
+    mock_model = Mock()
+    mock_model.transcribe.return_value = {
+        "segments": [{"start": 0.5, "end": 2.5, "text": "Hola"}]
+    }
+    write_transcription_mock = Mock()
+    stats = TranscriptionStats()
+
+    with patch("whisper.load_model", return_value=mock_model), patch(
+        "core.brevio.services.transcription_service.exists", return_value=True
+    ), patch(
+        "core.brevio.services.transcription_service.TRANSCRIPTION_VAD", True
+    ), patch.object(
+        transcription_service._decoder, "decode", return_value=audio
+    ), patch.object(
+        transcription_service, "_write_transcription", write_transcription_mock
+    ):
+        result = await transcription_service.generate_transcription(
+            audio_path="/audio.mp3",
+            destination_path="./backend/audios",
+            language=LanguageType.SPANISH,
+            stats=stats,
+        )
+
+    speech = mock_model.transcribe.call_args.args[0]
+    assert len(speech) < 4 * SAMPLE_RATE
+    assert result == "[00:00:10] Hola"
+    assert "VAD skipped" in caplog.text
+    assert stats.audio_seconds == 23
+    assert 0.8 < stats.vad_skipped_ratio < 0.9
+    assert stats.model_load == WhisperModelRegistry.metrics()["small"]
@@ -1,14 +1,25 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Generator
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from pydantic import HttpUrl
 
+from core.brevio.services.media_metadata_service import MediaMetadataService
 from core.brevio.services.yt_service import YTService
+from core.shared.utils.ttl_cache_utils import SharedTTLCache
 
 
 @pytest.fixture
 def yt_service() -> YTService:
-    return YTService()
+    return YTService(MediaMetadataService(SharedTTLCache("test")))
 
 
 @pytest.mark.asyncio
@@ -100,23 +111,68 @@ async def test_get_video_urls_from_playlist(yt_service: YTService) -> None:
 
 @pytest.mark.asyncio
 async def test_get_media_duration_playlist(yt_service: YTService) -> None:
-    """Should return the durations of all videos in a playlist."""
-    mock_durations = [
-        {"url": "https://www.youtube.com/watch?v=abc", "duration": 300},
-        {"url": "https://www.youtube.com/watch?v=def", "duration": 450},
-    ]
-    with patch.object(
-        yt_service,
-        "get_video_urls_from_playlist",
-        return_value=[
-            "https://www.youtube.com/watch?v=abc",
-            "https://www.youtube.com/watch?v=def",
+    """Should use flat playlist durations and extract only the missing ones."""
+    playlist = {
+        "title": "Lista",
+        "entries": [
+            {"url": "https://www.youtube.com/watch?v=abc", "duration": 18000},
+            {"url": "https://www.youtube.com/watch?v=def", "duration": None},
         ],
-    ), patch.object(yt_service, "get_video_duration", side_effect=[300, 450]):
+    }
+    with patch.object(
+        yt_service._metadata, "get_playlist", AsyncMock(return_value=playlist)
+    ), patch.object(
+        yt_service, "get_video_duration", AsyncMock(return_value=450)
+    ) as get_video_duration:
         result = await yt_service.get_media_duration(
             HttpUrl("https://www.youtube.com/playlist?list=PL123")
         )
-        assert result == {"durations": mock_durations}
+
+    assert result == {
+        "durations": [
+            {"url": "https://www.youtube.com/watch?v=abc", "duration": 300},
+            {"url": "https://www.youtube.com/watch?v=def", "duration": 450},
+        ]
+    }
+    get_video_duration.assert_awaited_once_with(
+        HttpUrl("https://www.youtube.com/watch?v=def")
+    )
+
+
+@pytest.mark.asyncio
+async def test_iter_media_durations_bounds_fallback_extractions(
+    yt_service: YTService,
+) -> None:
+    """Missing durations should be extracted with bounded concurrency, as they finish."""
+    urls = [f"https://www.youtube.com/watch?v=v{i}" for i in range(12)]
+    playlist = {
+        "title": "Lista",
+        "entries": [{"url": u, "duration": None} for u in urls],
+    }
+    running = peak = 0
+
+    async def get_video_duration(url: HttpUrl) -> float:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return 1.0
+
+    with patch.object(
+        yt_service._metadata, "get_playlist", AsyncMock(return_value=playlist)
+    ), patch.object(yt_service, "get_video_duration", get_video_duration), patch(
+        "core.brevio.services.yt_service.YT_DURATION_CONCURRENCY", 3
+    ):
+        stream = yt_service.iter_media_durations(
+            HttpUrl("https://www.youtube.com/playlist?list=PL123")
+        )
+        first = await stream.__anext__()
+        rest = [item async for item in stream]
+
+    assert first["duration"] == 1.0
+    assert len(rest) == 11
+    assert peak == 3
 
 
 @pytest.mark.asyncio
@@ -185,3 +241,246 @@ async def test_is_youtube_playlist_false(yt_service: YTService) -> None:
     url = HttpUrl("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
     result = await yt_service.is_youtube_playlist(url)
     assert result is False
+
+
+@pytest.mark.asyncio
+async def test_get_video_key_resolves_without_network(yt_service: YTService) -> None:
+    """Should identify extractor and video id from the URL alone."""
+    with patch("yt_dlp.YoutubeDL") as mock_yt:
+        key = await yt_service.get_video_key(HttpUrl("https://youtu.be/dQw4w9WgXcQ"))
+        generic = await yt_service.get_video_key(
+            HttpUrl("https://example.com/audio.mp3")
+        )
+
+    assert key == ("Youtube", "dQw4w9WgXcQ")
+    assert generic is None
+    mock_yt.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_metadata_is_extracted_once_per_url(yt_service: YTService) -> None:
+    """Duration, title and playlist lookups of one URL should share an extraction."""
+    video = HttpUrl("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+    playlist = HttpUrl("https://www.youtube.com/playlist?list=PL123")
+    with patch("yt_dlp.YoutubeDL") as mock_yt:
+        mock_instance = mock_yt.return_value.__enter__.return_value
+
+        def extract_info(url: str, download: bool) -> Dict[str, Any]:
+            if "list=" in url:
+                return {
+                    "title": "Lista",
+                    "entries": [{"url": str(video), "duration": 60}],
+                }
+            return {"title": "Video", "duration": 300}
+
+        mock_instance.extract_info.side_effect = extract_info
+        durations = await asyncio.gather(
+            *[yt_service.get_video_duration(video) for _ in range(5)]
+        )
+        count = await yt_service.count_media_in_yt_playlist(playlist)
+        urls = await yt_service.get_video_urls_from_playlist(playlist)
+
+    assert durations == [5] * 5
+    assert count == 1
+    assert urls == [str(video)]
+    assert mock_instance.extract_info.call_count == 2
+
+
+def _paged_playlist(
+    total: int, first_page_read: threading.Event, resume: threading.Event
+) -> Generator[dict, None, None]:
+    """Lazy entries like yt-dlp's, pausing after the first page."""
+    for i in range(total):
+        if i == 2:
+            first_page_read.set()
+            assert resume.wait(5)
+        yield {"url": f"https://www.youtube.com/watch?v=v{i}", "duration": 60}
+
+
+@pytest.mark.asyncio
+async def test_iter_video_urls_yields_before_enumeration_completes(
+    yt_service: YTService,
+) -> None:
+    """Should hand out the first entries while later pages are still pending."""
+    playlist = HttpUrl("https://www.youtube.com/watch?v=v0&list=PL123")
+    first_page_read, resume = threading.Event(), threading.Event()
+
+    def extract_info(
+        url: str, download: bool, process: bool = True, **_: object
+    ) -> Dict[str, Any]:
+        if "watch" in url:
+            return {
+                "_type": "url",
+                "url": "https://www.youtube.com/playlist?list=PL123",
+                "ie_key": "YoutubeTab",
+            }
+        return {
+            "title": "Lista",
+            "entries": _paged_playlist(5, first_page_read, resume),
+        }
+
+    with patch("yt_dlp.YoutubeDL") as mock_yt:
+        mock_yt.return_value.__enter__.return_value.extract_info.side_effect = (
+            extract_info
+        )
+        urls = yt_service.iter_video_urls_from_playlist(playlist)
+        first = await urls.__anext__()
+        # Page two is held back until the first entry has been consumed.
+        assert first == "https://www.youtube.com/watch?v=v0"
+        resume.set()
+        rest = [url async for url in urls]
+
+        # The complete enumeration is cached for later lookups.
+        cached = await yt_service.get_video_urls_from_playlist(playlist)
+
+    assert [first, *rest] == [f"https://www.youtube.com/watch?v=v{i}" for i in range(5)]
+    assert cached == [first, *rest]
+    assert mock_yt.return_value.__enter__.return_value.extract_info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_iter_video_urls_applies_window_start_and_limit(
+    yt_service: YTService,
+) -> None:
+    """Should skip `start` entries, stop after `limit` and not cache a partial list."""
+    playlist = HttpUrl("https://www.youtube.com/playlist?list=PL123")
+    resume = threading.Event()
+    resume.set()
+
+    with patch("yt_dlp.YoutubeDL") as mock_yt:
+        mock_instance = mock_yt.return_value.__enter__.return_value
+        mock_instance.extract_info.side_effect = lambda *_, **__: {
+            "title": "Canal",
+            "entries": _paged_playlist(100, threading.Event(), resume),
+        }
+        urls = [
+            url
+            async for url in yt_service.iter_video_urls_from_playlist(
+                playlist, start=10, limit=3
+            )
+        ]
+        await yt_service.get_video_urls_from_playlist(playlist)
+
+    assert urls == [f"https://www.youtube.com/watch?v=v{i}" for i in (10, 11, 12)]
+    assert mock_instance.extract_info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_iter_video_urls_leaves_default_executor_free(
+    yt_service: YTService,
+) -> None:
+    """A paused enumeration should not hold a thread of the default executor."""
+    playlist = HttpUrl("https://www.youtube.com/playlist?list=PL123")
+    first_page_read, resume = threading.Event(), threading.Event()
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=1)
+    loop.set_default_executor(executor)
+
+    with patch("yt_dlp.YoutubeDL") as mock_yt:
+        mock_yt.return_value.__enter__.return_value.extract_info.side_effect = (
+            lambda *_, **__: {
+                "title": "Lista",
+                "entries": _paged_playlist(5, first_page_read, resume),
+            }
+        )
+        urls = yt_service.iter_video_urls_from_playlist(playlist)
+        await urls.__anext__()
+        await asyncio.to_thread(first_page_read.wait, 5)
+        # Both the pager and the consumer are waiting on page two.
+        assert await asyncio.wait_for(asyncio.to_thread(lambda: 1), 2) == 1
+        resume.set()
+        rest = [url async for url in urls]
+
+    executor.shutdown(wait=False)
+    assert len(rest) == 4
+
+
+def test_shared_ttl_cache_expires_and_evicts_locally() -> None:
+    """Without Redis, entries should expire after their TTL and be LRU-bounded."""
+    cache = SharedTTLCache("test", max_entries=2)
+    cache.set("a", {"duration": 1}, ttl_seconds=60)
+    cache.set("b", {"duration": 2}, ttl_seconds=-1)
+
+    assert cache.get("b") is None
+    cache.set("c", {"duration": 3}, ttl_seconds=60)
+    assert cache.get("a") == {"duration": 1}
+    cache.set("d", {"duration": 4}, ttl_seconds=60)
+    assert cache.get("c") is None
+    assert cache.get("a") == {"duration": 1}
+
+
+def test_shared_ttl_cache_falls_back_when_redis_is_down() -> None:
+    """A Redis error should not lose the entry: it is kept in-process instead."""
+    cache = SharedTTLCache("test", url="redis://localhost:1/0")
+    with patch("redis.Redis.from_url") as from_url:
+        from_url.return_value.set.side_effect = ConnectionError("refused")
+        cache.set("a", {"duration": 1}, ttl_seconds=60)
+        assert cache.get("a") == {"duration": 1}
+
+    from_url.return_value.get.assert_not_called()
+
+
+@pytest.fixture
+def media_server(tmp_path: Path) -> Generator[str, None, None]:
+    """Local HTTP stand-in serving an m4a audio file."""
+    served = tmp_path / "served"
+    served.mkdir()
+    (served / "clip.m4a").write_bytes(os.urandom(64 * 1024))
+    handler = partial(SimpleHTTPRequestHandler, directory=str(served))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/clip.m4a"
+    server.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_download_audio_keeps_native_format(
+    yt_service: YTService, media_server: str, tmp_path: Path
+) -> None:
+    """Should save the served audio stream as-is, without an mp3 re-encode."""
+    dest = tmp_path / "job"
+
+    path = await yt_service.download_audio(HttpUrl(media_server), str(dest), "0")
+
+    assert path == str(dest / "0.m4a")
+    assert (dest / "0.m4a").read_bytes() == (
+        tmp_path / "served" / "clip.m4a"
+    ).read_bytes()
+    assert not list(dest.glob("*.mp3"))
+
+
+@pytest.mark.asyncio
+async def test_download_audio_limits_concurrent_downloads(
+    yt_service: YTService, tmp_path: Path
+) -> None:
+    """Downloads across a playlist should respect YT_DOWNLOAD_CONCURRENCY."""
+    running = peak = 0
+    lock = threading.Lock()
+
+    def fake_download(url: str, dest_folder: str, name: str) -> str:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return f"{dest_folder}/{name}.webm"
+
+    with patch.object(yt_service, "_sync_download", fake_download), patch(
+        "core.brevio.services.yt_service.YT_DOWNLOAD_CONCURRENCY", 2
+    ):
+        paths = await asyncio.gather(
+            *[
+                yt_service.download_audio(
+                    HttpUrl(f"https://www.youtube.com/watch?v=v{i}"),
+                    str(tmp_path),
+                    str(i),
+                )
+                for i in range(6)
+            ]
+        )
+
+    assert peak == 2
+    assert paths == [f"{tmp_path}/{i}.webm" for i in range(6)]
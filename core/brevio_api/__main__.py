@@ -1,5 +1,3 @@
-import logging
-import os
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator, Awaitable, Callable, Union
 
@@ -15,7 +13,7 @@ from pydantic import ValidationError
 from starlette.requests import Request
 from starlette.responses import Response
 
-from core.brevio_api.core.database import AsyncDB
+from core.brevio_api.core.app_services import get_app_services
 from core.brevio_api.handlers.exception_handlers import (
     auth_service_exception_handler,
     expired_signature_exception_handler,
@@ -34,6 +32,7 @@ from core.brevio_api.routers import (
     brevio_router,
     user_router,
 )
+from core.shared.utils.logging_utils import configure_logging
 
 load_dotenv()
 
@@ -46,16 +45,15 @@ def custom_jsonable_encoder(obj: Any) -> Any:
 
 ExceptionHandler = Callable[[Request, Exception], Union[Response, Awaitable[Response]]]
 
-db = AsyncDB()
-
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
-    # Código de startup
-    await db.verify_connection()
+    # Código de startup: servicios compartidos por todas las peticiones
+    services = get_app_services(app)
+    app.state.startup_checks = await services.startup_check()
     yield
-    # Código de shutdown (si hace falta cerrar conexión)
-    await db.close()
+    # Código de shutdown
+    await services.close()
 
 
 app = FastAPI(
@@ -78,6 +76,7 @@ app = FastAPI(
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
     json_encoder=custom_jsonable_encoder,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -105,13 +104,4 @@ app.include_router(user_router)
 app.include_router(billing_router)
 
 
-def setup_logging() -> None:
-    log_level = os.getenv("LOG_LEVEL", "DEBUG").upper()  # Cambia por INFO en producción
-    logging.basicConfig(
-        level=getattr(logging, log_level),
-        format="%(asctime)s | %(name)s | %(levelname)s | %(message)s",
-        handlers=[logging.StreamHandler()],
-    )
-
-
-setup_logging()
+configure_logging()
@@ -1,6 +1,9 @@
 import os
 
 from celery import Celery
+from celery.signals import setup_logging, worker_process_init
+
+from core.shared.utils.logging_utils import configure_logging
 
 celery_app = Celery(
     "worker",
@@ -17,4 +20,20 @@ celery_app.conf.update(
     CELERYD_FORCE_EXECV=True,
 )
 
+
+@setup_logging.connect
+def _configure_worker_logging(**kwargs: object) -> None:
+    configure_logging()
+
+
+@worker_process_init.connect
+def _preload_whisper_model(**kwargs: object) -> None:
+    if os.getenv("WHISPER_PRELOAD", "true").lower() == "true":
+        from core.brevio.managers.whisper_model_registry import WhisperModelRegistry
+
+        # In a thread: the child must report ready within
+        # worker_proc_alive_timeout, which a model load easily exceeds.
+        WhisperModelRegistry.preload_in_background()
+
+
 import core.brevio_api.tasks
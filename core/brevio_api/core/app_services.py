@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import tempfile
+from functools import cached_property
+from typing import Dict, Optional
+
+from fastapi import FastAPI
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from core.brevio_api.core.database import AsyncDB
+from core.brevio_api.services.billing.billing_estimator_service import (
+    BillingEstimatorService,
+)
+from core.brevio_api.services.brevio_service import BrevioService
+from core.brevio_api.services.upload_store_service import UploadStoreService
+
+logger = logging.getLogger(__name__)
+
+
+class AppServices:
+    """Services shared by every request of one FastAPI app.
+
+    The Motor client, ``BrevioService`` (and with it the summary,
+    transcription and download services) and the billing estimator with its
+    tokenizer are built once instead of per request. The lifespan builds
+    them at startup; outside of it (e.g. a ``TestClient`` used without a
+    ``with`` block) each one is built on first use.
+    """
+
+    def __init__(self, db: Optional[AsyncDB] = None) -> None:
+        self._db = db
+
+    @cached_property
+    def db(self) -> AsyncDB:
+        return self._db or AsyncDB()
+
+    @cached_property
+    def database(self) -> AsyncIOMotorDatabase:
+        return self.db.database()
+
+    @cached_property
+    def billing_estimator(self) -> BillingEstimatorService:
+        return BillingEstimatorService()
+
+    @cached_property
+    def brevio_service(self) -> BrevioService:
+        return BrevioService(db=self.db, billing_estimator=self.billing_estimator)
+
+    @cached_property
+    def upload_store(self) -> UploadStoreService:
+        return UploadStoreService()
+
+    async def startup_check(self) -> Dict[str, bool]:
+        """Build every service and check what a request will rely on.
+
+        MongoDB being unreachable aborts the startup; the other checks only
+        log a warning so that the API still serves what it can.
+        """
+        await self.db.verify_connection()
+        checks = {"mongodb": True}
+
+        brevio_service = await asyncio.to_thread(lambda: self.brevio_service)
+        checks["catalog"] = bool(
+            brevio_service.get_languages() and brevio_service.get_models()
+        )
+        await asyncio.to_thread(lambda: self.billing_estimator)
+        checks["upload_staging"] = await asyncio.to_thread(
+            self._staging_writable, self.upload_store
+        )
+
+        for name, ok in checks.items():
+            if not ok:
+                logger.warning(f"Startup check failed: {name}")
+        logger.info(
+            "Startup checks: "
+            + ", ".join(
+                f"{name}={'ok' if ok else 'FAILED'}" for name, ok in checks.items()
+            )
+        )
+        return checks
+
+    @staticmethod
+    def _staging_writable(upload_store: UploadStoreService) -> bool:
+        try:
+            upload_store.staging_folder.mkdir(parents=True, exist_ok=True)
+            with tempfile.TemporaryFile(dir=upload_store.staging_folder):
+                return True
+        except OSError as e:
+            logger.warning(f"Upload staging folder not writable: {e}")
+            return False
+
+    async def close(self) -> None:
+        if "db" in self.__dict__:
+            await self.db.close()
+
+
+def get_app_services(app: FastAPI) -> AppServices:
+    """The ``AppServices`` of ``app``, created the first time it is needed."""
+    services: Optional[AppServices] = getattr(app.state, "services", None)
+    if services is None:
+        services = app.state.services = AppServices()
+    return services
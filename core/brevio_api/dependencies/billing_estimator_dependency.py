@@ -1,11 +1,12 @@
-from fastapi import Query
+from fastapi import Query, Request
 
 from core.brevio.enums.language import LanguageType
+from core.brevio_api.core.app_services import get_app_services
 from core.brevio_api.services.billing.billing_estimator_service import (
     BillingEstimatorService,
 )
 from core.shared.enums.model import ModelType
 
 
-def get_billing_estimator() -> BillingEstimatorService:
-    return BillingEstimatorService()
+async def get_billing_estimator(request: Request) -> BillingEstimatorService:
+    return get_app_services(request.app).billing_estimator
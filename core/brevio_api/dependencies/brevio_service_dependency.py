@@ -1,5 +1,8 @@
+from fastapi import Request
+
+from core.brevio_api.core.app_services import get_app_services
 from core.brevio_api.services.brevio_service import BrevioService
 
 
-def get_brevio_service() -> BrevioService:
-    return BrevioService()
+async def get_brevio_service(request: Request) -> BrevioService:
+    return get_app_services(request.app).brevio_service
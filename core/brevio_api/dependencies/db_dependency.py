@@ -1,8 +1,8 @@
+from fastapi import Request
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
-from core.brevio_api.core.database import AsyncDB
+from core.brevio_api.core.app_services import get_app_services
 
 
-def get_db() -> AsyncIOMotorDatabase:
-    db = AsyncDB().database()
-    return db
+async def get_db(request: Request) -> AsyncIOMotorDatabase:
+    return get_app_services(request.app).database
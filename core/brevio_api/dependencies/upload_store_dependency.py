@@ -0,0 +1,8 @@
+from fastapi import Request
+
+from core.brevio_api.core.app_services import get_app_services
+from core.brevio_api.services.upload_store_service import UploadStoreService
+
+
+async def get_upload_store(request: Request) -> UploadStoreService:
+    return get_app_services(request.app).upload_store
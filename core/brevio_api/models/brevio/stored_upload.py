@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+
+
+class StoredUpload(BaseModel):
+    """An upload already written to the staging area of the shared data volume.
+
+    This reference, not the file content, is what travels to the Celery
+    worker.
+    """
+
+    filename: str
+    path: str
+    content_hash: str
+    size: int
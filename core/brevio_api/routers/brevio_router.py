@@ -1,5 +1,6 @@
 import base64
-from typing import Dict, List, Optional, Tuple, cast
+import json
+from typing import AsyncGenerator, Dict, List, Optional, Tuple, cast
 
 from bson import ObjectId
 from fastapi import (
@@ -12,7 +13,7 @@ from fastapi import (
     UploadFile,
     status,
 )
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import HttpUrl
 
 from core.brevio.enums.extension import ExtensionType
@@ -23,6 +24,7 @@ from core.brevio.models.prompt_config_model import PromptConfig
 from core.brevio_api.celery import celery_app
 from core.brevio_api.dependencies.api_key_dependency import verify_api_key
 from core.brevio_api.dependencies.brevio_service_dependency import get_brevio_service
+from core.brevio_api.dependencies.upload_store_dependency import get_upload_store
 from core.brevio_api.dependencies.usage_cost_tracker_dependency import (
     get_cost_token_tracker,
 )
@@ -46,8 +48,12 @@ from core.brevio_api.models.brevio.responses.brevio_responses import (
 from core.brevio_api.models.brevio.url_yt import UrlYT
 from core.brevio_api.services.billing.usage_cost_tracker import UsageCostTracker
 from core.brevio_api.services.brevio_service import BrevioService
+from core.brevio_api.services.upload_store_service import UploadStoreService
 from core.brevio_api.tasks import generate_summary_task, process_summary_task
-from core.brevio_api.utils.language_utils import language_from_form
+from core.brevio_api.utils.language_utils import (
+    input_language_from_form,
+    language_from_form,
+)
 from core.shared.enums.model import ModelType
 from core.shared.models.brevio.brevio_generate import BrevioGenerate
 
@@ -205,6 +211,36 @@ class BrevioRoutes:
                     detail="An unexpected error occurred",
                 )
 
+        @self.router.post(
+            "/count-time-yt-video/stream",
+            description="""
+                Stream the duration in minutes of each video of a YouTube URL as
+                newline-delimited JSON, with the running total, as soon as each one
+                is known. The last line has the final count and total.
+            """,
+            status_code=status.HTTP_200_OK,
+            responses={
+                401: {"description": "Invalid API key"},
+                422: {"description": "Invalid URL format"},
+            },
+        )
+        async def stream_total_duration(
+            request: UrlYT,
+            verify_api_key: str = Depends(verify_api_key),
+            brevio_service: BrevioService = Depends(get_brevio_service),
+        ) -> StreamingResponse:
+            async def lines() -> AsyncGenerator[str, None]:
+                count, total = 0, 0.0
+                async for item in brevio_service.iter_media_durations(
+                    HttpUrl(request.url)
+                ):
+                    count += 1
+                    total += item["duration"]
+                    yield json.dumps({**item, "total": total}) + "\n"
+                yield json.dumps({"done": True, "count": count, "total": total}) + "\n"
+
+            return StreamingResponse(lines(), media_type="application/x-ndjson")
+
         @self.router.post(
             "/summary-media",
             response_model=ProcessingMessageResponse,
@@ -227,8 +263,10 @@ class BrevioRoutes:
             style: str = Form(...),
             format: OutputFormatType = Form(...),
             summary_level: SummaryLevel = Form(...),
+            input_language: Optional[LanguageType] = Depends(input_language_from_form),
             _current_user: ObjectId = Depends(get_current_user),
             brevio_service: BrevioService = Depends(get_brevio_service),
+            upload_store: UploadStoreService = Depends(get_upload_store),
         ) -> JSONResponse:
             # Define valid extensions for media files
             valid_media_extensions = [ExtensionType.MP3.value]
@@ -250,23 +288,27 @@ class BrevioRoutes:
                         detail="File must have a valid filename with extension",
                     )
 
-            # Convert files to data for Celery task
-            file_data_list = [
-                (file.filename or "unknown", await file.read()) for file in files
-            ]
+            # Stream the uploads to the shared volume; only references are
+            # sent to Celery.
+            stored_files = await upload_store.stage_all(files)
 
             # Start Celery task
-            task = process_summary_task.delay(
-                files=file_data_list,
-                language=language.value,
-                model=model.value,
-                category=category,
-                style=style,
-                format=format.value,
-                summary_level=summary_level.value,
-                _current_user=str(_current_user),
-                is_media=True,
-            )  # type: ignore
+            try:
+                task = process_summary_task.delay(
+                    files=[stored.model_dump() for stored in stored_files],
+                    language=language.value,
+                    model=model.value,
+                    category=category,
+                    style=style,
+                    format=format.value,
+                    summary_level=summary_level.value,
+                    _current_user=str(_current_user),
+                    is_media=True,
+                    input_language=input_language.value if input_language else None,
+                )  # type: ignore
+            except Exception:
+                await upload_store.discard(stored_files)
+                raise
 
             # Return response
             response = ProcessingMessageResponse(data=ProcessingMessageData())
@@ -298,6 +340,7 @@ class BrevioRoutes:
             format: OutputFormatType = Form(...),
             summary_level: SummaryLevel = Form(...),
             _current_user: ObjectId = Depends(get_current_user),
+            upload_store: UploadStoreService = Depends(get_upload_store),
         ) -> JSONResponse:
             # Define valid extensions for document files
             valid_document_extensions = [
@@ -322,23 +365,26 @@ class BrevioRoutes:
                         detail="File must have a valid filename with extension",
                     )
 
-            # Convert files to data for Celery task
-            file_data_list = [
-                (file.filename or "unknown", await file.read()) for file in files
-            ]
+            # Stream the uploads to the shared volume; only references are
+            # sent to Celery.
+            stored_files = await upload_store.stage_all(files)
 
             # Start Celery task
-            task = process_summary_task.delay(
-                files=file_data_list,
-                language=language.value,
-                model=model.value,
-                category=category,
-                style=style,
-                format=format.value,
-                summary_level=summary_level.value,
-                _current_user=str(_current_user),
-                is_media=False,
-            )  # type: ignore
+            try:
+                task = process_summary_task.delay(
+                    files=[stored.model_dump() for stored in stored_files],
+                    language=language.value,
+                    model=model.value,
+                    category=category,
+                    style=style,
+                    format=format.value,
+                    summary_level=summary_level.value,
+                    _current_user=str(_current_user),
+                    is_media=False,
+                )  # type: ignore
+            except Exception:
+                await upload_store.discard(stored_files)
+                raise
 
             # Return response
             response = ProcessingMessageResponse(data=ProcessingMessageData())
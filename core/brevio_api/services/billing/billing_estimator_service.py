@@ -17,10 +17,6 @@ from core.shared.models.history_token_model import HistoryTokenModel
 from core.shared.utils.model_tokens_utils import get_encoder
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
-handler = logging.StreamHandler()
-handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
-logger.addHandler(handler)
 
 
 class BillingEstimatorService:
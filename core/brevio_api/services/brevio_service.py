@@ -1,12 +1,9 @@
 import asyncio
-import json
 import logging
 import os
-import subprocess
 from pathlib import Path as FilePath
-from typing import Any, Dict, List, Tuple
+from typing import Any, AsyncGenerator, Dict, List, Optional
 
-import aiofiles
 from fastapi import HTTPException, status
 from pydantic import HttpUrl, ValidationError
 
@@ -14,13 +11,16 @@ from core.brevio.__main__ import Main
 from core.brevio.constants.constants import Constants
 from core.brevio.managers.directory_manager import DirectoryManager
 from core.brevio.models.prompt_config_model import PromptConfig
+from core.brevio.services.media_probe_service import MediaProbeService
 from core.brevio_api.core.database import AsyncDB
+from core.brevio_api.models.brevio.stored_upload import StoredUpload
 from core.brevio_api.repositories.folder_entry_repository import FolderEntryRepository
 from core.brevio_api.repositories.user_repository import UserRepository
 from core.brevio_api.services.billing.billing_estimator_service import (
     BillingEstimatorService,
 )
 from core.brevio_api.services.billing.usage_cost_tracker import UsageCostTracker
+from core.brevio_api.services.upload_store_service import UploadStoreService
 from core.brevio_api.services.user_service import UserService
 from core.shared.models.brevio.brevio_generate import BrevioGenerate, MediaEntry
 
@@ -47,12 +47,20 @@ async def wait_for_file(
 
 
 class BrevioService:
-    def __init__(self) -> None:
-        self._db = AsyncDB()
+    def __init__(
+        self,
+        db: Optional[AsyncDB] = None,
+        billing_estimator: Optional[BillingEstimatorService] = None,
+    ) -> None:
+        self._db = db or AsyncDB()
         self._user_service: UserService | None = None
         self.directory_manager = DirectoryManager()
         self._main = Main()
-        self._billing_estimator_cost_service = BillingEstimatorService()
+        self._billing_estimator_cost_service = (
+            billing_estimator or BillingEstimatorService()
+        )
+        self._media_probe = MediaProbeService.shared()
+        self._upload_store = UploadStoreService()
 
     async def init_services(self) -> None:
         await self._db.verify_connection()
@@ -79,6 +87,11 @@ class BrevioService:
 
         return sum(int(item["duration"]) for item in duration_data["durations"])
 
+    def iter_media_durations(
+        self, url: HttpUrl
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        return self._main.iter_media_durations(url)
+
     async def get_media_duration(self, url: HttpUrl) -> Dict[str, Any]:
         try:
             return await self._main.get_media_duration(url)
@@ -175,7 +188,7 @@ class BrevioService:
 
     async def generate_summary_media_upload(
         self,
-        files_data: List[Tuple[str, bytes]],
+        files_data: List[StoredUpload],
         _current_user_id: str,
         _prompt_config: PromptConfig,
         _usage_cost_tracker: UsageCostTracker,
@@ -210,24 +223,33 @@ class BrevioService:
         saved_files: List[MediaEntry] = []
         total_media_minutes = 0.0
 
-        tasks = [
-            self.save_media(content, uploads_dir / str(index) / filename)
-            for index, (filename, content) in enumerate(files_data)
-        ]
-        await asyncio.gather(*tasks)
-
-        for index, (filename, _) in enumerate(files_data):
-            file_path = uploads_dir / str(index) / f"{filename}"
+        file_paths = await self._claim_uploads(files_data, uploads_dir)
+        content_hashes = [stored.content_hash for stored in files_data]
+        for file_path in file_paths:
             if not await wait_for_file(file_path):
                 logger.error(f"File {file_path} not created after saving")
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail=f"File {file_path} not created after saving",
                 )
+
+        # Every upload is probed at once (bounded by MEDIA_PROBE_CONCURRENCY).
+        try:
+            probes = await self._media_probe.probe_many(
+                list(zip(file_paths, content_hashes))
+            )
+        except RuntimeError:
+            raise
+        except Exception as e:
+            raise RuntimeError(
+                f"Error inesperado al calcular duración de los archivos: {str(e)}"
+            ) from e
+        for file_path, content_hash, probe in zip(file_paths, content_hashes, probes):
             try:
-                minutes = await self.count_minutes_media(file_path)
-                total_media_minutes += minutes
-                saved_files.append(MediaEntry(path=file_path))
+                total_media_minutes += round(probe.duration / 60, 2)
+                saved_files.append(
+                    MediaEntry(path=file_path, content_hash=content_hash)
+                )
             except ValidationError as e:
                 logger.error(
                     f"Validation error for MediaEntry at {file_path}: {str(e)}"
@@ -261,7 +283,7 @@ class BrevioService:
 
     async def generate_summary_documents(
         self,
-        files_data: List[Tuple[str, bytes]],
+        files_data: List[StoredUpload],
         _current_user_id: str,
         _prompt_config: PromptConfig,
         _usage_cost_tracker: UsageCostTracker,
@@ -294,16 +316,11 @@ class BrevioService:
             f"{Constants.DESTINATION_FOLDER}/{user_folder_id}/{current_folder_entry_id}/"
         )
 
-        tasks = [
-            self.save_media(content, uploads_dir / str(index) / filename)
-            for index, (filename, content) in enumerate(files_data)
-        ]
-
-        await asyncio.gather(*tasks)
+        file_paths = await self._claim_uploads(files_data, uploads_dir)
+        content_hashes = [stored.content_hash for stored in files_data]
 
         saved_files: List[MediaEntry] = []
-        for index, (filename, _) in enumerate(files_data):
-            file_path = uploads_dir / str(index) / filename
+        for index, file_path in enumerate(file_paths):
             if not await wait_for_file(file_path):
                 logger.error(f"File {file_path} not created after saving")
                 raise HTTPException(
@@ -311,7 +328,9 @@ class BrevioService:
                     detail=f"File {file_path} not created after saving",
                 )
             try:
-                saved_files.append(MediaEntry(path=file_path))
+                saved_files.append(
+                    MediaEntry(path=file_path, content_hash=content_hashes[index])
+                )
             except ValidationError as e:
                 logger.error(
                     f"Validation error for MediaEntry at {file_path}: {str(e)}"
@@ -334,71 +353,38 @@ class BrevioService:
         )
         return result
 
-    async def save_media(self, content: bytes, file_path: FilePath) -> None:
+    async def _claim_uploads(
+        self, files_data: List[StoredUpload], uploads_dir: FilePath
+    ) -> List[FilePath]:
+        """Move the staged uploads into ``uploads_dir/<index>/<filename>``."""
         try:
-            logger.debug(f"Saving media to {file_path}")
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-
-            os.chmod(file_path.parent, 0o755)
-
-            await self._write_file(file_path, content)
-            logger.debug(f"Successfully saved media to {file_path}")
-        except Exception as e:
-            logger.error(
-                f"Error saving media file {file_path}: {str(e)}", exc_info=True
+            return list(
+                await asyncio.gather(
+                    *[
+                        self._upload_store.claim(
+                            stored, uploads_dir / str(index) / stored.filename
+                        )
+                        for index, stored in enumerate(files_data)
+                    ]
+                )
             )
+        except Exception as e:
+            logger.error(f"Error claiming uploads: {str(e)}", exc_info=True)
+            await self._upload_store.discard(files_data)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error saving media file {file_path}: {str(e)}",
+                detail=f"Error saving media files: {str(e)}",
             )
 
-    async def count_minutes_media(self, file_path: FilePath) -> float:
+    async def count_minutes_media(
+        self, file_path: FilePath, content_hash: Optional[str] = None
+    ) -> float:
         try:
-            cmd = [
-                "ffprobe",
-                "-v",
-                "quiet",
-                "-print_format",
-                "json",
-                "-show_format",
-                str(file_path),
-            ]
-
-            # Ejecutar el subprocess de forma asíncrona
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-
-            stdout, stderr = await process.communicate()
-
-            if process.returncode != 0:
-                raise RuntimeError(
-                    f"ffprobe falló en {file_path}: {stderr.decode().strip()}"
-                )
-
-            probe_data = json.loads(stdout.decode())
-            duration_seconds = float(probe_data["format"]["duration"])
-            duration_minutes = duration_seconds / 60
-            return round(duration_minutes, 2)
-
-        except (KeyError, ValueError, json.JSONDecodeError) as e:
-            raise RuntimeError(
-                f"Error al obtener la duración de {file_path}: {str(e)}"
-            ) from e
+            probe = await self._media_probe.probe(file_path, content_hash)
+            return round(probe.duration / 60, 2)
+        except RuntimeError:
+            raise
         except Exception as e:
             raise RuntimeError(
                 f"Error inesperado al calcular duración de {file_path}: {str(e)}"
             ) from e
-
-    async def _write_file(self, file_path: FilePath, content: bytes) -> None:
-        try:
-            async with aiofiles.open(file_path, "wb") as f:
-                await f.write(content)
-                await f.flush()
-
-                loop = asyncio.get_running_loop()
-                await loop.run_in_executor(None, os.fsync, f.fileno())
-        except Exception as e:
-            raise RuntimeError(f"Error al escribir en {file_path}: {str(e)}") from e
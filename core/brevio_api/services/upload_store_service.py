@@ -0,0 +1,95 @@
+import asyncio
+import hashlib
+import logging
+import os
+import shutil
+import uuid
+from contextlib import suppress
+from pathlib import Path as FilePath
+from typing import List, Optional, Sequence
+
+import aiofiles
+from fastapi import UploadFile
+
+from core.brevio.constants.constants import Constants
+from core.brevio_api.models.brevio.stored_upload import StoredUpload
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+# Must be on the volume the API and the Celery workers share, and on the same
+# filesystem as DESTINATION_FOLDER so that claiming an upload is a rename.
+UPLOAD_STAGING_FOLDER = os.getenv(
+    "UPLOAD_STAGING_FOLDER", os.path.join(Constants.DESTINATION_FOLDER, ".uploads")
+)
+
+
+class UploadStoreService:
+    """Moves uploads from the request to the worker through the data volume.
+
+    The API streams each upload in ``UPLOAD_CHUNK_BYTES`` chunks into its own
+    staging directory, hashing it on the way, and enqueues the resulting
+    ``StoredUpload``. The worker then claims it into the user's folder.
+    """
+
+    def __init__(self, staging_folder: Optional[str] = None) -> None:
+        self.staging_folder = FilePath(staging_folder or UPLOAD_STAGING_FOLDER)
+
+    async def stage(self, upload: UploadFile) -> StoredUpload:
+        filename = os.path.basename(upload.filename or "") or "unknown"
+        path = self.staging_folder / uuid.uuid4().hex / filename
+        await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            async with aiofiles.open(path, "wb") as f:
+                while chunk := await upload.read(UPLOAD_CHUNK_BYTES):
+                    digest.update(chunk)
+                    size += len(chunk)
+                    await f.write(chunk)
+        except Exception as e:
+            await asyncio.to_thread(shutil.rmtree, path.parent, True)
+            raise RuntimeError(f"Error al escribir en {path}: {str(e)}") from e
+
+        logger.debug(f"Staged upload {filename} ({size} bytes) at {path}")
+        return StoredUpload(
+            filename=filename,
+            path=str(path),
+            content_hash=digest.hexdigest(),
+            size=size,
+        )
+
+    async def stage_all(self, uploads: Sequence[UploadFile]) -> List[StoredUpload]:
+        """Stage every upload, or none of them if one fails."""
+        results = await asyncio.gather(
+            *[self.stage(upload) for upload in uploads], return_exceptions=True
+        )
+        staged = [result for result in results if isinstance(result, StoredUpload)]
+        for result in results:
+            if isinstance(result, BaseException):
+                await self.discard(staged)
+                raise result
+        return staged
+
+    async def claim(self, upload: StoredUpload, file_path: FilePath) -> FilePath:
+        """Move a staged upload to ``file_path`` and return it."""
+        await asyncio.to_thread(self._claim, FilePath(upload.path), file_path)
+        return file_path
+
+    @staticmethod
+    def _claim(source: FilePath, file_path: FilePath) -> None:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        os.chmod(file_path.parent, 0o755)
+        try:
+            os.replace(source, file_path)
+        except OSError:
+            # Staging on another filesystem: fall back to a copy.
+            shutil.move(str(source), str(file_path))
+        with suppress(OSError):
+            source.parent.rmdir()
+
+    async def discard(self, uploads: Sequence[StoredUpload]) -> None:
+        """Remove staged uploads that will not be claimed."""
+        for upload in uploads:
+            await asyncio.to_thread(shutil.rmtree, FilePath(upload.path).parent, True)
@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from typing import List, Tuple
+from typing import Any, Dict, List, Optional
 
 from asgiref.sync import async_to_sync
 from bson import ObjectId, errors
@@ -11,8 +11,10 @@ from core.brevio.enums.language import LanguageType
 from core.brevio.enums.output_format_type import OutputFormatType
 from core.brevio.enums.summary_level import SummaryLevel
 from core.brevio.models.prompt_config_model import PromptConfig
+from core.brevio_api.models.brevio.stored_upload import StoredUpload
 from core.brevio_api.services.billing.usage_cost_tracker import UsageCostTracker
 from core.brevio_api.services.brevio_service import BrevioService
+from core.brevio_api.services.upload_store_service import UploadStoreService
 from core.shared.enums.model import ModelType
 from core.shared.models.brevio.brevio_generate import BrevioGenerate
 
@@ -21,7 +23,7 @@ logger = logging.getLogger(__name__)
 
 @shared_task(name="core.brevio_api.tasks.process_summary_task")
 def process_summary_task(
-    files: List[Tuple[str, bytes]],
+    files: List[Dict[str, Any]],
     language: str,
     model: str,
     category: str,
@@ -30,18 +32,26 @@ def process_summary_task(
     summary_level: str,
     _current_user: str,
     is_media: bool = False,
+    input_language: Optional[str] = None,
 ) -> str:
     allowed_extensions = (
         [ExtensionType.MP3.value]
         if is_media
         else [ExtensionType.DOCX.value, ExtensionType.PDF.value]
     )
+    stored_files = [StoredUpload(**file) for file in files]
     files_filtered = [
-        (name, content)
-        for name, content in files
-        if any(name.lower().endswith(ext.lower()) for ext in allowed_extensions)
+        stored
+        for stored in stored_files
+        if any(
+            stored.filename.lower().endswith(ext.lower()) for ext in allowed_extensions
+        )
     ]
 
+    rejected = [stored for stored in stored_files if stored not in files_filtered]
+    if rejected:
+        async_to_sync(UploadStoreService().discard)(rejected)
+
     if not files_filtered:
         logger.error("No se encontraron archivos válidos para procesar")
         raise ValueError("No se encontraron archivos válidos para procesar")
@@ -53,6 +63,7 @@ def process_summary_task(
         format=OutputFormatType(format),
         language=LanguageType(language),
         summary_level=SummaryLevel(summary_level),
+        input_language=LanguageType(input_language) if input_language else None,
     )
 
     _usage_cost_tracker = UsageCostTracker()
@@ -1,4 +1,5 @@
-from typing import Any, Dict, Generator, List
+import json
+from typing import Any, AsyncGenerator, Dict, Generator, List
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -14,9 +15,11 @@ from core.brevio_api.__main__ import app
 from core.brevio_api.config.dotenv import API_KEY
 from core.brevio_api.dependencies.api_key_dependency import verify_api_key
 from core.brevio_api.dependencies.brevio_service_dependency import get_brevio_service
+from core.brevio_api.dependencies.upload_store_dependency import get_upload_store
 from core.brevio_api.dependencies.user_dependency import get_current_user
 from core.brevio_api.models.user.user_folder import UserFolder
 from core.brevio_api.models.user.user_model import User
+from core.brevio_api.services.upload_store_service import UploadStoreService
 from core.shared.enums.model import ModelType
 
 client = TestClient(app)
@@ -83,6 +86,10 @@ class FakeBrevio:
     async def get_total_duration(self, url: str) -> int:
         return 3600
 
+    async def iter_media_durations(self, url: str) -> AsyncGenerator[Dict, None]:
+        yield {"url": "https://youtube.com/watch?v=a", "duration": 2.5}
+        yield {"url": "https://youtube.com/watch?v=b", "duration": 1.5}
+
 
 # ================================
 # FIXTURE PROMPT CONFIG
@@ -158,6 +165,19 @@ def test_duracion_video() -> None:
     assert r.json()["data"]["time"] == 3600
 
 
+def test_duracion_playlist_stream() -> None:
+    app.dependency_overrides[get_brevio_service] = lambda: FakeBrevio()
+    app.dependency_overrides[verify_api_key] = lambda: API_KEY
+    r = client.post(
+        "/brevio/count-time-yt-video/stream",
+        json={"url": "https://youtube.com/playlist?list=ABC"},
+    )
+    assert r.status_code == 200
+    lines = [json.loads(line) for line in r.text.splitlines()]
+    assert [line.get("total") for line in lines] == [2.5, 4.0, 4.0]
+    assert lines[-1] == {"done": True, "count": 2, "total": 4.0}
+
+
 def test_summary_playlist(mock_prompt_config: PromptConfig) -> None:
     app.dependency_overrides[get_brevio_service] = lambda: FakeBrevio()
     app.dependency_overrides[verify_api_key] = lambda: API_KEY
@@ -178,6 +198,10 @@ def test_summary_audio(tmp_path: Any, mock_prompt_config: PromptConfig) -> None:
     app.dependency_overrides[verify_api_key] = lambda: API_KEY
     app.dependency_overrides[get_current_user] = lambda: ObjectId()
 
+    app.dependency_overrides[get_upload_store] = lambda: UploadStoreService(
+        str(tmp_path / "staging")
+    )
+
     f = tmp_path / "test.mp3"
     f.write_bytes(b"fake audio")
 
@@ -194,14 +218,25 @@ def test_summary_pdf(tmp_path: Any, mock_prompt_config: PromptConfig) -> None:
     app.dependency_overrides[get_brevio_service] = lambda: FakeBrevio()
     app.dependency_overrides[verify_api_key] = lambda: API_KEY
     app.dependency_overrides[get_current_user] = lambda: ObjectId()
+    app.dependency_overrides[get_upload_store] = lambda: UploadStoreService(
+        str(tmp_path / "staging")
+    )
 
     f = tmp_path / "doc.pdf"
     f.write_bytes(b"%PDF-1.4")
 
-    with open(f, "rb") as file:
+    with open(f, "rb") as file, patch(
+        "core.brevio_api.routers.brevio_router.process_summary_task"
+    ) as task:
+        task.delay.return_value.id = "task-1"
         files = {"files": ("doc.pdf", file, "application/pdf")}
         data = {**mock_prompt_config.model_dump()}
         r = client.post("/brevio/summary-documents", files=files, data=data)
 
     assert r.status_code == 202
     assert r.json()["status"] == "success"
+    # Only a reference to the staged file goes through Celery.
+    (stored,) = task.delay.call_args.kwargs["files"]
+    assert stored["filename"] == "doc.pdf"
+    assert stored["size"] == len(b"%PDF-1.4")
+    assert open(stored["path"], "rb").read() == b"%PDF-1.4"
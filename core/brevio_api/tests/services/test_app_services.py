@@ -0,0 +1,67 @@
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from starlette.requests import Request
+
+from core.brevio_api.core.app_services import AppServices, get_app_services
+from core.brevio_api.dependencies.brevio_service_dependency import get_brevio_service
+from core.brevio_api.services.upload_store_service import UploadStoreService
+
+
+def _db() -> MagicMock:
+    db = MagicMock()
+    db.verify_connection = AsyncMock()
+    db.close = AsyncMock()
+    return db
+
+
+def _services(tmp_path: Path, db: MagicMock) -> AppServices:
+    """AppServices with its fake dependencies already built."""
+    services = AppServices(db)
+    brevio_service = MagicMock()
+    brevio_service.get_languages.return_value = ["es"]
+    brevio_service.get_models.return_value = ["gpt-4o-mini"]
+    services.__dict__["brevio_service"] = brevio_service
+    services.__dict__["billing_estimator"] = MagicMock()
+    services.__dict__["upload_store"] = UploadStoreService(str(tmp_path / "staging"))
+    return services
+
+
+@pytest.mark.asyncio
+async def test_startup_check_reports_every_check(tmp_path: Path) -> None:
+    """Should check MongoDB, the catalog and the upload staging directory."""
+    db = _db()
+    services = _services(tmp_path, db)
+
+    checks = await services.startup_check()
+
+    assert checks == {"mongodb": True, "catalog": True, "upload_staging": True}
+    db.verify_connection.assert_awaited_once()
+    await services.close()
+    db.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_startup_check_fails_when_mongodb_is_down(tmp_path: Path) -> None:
+    """Should abort startup when MongoDB is unreachable."""
+    db = _db()
+    db.verify_connection.side_effect = ConnectionError("down")
+    services = _services(tmp_path, db)
+
+    with pytest.raises(ConnectionError):
+        await services.startup_check()
+
+
+@pytest.mark.asyncio
+async def test_dependencies_share_app_scoped_instances(tmp_path: Path) -> None:
+    """Should hand every request the same BrevioService instance."""
+    app = FastAPI()
+    app.state.services = _services(tmp_path, _db())
+    requests = [Request({"type": "http", "app": app, "headers": []}) for _ in range(2)]
+
+    first, second = [await get_brevio_service(request) for request in requests]
+
+    assert first is second is app.state.services.brevio_service
+    assert get_app_services(app) is app.state.services
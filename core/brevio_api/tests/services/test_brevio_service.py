@@ -1,6 +1,6 @@
 import tempfile
 from pathlib import Path as FilePath
-from typing import Generator, Tuple, cast
+from typing import Generator, cast
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -12,7 +12,9 @@ from pydantic import HttpUrl
 from core.brevio.enums.language import LanguageType
 from core.brevio.enums.output_format_type import OutputFormatType
 from core.brevio.enums.summary_level import SummaryLevel
+from core.brevio.models.media_probe_model import MediaProbe
 from core.brevio.models.prompt_config_model import PromptConfig
+from core.brevio_api.models.brevio.stored_upload import StoredUpload
 from core.brevio_api.models.user.user_folder import UserFolder
 from core.brevio_api.models.user.user_model import User
 from core.brevio_api.services.billing.usage_cost_tracker import UsageCostTracker
@@ -157,25 +159,26 @@ async def test_generate_brevio_error(
 async def test_generate_summary_media_upload_success(
     brevio_service: BrevioService, mock_user: User, mock_prompt_config: PromptConfig
 ) -> None:
-    files_data: list[Tuple[str, bytes]] = [
-        ("video1.mp4", b"content1"),
-        ("audio1.mp3", b"content2"),
+    files_data = [
+        StoredUpload(filename=name, path=f"/staging/{name}", content_hash="h", size=8)
+        for name in ("video1.mp4", "audio1.mp3")
     ]
 
     with patch("core.brevio.constants.constants.Constants") as mock_constants, patch(
         "pathlib.Path.is_file", return_value=True
     ), patch("pathlib.Path.mkdir"), patch(
-        "core.brevio_api.services.brevio_service.BrevioService._write_file"
-    ) as mock_write_file, patch(
+        "core.brevio_api.services.upload_store_service.UploadStoreService._claim"
+    ) as mock_claim, patch(
         "core.brevio_api.services.brevio_service.wait_for_file",
         AsyncMock(return_value=True),
     ), patch.object(
-        brevio_service, "count_minutes_media", AsyncMock(return_value=1.0)
+        brevio_service._media_probe,
+        "probe_many",
+        AsyncMock(return_value=[MediaProbe(duration=60.0)] * len(files_data)),
     ), patch(
         "os.chmod", return_value=None
     ):
         mock_constants.DESTINATION_FOLDER = FilePath("/mock/dir")
-        mock_write_file.return_value = None
 
         user_id = str(mock_user.id)
         result = await brevio_service.generate_summary_media_upload(
@@ -183,7 +186,7 @@ async def test_generate_summary_media_upload_success(
         )
 
         assert result == {"result": "success"}
-        assert mock_write_file.call_count == len(files_data)
+        assert mock_claim.call_count == len(files_data)
         mock_generate: AsyncMock = cast(AsyncMock, brevio_service._main.generate)
         mock_generate.assert_awaited_once()
 
@@ -193,23 +196,22 @@ async def test_generate_summary_documents_success(
     brevio_service: BrevioService, mock_user: User, mock_prompt_config: PromptConfig
 ) -> None:
     """Test para verificar que generate_summary_documents funciona correctamente."""
-    files_data: list[Tuple[str, bytes]] = [
-        ("doc1.pdf", b"content1"),
-        ("doc2.pdf", b"content2"),
+    files_data = [
+        StoredUpload(filename=name, path=f"/staging/{name}", content_hash="h", size=8)
+        for name in ("doc1.pdf", "doc2.pdf")
     ]
 
     with patch("core.brevio.constants.constants.Constants") as mock_constants, patch(
         "pathlib.Path.is_file", return_value=True
     ), patch("pathlib.Path.mkdir"), patch(
-        "core.brevio_api.services.brevio_service.BrevioService._write_file"
-    ) as mock_write_file, patch(
+        "core.brevio_api.services.upload_store_service.UploadStoreService._claim"
+    ) as mock_claim, patch(
         "core.brevio_api.services.brevio_service.wait_for_file",
         AsyncMock(return_value=True),
     ), patch(
         "os.chmod", return_value=None
     ):
         mock_constants.DESTINATION_FOLDER = FilePath("/mock/dir")
-        mock_write_file.return_value = None
 
         user_id = str(mock_user.id)
         result = await brevio_service.generate_summary_documents(
@@ -217,7 +219,7 @@ async def test_generate_summary_documents_success(
         )
 
         assert result == {"summary": "done"}
-        assert mock_write_file.call_count == len(files_data)
+        assert mock_claim.call_count == len(files_data)
         mock_generate_summary: AsyncMock = cast(
             AsyncMock, brevio_service._main.generate_summary_documents
         )
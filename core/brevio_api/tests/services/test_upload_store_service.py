@@ -0,0 +1,80 @@
+import hashlib
+import io
+from pathlib import Path as FilePath
+from typing import Any
+
+import pytest
+from fastapi import UploadFile
+
+from core.brevio_api.services import upload_store_service
+from core.brevio_api.services.upload_store_service import UploadStoreService
+
+
+class _ChunkRecorder(io.BytesIO):
+    """File object that records the size of every read."""
+
+    def __init__(self, content: bytes) -> None:
+        super().__init__(content)
+        self.reads: list[int] = []
+
+    def read(self, size: Any = -1) -> bytes:
+        self.reads.append(size)
+        return super().read(size)
+
+
+@pytest.mark.asyncio
+async def test_stage_streams_upload_in_chunks_and_hashes_it(
+    tmp_path: FilePath, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Should write the upload in blocks and return its SHA-256."""
+    monkeypatch.setattr(upload_store_service, "UPLOAD_CHUNK_BYTES", 1024)
+    content = b"x" * (3 * 1024 + 7)
+    source = _ChunkRecorder(content)
+    store = UploadStoreService(str(tmp_path / "staging"))
+
+    stored = await store.stage(UploadFile(source, filename="../audio.mp3"))
+
+    assert stored.filename == "audio.mp3"
+    assert FilePath(stored.path).parent.parent == tmp_path / "staging"
+    assert FilePath(stored.path).read_bytes() == content
+    assert stored.content_hash == hashlib.sha256(content).hexdigest()
+    assert stored.size == len(content)
+    assert set(source.reads) == {1024}
+
+
+@pytest.mark.asyncio
+async def test_claim_moves_staged_upload_into_the_user_folder(
+    tmp_path: FilePath,
+) -> None:
+    """Should move the claimed file and remove its staging directory."""
+    store = UploadStoreService(str(tmp_path / "staging"))
+    stored = await store.stage(UploadFile(io.BytesIO(b"%PDF-1.4"), filename="doc.pdf"))
+    destination = tmp_path / "data" / "folder" / "entry" / "0" / "doc.pdf"
+
+    assert await store.claim(stored, destination) == destination
+
+    assert destination.read_bytes() == b"%PDF-1.4"
+    assert not FilePath(stored.path).parent.exists()
+
+
+@pytest.mark.asyncio
+async def test_stage_all_discards_everything_when_one_upload_fails(
+    tmp_path: FilePath,
+) -> None:
+    """Should leave no partial files behind when one upload fails."""
+
+    class _Broken(io.BytesIO):
+        def read(self, size: Any = -1) -> bytes:
+            raise OSError("client disconnected")
+
+    store = UploadStoreService(str(tmp_path / "staging"))
+
+    with pytest.raises(RuntimeError, match="client disconnected"):
+        await store.stage_all(
+            [
+                UploadFile(io.BytesIO(b"ok"), filename="a.mp3"),
+                UploadFile(_Broken(), filename="b.mp3"),
+            ]
+        )
+
+    assert list((tmp_path / "staging").iterdir()) == []
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from fastapi import Form, HTTPException, Query
 
 from core.brevio.enums.language import LanguageType
@@ -17,3 +19,12 @@ def language_from_query(language: str = Query(...)) -> LanguageType:
 
 def language_from_form(language: str = Form(...)) -> LanguageType:
     return parse_language_enum(language)
+
+
+def input_language_from_form(
+    input_language: Optional[str] = Form(None),
+) -> Optional[LanguageType]:
+    """Spoken language of uploaded media; empty means auto-detect."""
+    if not input_language or not input_language.strip():
+        return None
+    return parse_language_enum(input_language.strip())
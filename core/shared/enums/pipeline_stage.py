@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class PipelineStage(Enum):
+    MAP = "map"
+    POSTPROCESS = "postprocess"
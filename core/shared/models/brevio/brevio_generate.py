@@ -17,6 +17,7 @@ from core.brevio.models.prompt_config_model import PromptConfig
 class MediaEntry(BaseModel):
     url: Optional[HttpUrl] = None
     path: Optional[FilePath] = None
+    content_hash: Optional[str] = None
 
     @model_validator(mode="after")
     def validate_media(self) -> "MediaEntry":
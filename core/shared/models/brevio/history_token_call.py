@@ -1,5 +1,8 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
+from core.shared.enums.model import ModelType
 from core.shared.enums.type_call import TypeCall
 
 
@@ -8,3 +11,4 @@ class HistoryTokenCall(BaseModel):
     system_prompt_tokens: int
     user_prompt_tokens: int
     response_tokens: int
+    model: Optional[ModelType] = None
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class ModelTokenLedger(BaseModel):
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
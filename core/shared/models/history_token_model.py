@@ -7,12 +7,17 @@ from core.brevio.enums.source_type import SourceType
 from core.brevio.enums.style import StyleType
 from core.brevio.enums.summary_level import SummaryLevel
 from core.shared.enums.model import ModelType
+from core.shared.enums.type_call import TypeCall
 from core.shared.models.brevio.history_token_call import HistoryTokenCall
+from core.shared.models.brevio.model_token_ledger import ModelTokenLedger
 
 
 class HistoryTokenModel(BaseModel):
     model: ModelType = ModelType.GPT_4
     language_input: str = "english"
+    # How language_input was obtained: "hint" (given with the request) or
+    # "detected" (detected from the text).
+    language_input_source: str = "detected"
     language_output: str = "english"
     category: str = CategoryType.EDUCATION.value
     style: str = StyleType.EDUCATION_GUIDE.value
@@ -25,8 +30,35 @@ class HistoryTokenModel(BaseModel):
     total_tokens_summary_output: int = 0
     total_tokens_postprocess_output: int = 0
     total_tokens_postprocess_input: int = 0
+    extractive_input_tokens: int = 0
+    extractive_output_tokens: int = 0
+    # Audio voice-activity detection kept out of the transcription.
+    vad_skipped_seconds: float = 0.0
+    vad_skipped_ratio: float = 0.0
+    # Load of the in-process Whisper model that transcribed the audio.
+    whisper_load_seconds: float = 0.0
+    whisper_parameter_mb: float = 0.0
+    whisper_peak_rss_delta_mb: float = 0.0
     total_time: float | None = 0
     history_tokens_per_call: list[HistoryTokenCall] = []
+    tokens_per_model: dict[str, ModelTokenLedger] = {}
+
+    def record_call(self, call: HistoryTokenCall) -> None:
+        """Append ``call`` and update the stage totals and the per-model ledger."""
+        input_tokens = call.system_prompt_tokens + call.user_prompt_tokens
+        self.history_tokens_per_call.append(call)
+        if call.type_call == TypeCall.SUMMARY:
+            self.total_tokens_summary_input += input_tokens
+            self.total_tokens_summary_output += call.response_tokens
+        else:
+            self.total_tokens_postprocess_input += input_tokens
+            self.total_tokens_postprocess_output += call.response_tokens
+
+        model_key = (call.model or self.model).value
+        ledger = self.tokens_per_model.setdefault(model_key, ModelTokenLedger())
+        ledger.calls += 1
+        ledger.input_tokens += input_tokens
+        ledger.output_tokens += call.response_tokens
 
     @computed_field  # Calcula el valor dinámicamente
     def total_total_tokens(self) -> int:
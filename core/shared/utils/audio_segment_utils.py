@@ -0,0 +1,223 @@
+import subprocess
+from bisect import bisect_right
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+
+
+def silences_from_pcm(
+    audio: np.ndarray,
+    sample_rate: int = SAMPLE_RATE,
+    noise_db: float = -35.0,
+    min_silence_seconds: float = 0.5,
+    frame_seconds: float = 0.03,
+    block_frames: int = 8192,
+) -> List[Tuple[float, float]]:
+    """Silence intervals of ``audio`` in seconds, like ffmpeg ``silencedetect``:
+    runs of frames quieter than ``noise_db`` lasting at least
+    ``min_silence_seconds``.
+
+    Frame energies are computed ``block_frames`` at a time so that a
+    memory-mapped buffer is never copied whole.
+    """
+    frame = max(1, int(frame_seconds * sample_rate))
+    count = len(audio) // frame
+    if count == 0:
+        return []
+    energy = np.empty(count, np.float32)
+    for first in range(0, count, block_frames):
+        last = min(count, first + block_frames)
+        frames = np.asarray(audio[first * frame : last * frame], np.float32)
+        energy[first:last] = np.mean(frames.reshape(last - first, frame) ** 2, axis=1)
+    quiet = 10 * np.log10(energy + 1e-10) < noise_db
+    starts, ends = _runs(quiet)
+    seconds = frame / sample_rate
+    keep = (ends - starts) * seconds >= min_silence_seconds
+    return [
+        (round(float(start * seconds), 3), round(float(end * seconds), 3))
+        for start, end in zip(starts[keep], ends[keep])
+    ]
+
+
+def plan_segments(
+    duration: float,
+    silences: List[Tuple[float, float]],
+    target_seconds: float,
+    max_seconds: Optional[float] = None,
+) -> List[Tuple[float, float]]:
+    """Split ``[0, duration)`` into segments of about ``target_seconds``.
+
+    Each cut is placed in the middle of the silence closest to the target
+    length, looking between half the target and ``max_seconds`` (twice the
+    target by default); without a silence in that window the cut is made at
+    the target length.
+    """
+    max_seconds = max_seconds or 2 * target_seconds
+    cuts = [(start + end) / 2 for start, end in silences]
+    segments: List[Tuple[float, float]] = []
+    start = 0.0
+    while duration - start > max_seconds:
+        candidates = [
+            cut
+            for cut in cuts
+            if start + target_seconds / 2 <= cut <= start + max_seconds
+        ]
+        cut = (
+            min(candidates, key=lambda c: abs(c - start - target_seconds))
+            if candidates
+            else start + target_seconds
+        )
+        segments.append((start, cut))
+        start = cut
+    segments.append((start, duration))
+    return segments
+
+
+def load_audio_range(
+    path: str, start: float = 0.0, end: Optional[float] = None
+) -> np.ndarray:
+    """Decode ``[start, end)`` seconds of ``path`` (all of it by default) as
+    16 kHz mono float32.
+
+    A ``.npy`` written by ``MediaDecodeService`` is already decoded: the range
+    is returned as a view of its memory map.
+    """
+    if path.endswith(".npy"):
+        first = int(start * SAMPLE_RATE)
+        last = int(end * SAMPLE_RATE) if end is not None else None
+        samples: np.ndarray = np.load(path, mmap_mode="c")
+        return samples[first:last]
+    window = ["-ss", f"{start:.3f}"] if start else []
+    if end is not None:
+        window += ["-t", f"{end - start:.3f}"]
+    result = subprocess.run(
+        [
+            "ffmpeg",
+            "-nostdin",
+            *window,
+            "-i",
+            path,
+            "-f",
+            "s16le",
+            "-ac",
+            "1",
+            "-ar",
+            str(SAMPLE_RATE),
+            "-",
+        ],
+        capture_output=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"ffmpeg no pudo decodificar {path}: "
+            f"{result.stderr.decode(errors='replace')[-300:].strip()}"
+        )
+    return np.frombuffer(result.stdout, np.int16).astype(np.float32) / 32768.0
+
+
+def _runs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Start and end (exclusive) indices of the runs of True in ``mask``."""
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+def speech_regions(
+    audio: np.ndarray,
+    sample_rate: int = SAMPLE_RATE,
+    frame_seconds: float = 0.03,
+    min_energy_db: float = -45.0,
+    floor_margin_db: float = 12.0,
+    min_band_ratio: float = 0.45,
+    min_speech_seconds: float = 0.25,
+    min_gap_seconds: float = 0.5,
+    pad_seconds: float = 0.2,
+    block_frames: int = 8192,
+) -> List[Tuple[float, float]]:
+    """Speech regions of ``audio`` in seconds.
+
+    A frame counts as speech when its energy is above both ``min_energy_db``
+    and the noise floor (10th percentile) plus ``floor_margin_db``, and at
+    least ``min_band_ratio`` of its spectral energy lies in the 300-3400 Hz
+    voice band, which rules out most music beds. Gaps shorter than
+    ``min_gap_seconds`` are bridged, runs shorter than ``min_speech_seconds``
+    dropped and the remaining regions padded by ``pad_seconds``.
+
+    Like ``silences_from_pcm``, frames are windowed and transformed
+    ``block_frames`` at a time; only the per-frame energy and band ratio of
+    the whole recording are kept.
+    """
+    frame = max(1, int(frame_seconds * sample_rate))
+    count = len(audio) // frame
+    if count == 0:
+        return []
+    window = np.hanning(frame).astype(np.float32)
+    freqs = np.fft.rfftfreq(frame, 1 / sample_rate)
+    voice_band = (freqs >= 300) & (freqs <= 3400)
+    energy_db = np.empty(count, np.float32)
+    band_ratio = np.empty(count, np.float32)
+    for first in range(0, count, block_frames):
+        last = min(count, first + block_frames)
+        frames = np.asarray(audio[first * frame : last * frame], np.float32).reshape(
+            last - first, frame
+        )
+        energy_db[first:last] = 10 * np.log10(np.mean(frames**2, axis=1) + 1e-10)
+        spectrum = np.abs(np.fft.rfft(frames * window, axis=1)) ** 2
+        band_ratio[first:last] = spectrum[:, voice_band].sum(axis=1) / (
+            spectrum.sum(axis=1) + 1e-10
+        )
+    threshold = max(
+        min_energy_db, float(np.percentile(energy_db, 10)) + floor_margin_db
+    )
+    speech = (energy_db > threshold) & (band_ratio >= min_band_ratio)
+
+    starts, ends = _runs(~speech)
+    short_gaps = (ends - starts) * frame_seconds < min_gap_seconds
+    interior = (starts > 0) & (ends < count)
+    for start, end in zip(starts[short_gaps & interior], ends[short_gaps & interior]):
+        speech[start:end] = True
+
+    duration = len(audio) / sample_rate
+    starts, ends = _runs(speech)
+    keep = (ends - starts) * frame_seconds >= min_speech_seconds
+    regions: List[Tuple[float, float]] = []
+    for start, end in zip(starts[keep] * frame_seconds, ends[keep] * frame_seconds):
+        start, end = max(0.0, start - pad_seconds), min(duration, end + pad_seconds)
+        if regions and start <= regions[-1][1]:
+            regions[-1] = (regions[-1][0], round(float(end), 3))
+        else:
+            regions.append((round(float(start), 3), round(float(end), 3)))
+    return regions
+
+
+def extract_speech(
+    audio: np.ndarray,
+    regions: List[Tuple[float, float]],
+    sample_rate: int = SAMPLE_RATE,
+) -> Tuple[np.ndarray, List[Tuple[float, float]]]:
+    """Concatenate ``regions`` of ``audio``.
+
+    Returns the speech-only audio and, for every region, its start in that
+    audio and in the original, as used by ``remap_timestamp``.
+    """
+    pieces = []
+    offsets: List[Tuple[float, float]] = []
+    position = 0
+    for start, end in regions:
+        piece = audio[int(start * sample_rate) : int(end * sample_rate)]
+        offsets.append((position / sample_rate, start))
+        pieces.append(piece)
+        position += len(piece)
+    speech = np.concatenate(pieces) if pieces else audio[:0]
+    return speech, offsets
+
+
+def remap_timestamp(seconds: float, offsets: List[Tuple[float, float]]) -> float:
+    """Map a time in the speech-only audio back to the original audio."""
+    if not offsets:
+        return seconds
+    index = max(0, bisect_right([c for c, _ in offsets], seconds) - 1)
+    concat_start, original_start = offsets[index]
+    return original_start + seconds - concat_start
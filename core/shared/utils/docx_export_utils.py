@@ -0,0 +1,172 @@
+from typing import Dict, List, Optional, Sequence
+
+from docx import Document
+from docx.document import Document as DocumentType
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.shared import Pt
+from docx.text.paragraph import Paragraph
+from markdown_it import MarkdownIt
+from markdown_it.token import Token
+
+_LIST_STYLES = {"bullet_list_open": "List Bullet", "ordered_list_open": "List Number"}
+
+
+def add_toc(doc: DocumentType) -> None:
+    doc.add_heading("Índice", level=1)
+    paragraph = doc.add_paragraph()
+    run = paragraph.add_run()
+    fld_char = OxmlElement("w:fldChar")
+    fld_char.set(qn("w:fldCharType"), "begin")
+    run._r.append(fld_char)
+    instr_text = OxmlElement("w:instrText")
+    instr_text.text = 'TOC \\o "1-3" \\h \\z \\u'
+    run._r.append(instr_text)
+    fld_char = OxmlElement("w:fldChar")
+    fld_char.set(qn("w:fldCharType"), "end")
+    run._r.append(fld_char)
+    doc.add_paragraph(
+        "Nota: Haga clic derecho en el índice y seleccione 'Actualizar campo' al abrir en Word."
+    )
+
+
+def _add_inline(paragraph: Paragraph, children: Optional[Sequence[Token]]) -> None:
+    bold = italic = False
+    for child in children or []:
+        if child.type == "strong_open":
+            bold = True
+        elif child.type == "strong_close":
+            bold = False
+        elif child.type == "em_open":
+            italic = True
+        elif child.type == "em_close":
+            italic = False
+        elif child.type in ("text", "code_inline", "image"):
+            run = paragraph.add_run(child.content)
+            run.bold = bold or None
+            run.italic = italic or None
+            if child.type == "code_inline":
+                run.font.name = "Courier New"
+        elif child.type == "softbreak":
+            paragraph.add_run(" ")
+        elif child.type == "hardbreak":
+            paragraph.add_run().add_break()
+
+
+class _ListState:
+    def __init__(self, style: str, start: int) -> None:
+        self.style = style
+        self.next_number = start
+        self.prefix = ""
+
+
+class _MarkdownDocxRenderer:
+    """Render the markdown-it token stream straight into a python-docx document."""
+
+    def __init__(self, doc: DocumentType) -> None:
+        self.doc = doc
+        self.style_ids: Dict[str, str] = {}
+        self.lists: List[_ListState] = []
+        self.table_rows: Optional[List[List[Token]]] = None
+        self.blockquote = 0
+
+    def _paragraph(self, style: Optional[str] = None) -> Paragraph:
+        paragraph = self.doc.add_paragraph()
+        if style is not None:
+            # python-docx resolves style names with a scan of styles.xml on every
+            # call; resolve each name once and set the id directly.
+            if style not in self.style_ids:
+                self.style_ids[style] = self.doc.styles[style].style_id
+            paragraph._p.style = self.style_ids[style]
+        return paragraph
+
+    def render(self, tokens: Sequence[Token]) -> None:
+        index = 0
+        while index < len(tokens):
+            index = self._render_token(tokens, index) + 1
+
+    def _render_token(self, tokens: Sequence[Token], index: int) -> int:
+        token = tokens[index]
+        if token.type == "heading_open":
+            heading = self._paragraph(f"Heading {min(int(token.tag[1]), 9)}")
+            _add_inline(heading, tokens[index + 1].children)
+            return index + 2
+        if token.type == "paragraph_open":
+            self._add_paragraph(tokens[index + 1])
+            return index + 2
+        if token.type in _LIST_STYLES:
+            start = int(token.attrs.get("start", 1) or 1)
+            self.lists.append(_ListState(_LIST_STYLES[token.type], start))
+        elif token.type in ("bullet_list_close", "ordered_list_close"):
+            self.lists.pop()
+        elif token.type == "list_item_open" and self.lists[-1].style == "List Number":
+            self.lists[-1].prefix = f"{self.lists[-1].next_number}. "
+            self.lists[-1].next_number += 1
+        elif token.type == "blockquote_open":
+            self.blockquote += 1
+        elif token.type == "blockquote_close":
+            self.blockquote -= 1
+        elif token.type in ("fence", "code_block"):
+            for line in token.content.rstrip("\n").split("\n"):
+                run = self._paragraph().add_run(line)
+                run.font.name = "Courier New"
+                run.font.size = Pt(9)
+        elif token.type == "table_open":
+            self.table_rows = []
+        elif token.type == "tr_open" and self.table_rows is not None:
+            self.table_rows.append([])
+        elif token.type == "inline" and self.table_rows:
+            self.table_rows[-1].append(token)
+        elif token.type == "table_close" and self.table_rows is not None:
+            self._add_table(self.table_rows)
+            self.table_rows = None
+        return index
+
+    def _add_paragraph(self, inline: Token) -> None:
+        if self.lists:
+            current = self.lists[-1]
+            depth = len(self.lists)
+            style = current.style if depth == 1 else f"{current.style} {min(depth, 3)}"
+            paragraph = self._paragraph(style)
+            if current.prefix:
+                # Same visible numbering as the previous HTML-based export.
+                paragraph.add_run(current.prefix)
+                current.prefix = ""
+        elif self.blockquote:
+            paragraph = self._paragraph("Quote")
+        else:
+            paragraph = self._paragraph()
+        _add_inline(paragraph, inline.children)
+
+    def _add_table(self, rows: List[List[Token]]) -> None:
+        if not rows:
+            return
+        columns = max(len(row) for row in rows)
+        table = self.doc.add_table(rows=len(rows), cols=columns)
+        table.style = "Table Grid"
+        for row_index, row in enumerate(rows):
+            for column, inline in enumerate(row):
+                cell = table.cell(row_index, column)
+                _add_inline(cell.paragraphs[0], inline.children)
+                if row_index == 0:
+                    for run in cell.paragraphs[0].runs:
+                        run.bold = True
+
+
+def render_markdown_to_docx(md_path: str, docx_path: str) -> str:
+    """Render the Markdown file ``md_path`` as a DOCX with a table of contents.
+
+    The Markdown is parsed once into markdown-it tokens which are written
+    directly with python-docx, without an HTML round trip. Runs inside
+    process-pool workers, so it reads and writes the files itself.
+    """
+    with open(md_path, "r", encoding="utf-8") as f:
+        md_content = f.read()
+
+    doc = Document()
+    add_toc(doc)
+    doc.add_page_break()
+    tokens = MarkdownIt("commonmark").enable("table").parse(md_content)
+    _MarkdownDocxRenderer(doc).render(tokens)
+    doc.save(docx_path)
+    return docx_path
@@ -0,0 +1,107 @@
+import re
+import zipfile
+from typing import Iterable, Iterator, List
+from xml.etree.ElementTree import Element, iterparse
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_PARAGRAPH = f"{_W}p"
+_TABLE = f"{_W}tbl"
+_TABLE_ROW = f"{_W}tr"
+_TABLE_CELL = f"{_W}tc"
+_HEADING_STYLE = re.compile(r"^(?:heading|t[ií]?tulo)\s*(\d)$", re.IGNORECASE)
+
+
+def _paragraph_text(paragraph: Element) -> str:
+    parts = []
+    for element in paragraph.iter():
+        if element.tag == f"{_W}t":
+            parts.append(element.text or "")
+        elif element.tag == f"{_W}tab":
+            parts.append("\t")
+        elif element.tag in (f"{_W}br", f"{_W}cr"):
+            parts.append("\n")
+    return "".join(parts).strip()
+
+
+def _heading_level(paragraph: Element) -> int:
+    properties = paragraph.find(f"{_W}pPr")
+    if properties is None:
+        return 0
+    outline = properties.find(f"{_W}outlineLvl")
+    if outline is not None:
+        level = int(outline.get(f"{_W}val", "9"))
+        return level + 1 if level < 9 else 0
+    style = properties.find(f"{_W}pStyle")
+    value = style.get(f"{_W}val", "") if style is not None else ""
+    if value.lower() == "title":
+        return 1
+    match = _HEADING_STYLE.match(value)
+    return int(match.group(1)) if match else 0
+
+
+def _row_text(row: Element) -> str:
+    cells = [
+        " ".join(
+            text for text in (_paragraph_text(p) for p in cell.iter(_PARAGRAPH)) if text
+        )
+        for cell in row.findall(_TABLE_CELL)
+    ]
+    return " | ".join(cells) if any(cells) else ""
+
+
+def iter_docx_blocks(path: str) -> Iterator[str]:
+    """Yield the paragraphs, headings and table rows of a DOCX in document order.
+
+    ``word/document.xml`` is parsed incrementally straight from the archive and
+    every finished block is dropped from the tree, so memory does not grow with
+    the document. Headings are prefixed with ``#`` per level and table rows are
+    emitted as ``cell | cell``.
+    """
+    with zipfile.ZipFile(path) as archive, archive.open("word/document.xml") as xml:
+        stack: List[Element] = []
+        paragraph_depth = 0
+        table_depth = 0
+        for event, element in iterparse(xml, events=("start", "end")):
+            if event == "start":
+                stack.append(element)
+                if element.tag == _PARAGRAPH:
+                    paragraph_depth += 1
+                elif element.tag == _TABLE:
+                    table_depth += 1
+                continue
+
+            stack.pop()
+            text = ""
+            if element.tag == _PARAGRAPH:
+                paragraph_depth -= 1
+                if not paragraph_depth and not table_depth:
+                    text = _paragraph_text(element)
+                    level = _heading_level(element)
+                    if text and level:
+                        text = f"{'#' * min(level, 6)} {text}"
+            elif element.tag == _TABLE_ROW and table_depth == 1:
+                text = _row_text(element)
+                element.clear()
+            elif element.tag == _TABLE:
+                table_depth -= 1
+
+            # Body children are complete once closed; detach them from the tree.
+            if len(stack) == 2:
+                stack[-1].remove(element)
+            if text:
+                yield text
+
+
+def batch_blocks(blocks: Iterable[str], max_chars: int) -> Iterator[str]:
+    """Join consecutive blocks with newlines into pieces of about ``max_chars``."""
+    batch: List[str] = []
+    size = 0
+    for block in blocks:
+        batch.append(block)
+        size += len(block) + 1
+        if size >= max_chars:
+            yield "\n".join(batch)
+            batch = []
+            size = 0
+    if batch:
+        yield "\n".join(batch)
@@ -0,0 +1,125 @@
+import gzip
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Generic, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+_KEY = re.compile(r"^[0-9a-f]{64}$")
+_ENTRY_SUFFIX = ".json.gz"
+
+
+class GzipEntryWriter:
+    """An entry of a ``GzipJsonStore`` written piece by piece.
+
+    Data goes to a temporary file next to the entry; ``commit`` publishes it
+    atomically and ``discard`` removes it. Blocking, like the store.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        self.path = path
+        self._tmp_path = Path(tmp_path)
+        self._raw: BinaryIO = os.fdopen(fd, "wb")
+        self._gzip = gzip.GzipFile(fileobj=self._raw, mode="wb", compresslevel=6)
+
+    def write(self, data: bytes) -> None:
+        self._gzip.write(data)
+
+    def _close(self) -> None:
+        self._gzip.close()
+        self._raw.close()
+
+    def commit(self) -> None:
+        try:
+            self._close()
+            os.replace(self._tmp_path, self.path)
+        except BaseException:
+            self._tmp_path.unlink(missing_ok=True)
+            raise
+
+    def discard(self) -> None:
+        try:
+            self._close()
+        finally:
+            self._tmp_path.unlink(missing_ok=True)
+
+
+class GzipJsonStore(Generic[M]):
+    """Directory of gzip-compressed JSON entries keyed by SHA-256 hex digests.
+
+    Entries live at ``root/<key[:2]>/<key>.json.gz`` and are written
+    atomically. Reads refresh the entry's modification time so ``evict`` can
+    drop the least recently used entries once the store exceeds a size cap.
+    Blocking; callers run it in a thread.
+    """
+
+    def __init__(self, root: Path, model: Type[M]) -> None:
+        self.root = root
+        self.model = model
+
+    @staticmethod
+    def is_key(key: Optional[str]) -> bool:
+        return bool(_KEY.match(key or ""))
+
+    def path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}{_ENTRY_SUFFIX}"
+
+    def read(self, key: str) -> Optional[M]:
+        path = self.path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = self.model.model_validate_json(f.read())
+            os.utime(path)
+            return entry
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValidationError) as e:
+            logger.warning("Discarding unreadable cache entry %s: %s", path, e)
+            path.unlink(missing_ok=True)
+            return None
+
+    def write(self, key: str, entry: M) -> None:
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(
+                fileobj=raw, mode="wb", compresslevel=6
+            ) as f:
+                f.write(entry.model_dump_json().encode("utf-8"))
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def writer(self, key: str) -> GzipEntryWriter:
+        """Write the serialized entry for ``key`` incrementally."""
+        return GzipEntryWriter(self.path(key))
+
+    def delete(self, key: str) -> None:
+        self.path(key).unlink(missing_ok=True)
+
+    def evict(self, max_bytes: int) -> None:
+        entries: List[Tuple[float, int, Path]] = []
+        for path in self.root.glob(f"*/*{_ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            logger.debug("Evicted cache entry %s", path.name)
@@ -0,0 +1,108 @@
+import atexit
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+DEFAULT_LOG_FORMAT = "%(asctime)s | %(name)s | %(levelname)s | %(message)s"
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+# PID of the process whose thread runs ``_listener``. A forked child (e.g. a
+# Celery prefork worker) inherits the listener object but not its thread.
+_listener_pid: Optional[int] = None
+
+
+def _parse_level(value: str, default: int = logging.INFO) -> int:
+    level = logging.getLevelName(value.strip().upper())
+    return level if isinstance(level, int) else default
+
+
+def _parse_logger_levels(spec: str) -> Dict[str, int]:
+    """Parse ``LOG_LEVELS`` entries such as ``core.brevio=DEBUG,httpx=WARNING``."""
+    levels: Dict[str, int] = {}
+    for entry in spec.split(","):
+        name, sep, value = entry.partition("=")
+        if sep and name.strip():
+            levels[name.strip()] = _parse_level(value)
+    return levels
+
+
+def configure_logging(
+    level: Optional[str] = None, fmt: str = DEFAULT_LOG_FORMAT
+) -> None:
+    """Configure the root logger once for the whole process.
+
+    Records are pushed onto an in-memory queue by a ``QueueHandler`` and written
+    by a background ``QueueListener``, so emitting a log line never blocks the
+    event loop on stream I/O. Modules must only call ``logging.getLogger`` and
+    never attach handlers or force levels themselves. Forked children (Celery
+    prefork workers) get their own listener thread.
+    """
+    root = logging.getLogger()
+    root.setLevel(_parse_level(level or os.getenv("LOG_LEVEL") or "INFO"))
+    for name, logger_level in _parse_logger_levels(os.getenv("LOG_LEVELS", "")).items():
+        logging.getLogger(name).setLevel(logger_level)
+
+    if _listener is not None and _listener_pid == os.getpid():
+        return
+
+    if _listener is not None:
+        # Inherited through fork: keep the handlers, replace the dead thread.
+        _start_listener(*_listener.handlers)
+        return
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(fmt))
+    _start_listener(stream_handler)
+    atexit.register(shutdown_logging)
+
+
+def _start_listener(*handlers: logging.Handler) -> None:
+    global _listener, _queue_handler, _listener_pid
+
+    root = logging.getLogger()
+    if _queue_handler is not None:
+        root.removeHandler(_queue_handler)
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _queue_handler = QueueHandler(log_queue)
+    root.addHandler(_queue_handler)
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    _listener_pid = os.getpid()
+
+
+def _restart_listener_after_fork() -> None:
+    if _listener is not None and _listener_pid != os.getpid():
+        _start_listener(*_listener.handlers)
+
+
+os.register_at_fork(after_in_child=_restart_listener_after_fork)
+
+
+def shutdown_logging() -> None:
+    """Flush pending records and stop the background listener."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+DEBUG_SAMPLE_EVERY = max(1, int(os.getenv("LOG_DEBUG_SAMPLE_EVERY", 10)))
+
+
+def should_sample(
+    logger: logging.Logger,
+    index: int,
+    every: int = DEBUG_SAMPLE_EVERY,
+    level: int = logging.DEBUG,
+) -> bool:
+    """Return True when a per-item event at ``index`` should be logged.
+
+    Used for per-chunk diagnostics: only one in ``every`` events is emitted and
+    nothing is computed at all when ``level`` is disabled for ``logger``.
+    """
+    return index % every == 0 and logger.isEnabledFor(level)
@@ -10,10 +10,6 @@ from core.shared.config.model_mapper_tiktoken import VALID_MODELS
 from core.shared.enums.model import ModelType
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
-handler = logging.StreamHandler()
-handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
-logger.addHandler(handler)
 
 
 def is_deepseek(model: ModelType) -> bool:
@@ -21,6 +17,12 @@ def is_deepseek(model: ModelType) -> bool:
     return model == ModelType.DEEPSEEK_CHAT
 
 
+def encoder_name(encoder: Union[tiktoken.Encoding, PreTrainedTokenizerFast]) -> str:
+    """Stable identifier of a tokenizer, used to key cached token counts."""
+    name = getattr(encoder, "name", None) or getattr(encoder, "name_or_path", None)
+    return str(name or type(encoder).__name__)
+
+
 def get_encoder(
     model_type: ModelType,
 ) -> Union[tiktoken.Encoding, PreTrainedTokenizerFast]:
@@ -31,7 +33,7 @@ def get_encoder(
 
             return cast(PreTrainedTokenizerFast, auto_tokenizer)
         except Exception as e:
-            logger.error(f"Failed to load DeepSeek tokenizer: {e}")
+            logger.error("Failed to load DeepSeek tokenizer: %s", e)
             raise RuntimeError(f"Could not load tokenizer for {model_type}: {e}")
 
     mapping = (
@@ -46,6 +48,6 @@ def get_encoder(
         return encoder
     except KeyError:
         logger.warning(
-            f"Encoding {encoding_name} not found, falling back to cl100k_base"
+            "Encoding %s not found, falling back to cl100k_base", encoding_name
         )
         return tiktoken.get_encoding("cl100k_base")
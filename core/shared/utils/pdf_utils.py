@@ -0,0 +1,42 @@
+import logging
+import re
+from typing import Iterator, List
+
+import pypdf
+
+logger = logging.getLogger(__name__)
+
+_BLANK_LINES = re.compile(r"\n+")
+
+
+def clean_page_text(text: str) -> str:
+    return _BLANK_LINES.sub("\n", text.strip())
+
+
+def count_pdf_pages(path: str) -> int:
+    return len(pypdf.PdfReader(path).pages)
+
+
+def iter_pdf_pages(path: str) -> Iterator[str]:
+    """Yield the cleaned text of every non-empty page of ``path`` in order."""
+    reader = pypdf.PdfReader(path)
+    logger.info("PDF tiene %s páginas", len(reader.pages))
+    for page in reader.pages:
+        text = clean_page_text(page.extract_text() or "")
+        if text:
+            yield text
+
+
+def extract_pdf_page_range(path: str, start: int, end: int) -> List[str]:
+    """Extract and clean pages ``[start, end)`` of ``path``, skipping empty ones.
+
+    Runs inside process-pool workers, so it opens the file on its own and only
+    depends on this lightweight module.
+    """
+    reader = pypdf.PdfReader(path)
+    texts = []
+    for index in range(start, min(end, len(reader.pages))):
+        text = clean_page_text(reader.pages[index].extract_text() or "")
+        if text:
+            texts.append(text)
+    return texts
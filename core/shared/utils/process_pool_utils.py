@@ -0,0 +1,50 @@
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_process_pools: Dict[str, Tuple[ProcessPoolExecutor, int]] = {}
+
+
+def available_cpus() -> int:
+    """Number of cores this process may run on (respects CPU affinity)."""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return max(1, os.cpu_count() or 1)
+
+
+def available_memory_bytes() -> Optional[int]:
+    """Physical memory not in use right now, or None where it is unknown."""
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def get_process_pool(name: str, workers: int) -> Optional[ProcessPoolExecutor]:
+    """Shared process pool ``name``, recreated if ``workers`` changes.
+
+    Returns None when worker processes cannot be started here (for example in
+    a daemonic process), in which case the work falls back to a thread.
+    """
+    current = _process_pools.get(name)
+    if current is not None and current[1] == workers:
+        return current[0]
+    if current is not None:
+        current[0].shutdown(wait=False, cancel_futures=True)
+        del _process_pools[name]
+    if multiprocessing.current_process().daemon:
+        logger.warning("Process pool %s unavailable: daemon process", name)
+        return None
+    try:
+        pool = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    except (OSError, ValueError, AssertionError) as e:
+        logger.warning("Process pool %s unavailable: %s", name, e)
+        return None
+    _process_pools[name] = (pool, workers)
+    return pool
@@ -0,0 +1,100 @@
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SharedTTLCache:
+    """JSON values with a time to live, kept in Redis when ``url`` is set.
+
+    Redis lets the API and the Celery workers see the same entries. Without a
+    URL, without the ``redis`` package or while Redis is unreachable, entries
+    live in a bounded in-process LRU instead and Redis is retried after
+    ``retry_seconds``. Blocking; callers run it in a thread.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        url: Optional[str] = None,
+        max_entries: int = 2048,
+        retry_seconds: float = 30.0,
+    ) -> None:
+        self.namespace = namespace
+        self.url = url
+        self.max_entries = max_entries
+        self.retry_seconds = retry_seconds
+        self._local: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis: Any = None
+        self._redis_down_until = 0.0
+
+    def _client(self) -> Any:
+        if not self.url or time.monotonic() < self._redis_down_until:
+            return None
+        if self._redis is None:
+            try:
+                import redis
+            except ImportError:
+                logger.warning(
+                    "redis is not installed, caching %s locally", self.namespace
+                )
+                self.url = None
+                return None
+            self._redis = redis.Redis.from_url(
+                self.url, socket_timeout=1.0, socket_connect_timeout=1.0
+            )
+        return self._redis
+
+    def _redis_failed(self, error: Exception) -> None:
+        logger.warning(
+            "Redis unavailable for %s, caching locally for %.0f s: %s",
+            self.namespace,
+            self.retry_seconds,
+            error,
+        )
+        self._redis_down_until = time.monotonic() + self.retry_seconds
+
+    def get(self, key: str) -> Optional[Any]:
+        key = f"{self.namespace}:{key}"
+        client = self._client()
+        if client is not None:
+            try:
+                raw = client.get(key)
+                return json.loads(raw) if raw is not None else None
+            except Exception as e:
+                self._redis_failed(e)
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+            return json.loads(entry[1])
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        key = f"{self.namespace}:{key}"
+        raw = json.dumps(value)
+        client = self._client()
+        if client is not None:
+            try:
+                client.set(key, raw, ex=max(1, int(ttl_seconds)))
+                return
+            except Exception as e:
+                self._redis_failed(e)
+        with self._lock:
+            self._local[key] = (time.monotonic() + ttl_seconds, raw)
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_entries:
+                self._local.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop the in-process entries (Redis entries expire on their own)."""
+        with self._lock:
+            self._local.clear()